@@ -3,6 +3,7 @@ Uses PWM on GPIO26 with enable pin GPIO4 (low=on)
 """
 import machine
 import time
+import uasyncio as asyncio
 
 _pwm = None
 _en = None
@@ -92,3 +93,47 @@ def alert_tone():
     time.sleep_ms(50)
     _tone(880, 150)
     disable()
+
+
+# uasyncio variants: same sounds, but the waits yield to other tasks
+
+async def _tone_async(freq, duration_ms):
+    global _pwm
+    if freq <= 0:
+        await asyncio.sleep_ms(duration_ms)
+        return
+    _pwm = machine.PWM(machine.Pin(26), freq=freq, duty=512)
+    await asyncio.sleep_ms(duration_ms)
+    _pwm.deinit()
+    _pwm = None
+
+
+async def _enable_async():
+    _init_hw()
+    _en.value(0)
+    await asyncio.sleep_ms(20)
+
+
+async def play_notes_async(notes, bpm=120):
+    beat_ms = int(60000 / bpm)
+    await _enable_async()
+    for note, beats in notes:
+        freq = _NOTES.get(note, 0)
+        if freq > 0:
+            await _tone_async(freq, int(beat_ms * beats * 0.85))
+        await asyncio.sleep_ms(int(beat_ms * beats * 0.15))
+    disable()
+
+
+async def beep_async(freq=1000, ms=100):
+    await _enable_async()
+    await _tone_async(freq, ms)
+    disable()
+
+
+async def alert_tone_async():
+    await _enable_async()
+    await _tone_async(880, 150)
+    await asyncio.sleep_ms(50)
+    await _tone_async(880, 150)
+    disable()
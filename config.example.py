@@ -19,3 +19,28 @@ I2C_FREQUENCY = 100000
 
 # Timezone offset from UTC (e.g., US Eastern = -5)
 TIMEZONE_OFFSET = -5
+
+# Fast boot: connect WiFi in the background, skip boot pauses and show the
+# dashboard at the first sensor reading (boot timeline goes to /sd/boot.log)
+FAST_BOOT = False
+
+# Power policy: "auto" picks from the battery voltage (USB: 5 s readings,
+# battery: SCD4x low-power 30 s, low battery: single-shot every 2 min).
+# "usb", "battery" or "low" pins one profile.
+POWER_MODE = "auto"
+
+# GPIO that reads high while USB power is present (VBUS divider or charger
+# status). None: USB is inferred from the battery voltage trend.
+USB_SENSE_PIN = None
+
+# MPL3115A2 oversampling (1, 2, 4 ... 128): higher is less noisy but slower
+# (6 ms at 1, 512 ms at 128). Conversions run between readings either way.
+PRESSURE_OVERSAMPLE = 128
+
+# Per-function display timing in the [Display] stats line (debug; adds
+# overhead to every drawing call)
+DISPLAY_TIMING = False
+
+# Compose dashboard cards off-screen and push each in one SPI window
+# (keeps a ~24 KB sprite buffer allocated)
+COMPOSITE_CARDS = False
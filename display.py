@@ -4,8 +4,18 @@ ST7796S Display Driver + Dashboard UI for E32R40T/E32N40T
 """
 from machine import Pin, SPI
 import time
+from collections import OrderedDict
+import font16
+import layout
+import rle565
+import spibus
 from font16 import FONT16
 
+try:
+    import framebuf
+except ImportError:
+    framebuf = None
+
 # --- Hardware pins ---
 cs = Pin(15, Pin.OUT, value=1)
 dc = Pin(2, Pin.OUT, value=0)
@@ -13,9 +23,11 @@ bl = Pin(27, Pin.OUT, value=1)
 
 spi = SPI(1, baudrate=20000000, polarity=0, phase=0,
           sck=Pin(14), mosi=Pin(13), miso=Pin(12))
+# SPI1 is shared with the XPT2046 touch controller (touch.py)
+bus = spibus.SPIBus(spi, 20000000)
 
-W = 480
-H = 320
+W = layout.SCREEN_W
+H = layout.SCREEN_H
 
 # --- Colors (RGB565) ---
 BLACK   = 0x0000
@@ -34,22 +46,164 @@ CARD_BG  = 0x2945
 CARD_BRD = 0x4A69
 
 
+# --- Rendering statistics ---
+# Counters are always on and cost an integer add per primitive:
+# _counts[0] primitives drawn, [1] address windows set, [2] SPI bytes.
+# Per-function timing costs nothing until enable_timing() wraps the
+# public drawing functions.
+
+_counts = [0, 0, 0]
+_times = {}
+_calls = {}
+_untimed = {}
+_TIMED = ('fill_rect', 'fill_screen', 'hline', 'vline', 'round_rect',
+          'set_window', 'draw_char16', 'draw_text', 'draw_card',
+          'draw_dashboard', 'boot_progress', 'boot_title', 'show_logo',
+          'blit_file')
+
+
+def _timed(name, fn):
+    def timed(*args, **kw):
+        t0 = time.ticks_us()
+        try:
+            return fn(*args, **kw)
+        finally:
+            _times[name] = _times.get(name, 0) + time.ticks_diff(time.ticks_us(), t0)
+            _calls[name] = _calls.get(name, 0) + 1
+    return timed
+
+
+def enable_timing(on=True):
+    """Accumulate ticks_us per public drawing function (nested calls are
+    included in their caller's time too). Off by default."""
+    g = globals()
+    if on and not _untimed:
+        for name in _TIMED:
+            _untimed[name] = g[name]
+            g[name] = _timed(name, g[name])
+    elif not on and _untimed:
+        for name in _untimed:
+            g[name] = _untimed[name]
+        _untimed.clear()
+
+
+def stats():
+    """Snapshot of rendering counters since the last reset_stats()"""
+    return {'prims': _counts[0], 'windows': _counts[1], 'bytes': _counts[2],
+            'us': dict(_times), 'calls': dict(_calls),
+            'glyph_hits': _glyph_hits, 'glyph_misses': _glyph_misses,
+            'fills': _fill_count, 'fill_allocs': _fill_allocs,
+            'fill_views': _fill_views,
+            'trim_saved': _frame_trim_saved}
+
+
+def reset_stats():
+    """Zero every counter stats() reports (plus glyph evictions and fill
+    pattern refills, so glyph_cache_stats()/fill_stats() share the epoch)"""
+    global _glyph_hits, _glyph_misses, _glyph_evictions
+    global _fill_count, _fill_allocs, _fill_refills, _fill_views
+    global _frame_trim_saved
+    _counts[0] = _counts[1] = _counts[2] = 0
+    _times.clear()
+    _calls.clear()
+    _glyph_hits = _glyph_misses = _glyph_evictions = 0
+    _fill_count = _fill_allocs = _fill_refills = _fill_views = 0
+    _frame_trim_saved = 0
+
+
+def stats_line():
+    """One-line summary for per-cycle logging"""
+    line = "prims={} win={} spi={}B glyph={}/{}".format(
+        _counts[0], _counts[1], _counts[2], _glyph_hits,
+        _glyph_hits + _glyph_misses)
+    for name in ('draw_dashboard', 'draw_card', 'draw_text', 'fill_rect'):
+        if name in _times:
+            line += " {}={}us".format(name, _times[name])
+    return line
+
+
 # --- Low-level SPI commands ---
+# Command and parameter bytes go through preallocated buffers, and a
+# transaction keeps CS asserted across a whole command/data sequence,
+# so a primitive costs one CS cycle and no allocation for its setup.
 
-def cmd(c):
-    cs.value(0)
-    dc.value(0)
-    spi.write(bytes([c]))
-    cs.value(1)
+_cmd_buf = bytearray(1)
+_par_buf = bytearray(4)
+_par_mv = memoryview(_par_buf)
 
+# Last column/row range sent with CASET/RASET; -1 = unknown
+_win = [-1, -1, -1, -1]
 
-def cmd_data(c, d):
-    cs.value(0)
+
+# The display's session on the shared SPI bus. Re-entrant: nested
+# transactions (e.g. draw_text inside a card) share the outer one.
+_tx = bus.device(cs, 20000000)
+
+
+def transaction():
+    """Context manager keeping CS asserted: with display.transaction(): ..."""
+    return _tx
+
+
+def _command(c):
+    """Send a command byte; leaves DC low. Call inside a transaction."""
+    _cmd_buf[0] = c
     dc.value(0)
-    spi.write(bytes([c]))
+    spi.write(_cmd_buf)
+    _counts[2] += 1
+
+
+def _window(x0, y0, x1, y1):
+    """Point RAMWR at a window and leave DC high for pixel data.
+    CASET/RASET are skipped when the range is already set.
+    Call inside a transaction."""
+    w = _win
+    if w[0] != x0 or w[2] != x1:
+        _command(0x2A)
+        _par_buf[0] = x0 >> 8; _par_buf[1] = x0 & 0xFF
+        _par_buf[2] = x1 >> 8; _par_buf[3] = x1 & 0xFF
+        dc.value(1)
+        spi.write(_par_buf)
+        _counts[2] += 4
+        w[0] = x0; w[2] = x1
+    if w[1] != y0 or w[3] != y1:
+        _command(0x2B)
+        _par_buf[0] = y0 >> 8; _par_buf[1] = y0 & 0xFF
+        _par_buf[2] = y1 >> 8; _par_buf[3] = y1 & 0xFF
+        dc.value(1)
+        spi.write(_par_buf)
+        _counts[2] += 4
+        w[1] = y0; w[3] = y1
+    _command(0x2C)
     dc.value(1)
-    spi.write(bytes(d) if isinstance(d, list) else bytes([d]))
-    cs.value(1)
+    _counts[1] += 1
+
+
+def _forget_window():
+    _win[0] = _win[1] = _win[2] = _win[3] = -1
+
+
+def cmd(c):
+    with _tx:
+        _command(c)
+
+
+def cmd_data(c, d):
+    if c == 0x2A or c == 0x2B:
+        _forget_window()
+    with _tx:
+        _command(c)
+        dc.value(1)
+        if isinstance(d, int):
+            _par_buf[0] = d
+            spi.write(_par_mv[:1])
+        elif len(d) <= 4:
+            for i in range(len(d)):
+                _par_buf[i] = d[i]
+            spi.write(_par_mv[:len(d)])
+        else:
+            spi.write(bytes(d))
+        _counts[2] += 1 if isinstance(d, int) else len(d)
 
 
 # --- Display init ---
@@ -57,6 +211,7 @@ def cmd_data(c, d):
 def init():
     """Initialize ST7796S in landscape mode"""
     bl.value(1)
+    _forget_window()
     cmd(0x01); time.sleep_ms(200)
     cmd(0x11); time.sleep_ms(200)
     cmd_data(0xF0, [0xC3])
@@ -86,59 +241,177 @@ def backlight(on=True):
 # --- Drawing primitives ---
 
 def set_window(x0, y0, x1, y1):
-    cmd_data(0x2A, [x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
-    cmd_data(0x2B, [y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
-    cmd(0x2C)
+    with _tx:
+        _window(x0, y0, x1, y1)
+
+
+# Preallocated solid-color patterns for fill_rect, in FILL_CACHE_SIZE
+# fixed slots found by a linear scan of their colors. When every slot is
+# taken the least recently used one is refilled with the new color
+# instead of allocating another buffer. A lookup allocates nothing; a
+# fill whose size is not a multiple of the pattern still makes one
+# memoryview for its tail (counted in fill_stats()['tail_views']).
+_FILL_PX = 640
+FILL_CACHE_SIZE = 6
+
+_fill_colors = [-1] * FILL_CACHE_SIZE
+_fill_pats = [None] * FILL_CACHE_SIZE
+_fill_used = [0] * FILL_CACHE_SIZE
+_fill_tick = 0
+_fill_count = 0
+_fill_allocs = 0
+_fill_refills = 0
+_fill_views = 0
+
+
+def _fill_pattern(color):
+    global _fill_allocs, _fill_refills, _fill_tick
+    _fill_tick += 1
+    lru = 0
+    for i in range(FILL_CACHE_SIZE):
+        if _fill_colors[i] == color:
+            _fill_used[i] = _fill_tick
+            return _fill_pats[i]
+        if _fill_used[i] < _fill_used[lru]:
+            lru = i
+    pat = _fill_pats[lru]
+    if pat is None:
+        pat = _fill_pats[lru] = memoryview(bytearray(_FILL_PX * 2))
+        _fill_allocs += 1
+    else:
+        _fill_refills += 1
+    _fill_colors[lru] = color
+    _fill_used[lru] = _fill_tick
+    pat[0] = color >> 8
+    pat[1] = color & 0xFF
+    # Double the filled prefix until the pattern is full
+    n = 2
+    size = len(pat)
+    while n < size:
+        m = min(n, size - n)
+        pat[n:n + m] = pat[0:m]
+        n += m
+    return pat
+
+
+def fill_stats():
+    """fill_rect counters: fills drawn, pattern buffers allocated/refilled,
+    tail memoryviews made"""
+    return {'fills': _fill_count, 'pattern_allocs': _fill_allocs,
+            'pattern_refills': _fill_refills, 'tail_views': _fill_views,
+            'patterns': FILL_CACHE_SIZE - _fill_colors.count(-1)}
 
 
 def fill_rect(x, y, w, h, color):
+    global _fill_count, _fill_views
     x = max(0, x); y = max(0, y)
     x2 = min(W - 1, x + w - 1); y2 = min(H - 1, y + h - 1)
     rw = x2 - x + 1; rh = y2 - y + 1
     if rw <= 0 or rh <= 0:
         return
-    set_window(x, y, x2, y2)
-    hi = color >> 8; lo = color & 0xFF
-    chunk = bytes([hi, lo] * min(rw * rh, 640))
+    _fill_count += 1
+    _counts[0] += 1
+    _counts[2] += rw * rh * 2
+    pat = _fill_pattern(color)
     total = rw * rh
-    cs.value(0); dc.value(1)
-    while total > 0:
-        n = min(total, 640)
-        if n == 640:
-            spi.write(chunk)
-        else:
-            spi.write(bytes([hi, lo] * n))
-        total -= n
-    cs.value(1)
+    with _tx:
+        _window(x, y, x2, y2)
+        while total >= _FILL_PX:
+            spi.write(pat)
+            total -= _FILL_PX
+        if total:
+            _fill_views += 1
+            spi.write(pat[:total * 2])
 
 
 def fill_screen(color):
     fill_rect(0, 0, W, H, color)
+    invalidate()
 
 
-def show_logo(filename="logo.bin"):
-    """Display RGB565 logo from binary file, centered on screen with line-by-line reveal"""
-    import struct
-    try:
-        f = open(filename, 'rb')
-        hdr = f.read(4)
-        iw, ih = struct.unpack('>HH', hdr)
-        x0 = (W - iw) // 2
-        y0 = (H - ih) // 2
-        fill_screen(WHITE)
-        # Reveal line by line for a cool wipe effect
-        row_bytes = iw * 2
-        for row in range(ih):
-            set_window(x0, y0 + row, x0 + iw - 1, y0 + row)
-            data = f.read(row_bytes)
-            if not data:
+# One preallocated pixel chunk for streaming images from files. spi.write
+# blocks until the chunk has been clocked out, so a second buffer would
+# have nothing to overlap with: the next readinto() can only start after it.
+_IMG_CHUNK = 2560
+_img_buf = None
+
+
+def _img_buffer():
+    global _img_buf
+    if _img_buf is None:
+        _img_buf = memoryview(bytearray(_IMG_CHUNK))
+    return _img_buf
+
+
+def _stream_window(src, x, y, w, h, reveal=False):
+    """Stream a w x h RGB565 image from src.readinto to the panel.
+    One address window and one CS assertion cover the whole transfer;
+    reveal=True instead pushes row by row, each in its own window, for
+    the visible top-down wipe. Returns False, drawing nothing, if the
+    image does not fit on the panel at (x, y)."""
+    if w <= 0 or h <= 0 or x < 0 or y < 0 or x + w > W or y + h > H:
+        print("[Display] Image {}x{} at {},{} is off the panel".format(w, h, x, y))
+        return False
+    buf = _img_buffer()
+    row_bytes = w * 2
+    if reveal and row_bytes <= _IMG_CHUNK:
+        row = buf[:row_bytes]
+        for r in range(h):
+            if src.readinto(row) != row_bytes:
                 break
-            cs.value(0)
-            dc.value(1)
-            spi.write(data)
-            cs.value(1)
-        f.close()
+            with _tx:
+                _window(x, y + r, x + w - 1, y + r)
+                spi.write(row)
+            _counts[0] += 1
+            _counts[2] += row_bytes
         return True
+    total = w * h * 2
+    _counts[0] += 1
+    with _tx:
+        _window(x, y, x + w - 1, y + h - 1)
+        while total > 0:
+            # Full chunks go out through the one view; only a short
+            # final chunk (or a short read) needs a slice
+            n = src.readinto(buf if total >= _IMG_CHUNK else buf[:total])
+            if not n:
+                break
+            spi.write(buf if n == _IMG_CHUNK else buf[:n])
+            _counts[2] += n
+            total -= n
+    return True
+
+
+def blit_file(path, x, y, w, h, offset=0, reveal=False):
+    """Draw a raw big-endian RGB565 image from a file (flash or /sd)
+    without loading it into RAM. offset skips a header. Returns True
+    on success, False if the file could not be read or the image does
+    not fit on the panel."""
+    try:
+        with open(path, 'rb') as f:
+            if offset:
+                f.seek(offset)
+            return _stream_window(f, x, y, w, h, reveal)
+    except OSError as e:
+        print("[Display] Blit error:", path, e)
+        return False
+
+
+def show_logo(filename="logo.bin", reveal=False):
+    """Display logo centered on screen.
+    Accepts RLE565 images (see rle565.py) or raw RGB565 with a 4-byte
+    width/height header. reveal=True draws it line by line as a wipe."""
+    import struct
+    try:
+        with open(filename, 'rb') as f:
+            hdr = f.read(4)
+            if hdr == rle565.MAGIC:
+                f.seek(0)
+                iw, ih, src = rle565.open_image(f)
+            else:
+                iw, ih = struct.unpack('>HH', hdr)
+                src = f
+            fill_screen(WHITE)
+            return _stream_window(src, (W - iw) // 2, (H - ih) // 2, iw, ih, reveal)
     except Exception as e:
         print("[Display] Logo error:", e)
         return False
@@ -175,7 +448,7 @@ def boot_progress(pct, msg="", msg_color=CYAN):
     fill_rect(0, bar_y + bar_h + 2, W, 20, BLACK)
     if msg:
         mx = (W - text_px(msg, 1)) // 2
-        draw_text(msg, mx, bar_y + bar_h + 4, msg_color, BLACK, 1)
+        draw_text(msg, mx, bar_y + bar_h + 4, msg_color, BLACK, 1, True)
 
 
 def boot_title():
@@ -194,17 +467,17 @@ def boot_title():
     tx = (W - text_px(title, 3)) // 2
     # Draw each letter with a slight delay
     for i, ch in enumerate(title):
-        draw_char16(ch, tx + i * 48, 100, CYAN, BLACK, 3)
+        draw_char16(ch, tx + i * 48, 100, CYAN, BLACK, 3, True)
         time.sleep_ms(60)
     # Subtitle
     time.sleep_ms(300)
     sub = "Environmental Monitor"
     sx = (W - text_px(sub, 1)) // 2
-    draw_text(sub, sx, 160, LTGRAY, BLACK, 1)
+    draw_text(sub, sx, 160, LTGRAY, BLACK, 1, True)
     # Version line
     ver = "v1.0"
     vx = (W - text_px(ver, 1)) // 2
-    draw_text(ver, vx, 185, GRAY, BLACK, 1)
+    draw_text(ver, vx, 185, GRAY, BLACK, 1, True)
 
 
 def hline(x, y, w, color):
@@ -223,37 +496,197 @@ def round_rect(x, y, w, h, color, thick=2):
 
 
 # --- Text rendering ---
+# Expanded RGB565 glyph rasters keyed by (char, fg, bg, scale). Kept in
+# LRU order and evicted once the byte budget is exceeded, so the digits,
+# units and card titles drawn every cycle go straight to spi.write.
+
+GLYPH_CACHE_BUDGET = 16384
+
+_glyphs = OrderedDict()
+_glyph_bytes = 0
+_glyph_hits = 0
+_glyph_misses = 0
+_glyph_evictions = 0
 
-def draw_char16(ch, x, y, fg, bg, scale=2):
+
+def _expand_glyph(ch, fg, bg, scale):
     glyph = FONT16.get(ch, FONT16.get(' ', [0]*16))
-    cw = 16 * scale; ch_ = 16 * scale
-    if x + cw > W or y + ch_ > H or x < 0 or y < 0:
-        return
-    set_window(x, y, x + cw - 1, y + ch_ - 1)
+    cw = 16 * scale
+    row_len = cw * 2
+    buf = bytearray(row_len * cw)
+    mv = memoryview(buf)
     fghi = fg >> 8; fglo = fg & 0xFF
     bghi = bg >> 8; bglo = bg & 0xFF
-    cs.value(0); dc.value(1)
     for row in range(16):
         bits = glyph[row]
-        row_buf = bytearray(cw * 2)
+        base = row * scale * row_len
         for col in range(16):
             if bits & (0x8000 >> col):
                 hi, lo = fghi, fglo
             else:
                 hi, lo = bghi, bglo
+            idx = base + col * scale * 2
             for s in range(scale):
-                idx = (col * scale + s) * 2
-                row_buf[idx] = hi
-                row_buf[idx + 1] = lo
-        rb = bytes(row_buf)
-        for _ in range(scale):
-            spi.write(rb)
-    cs.value(1)
+                buf[idx] = hi
+                buf[idx + 1] = lo
+                idx += 2
+        # Repeat the pixel row for vertical scaling
+        for s in range(1, scale):
+            mv[base + s * row_len:base + (s + 1) * row_len] = mv[base:base + row_len]
+    return buf
+
 
+def _evict_glyphs(budget):
+    global _glyph_bytes, _glyph_evictions
+    while _glyphs and _glyph_bytes > budget:
+        oldest = next(iter(_glyphs))
+        _glyph_bytes -= len(_glyphs.pop(oldest))
+        _glyph_evictions += 1
 
-def draw_text(text, x, y, fg, bg, scale=2):
-    for i, ch in enumerate(text):
-        draw_char16(ch, x + i * 16 * scale, y, fg, bg, scale)
+
+def _glyph(ch, fg, bg, scale):
+    """Return the expanded raster for a glyph, from cache when possible"""
+    global _glyph_bytes, _glyph_hits, _glyph_misses
+    key = (ch, fg, bg, scale)
+    buf = _glyphs.pop(key, None)
+    if buf is not None:
+        _glyph_hits += 1
+        _glyphs[key] = buf  # move to most recently used
+        return buf
+    _glyph_misses += 1
+    buf = _expand_glyph(ch, fg, bg, scale)
+    if len(buf) <= GLYPH_CACHE_BUDGET:
+        _evict_glyphs(GLYPH_CACHE_BUDGET - len(buf))
+        _glyphs[key] = buf
+        _glyph_bytes += len(buf)
+    return buf
+
+
+def glyph_cache_stats():
+    """Glyph cache counters: hits, misses, evictions, bytes, entries, budget"""
+    return {'hits': _glyph_hits, 'misses': _glyph_misses,
+            'evictions': _glyph_evictions, 'bytes': _glyph_bytes,
+            'entries': len(_glyphs), 'budget': GLYPH_CACHE_BUDGET}
+
+
+def set_glyph_cache_budget(nbytes):
+    """Change the glyph cache byte budget, evicting down to it if needed"""
+    global GLYPH_CACHE_BUDGET
+    GLYPH_CACHE_BUDGET = nbytes
+    _evict_glyphs(nbytes)
+
+
+def glyph_cache_clear():
+    """Drop all cached glyphs and reset the counters"""
+    global _glyph_bytes, _glyph_hits, _glyph_misses, _glyph_evictions
+    _glyphs.clear()
+    _glyph_bytes = 0
+    _glyph_hits = _glyph_misses = _glyph_evictions = 0
+
+
+# Bytes of background not sent because the glyph box was trimmed
+_trim_saved = 0
+_frame_trim_saved = 0
+
+
+def trim_saved():
+    """Bytes saved by glyph box trimming during the last draw_dashboard"""
+    return _frame_trim_saved
+
+
+def draw_char16(ch, x, y, fg, bg, scale=2, painted=False):
+    """Draw one glyph. painted=True means the background under it is
+    already bg, so only the glyph's ink box is sent."""
+    cw = 16 * scale
+    if x + cw > W or y + cw > H or x < 0 or y < 0:
+        return
+    if painted:
+        draw_text(ch, x, y, fg, bg, scale, True)
+        return
+    buf = _glyph(ch, fg, bg, scale)
+    _counts[0] += 1
+    _counts[2] += len(buf)
+    with _tx:
+        _window(x, y, x + cw - 1, y + cw - 1)
+        spi.write(buf)
+
+
+# One full-width scanline, reused by every draw_text call
+_line = bytearray(W * 2)
+_line_mv = memoryview(_line)
+
+
+def draw_text(text, x, y, fg, bg, scale=2, painted=False, clip=None):
+    """Draw a string through a single address window.
+    Each pixel row of the string is assembled in the shared scanline
+    buffer from cached glyph rasters and sent as one SPI burst.
+    painted=True means the background is already bg (e.g. a freshly
+    filled card), so the window is trimmed to the string's ink box.
+    clip=(x0, y0, x1, y1) keeps the pixels inside that rectangle
+    (x1/y1 exclusive), cutting through glyphs if needed."""
+    global _trim_saved
+    cw = 16 * scale
+    if y < 0 or y + cw > H:
+        return
+    first = 0
+    if x < 0:
+        # Skip characters that start off the left edge
+        first = (-x + cw - 1) // cw
+    last = min(len(text), (W - x) // cw)
+    n = last - first
+    if n <= 0:
+        return
+    x += first * cw
+    # Source rows and font columns to send
+    top = 0; bottom = 15; left = 0; right = n * 16 - 1
+    if painted:
+        top = 16; bottom = -1; left = -1
+        for i in range(n):
+            box = font16.bbox(text[first + i])
+            if box is None:
+                continue
+            if box[0] < top:
+                top = box[0]
+            if box[1] > bottom:
+                bottom = box[1]
+            if left < 0:
+                left = i * 16 + box[2]
+            right = i * 16 + box[3]
+        full = n * cw * cw * 2
+        if bottom < 0:
+            _trim_saved += full
+            return
+        _trim_saved += full - (right - left + 1) * (bottom - top + 1) * scale * scale * 2
+    # Screen pixels to send: columns px0..px1-1, rows py0..py1-1
+    px0 = x + left * scale
+    px1 = x + (right + 1) * scale
+    py0 = y + top * scale
+    py1 = y + (bottom + 1) * scale
+    if clip is not None:
+        px0 = max(px0, clip[0])
+        px1 = min(px1, clip[2])
+        py0 = max(py0, clip[1])
+        py1 = min(py1, clip[3])
+        if px1 <= px0 or py1 <= py0:
+            return
+    row_len = cw * 2
+    rasters = [memoryview(_glyph(text[i], fg, bg, scale)) for i in range(first, last)]
+    line = _line_mv
+    lo = (px0 - x) * 2
+    hi = (px1 - x) * 2
+    _counts[0] += 1
+    _counts[2] += (hi - lo) * (py1 - py0)
+    with _tx:
+        _window(px0, py0, px1 - 1, py1 - 1)
+        for row in range((py0 - y) // scale, (py1 - 1 - y) // scale + 1):
+            src = row * scale * row_len
+            dst = 0
+            for r in rasters:
+                line[dst:dst + row_len] = r[src:src + row_len]
+                dst += row_len
+            ry = y + row * scale
+            for _ in range(min(ry + scale, py1) - max(ry, py0)):
+                spi.write(line[lo:hi])
 
 
 def text_px(text, scale=2):
@@ -261,45 +694,486 @@ def text_px(text, scale=2):
 
 
 # --- Dashboard UI ---
+# Retained state: what each card and text span last showed, so
+# draw_dashboard only re-pushes what actually changed.
 
-def draw_card(x, y, w, h, label, value, unit, val_color, bg=CARD_BG):
-    """Draw a sensor reading card"""
+_cards = {}      # (x, y) -> (w, h, bg) of painted card chrome
+_spans = {}      # key -> (x, y, text, fg, bg, scale) of painted text
+_chrome = {}     # static dashboard pieces -> last drawn state
+
+
+def invalidate():
+    """Forget retained state so the next draw_dashboard repaints everything.
+    Call after drawing anything over the dashboard (overlays, other pages)."""
+    _cards.clear()
+    _spans.clear()
+    _chrome.clear()
+
+
+def _clear(x, y, w, h, bg, clip):
+    """fill_rect limited to the clip rectangle (x0, y0, x1, y1)"""
+    if clip is not None:
+        x1 = min(x + w, clip[2])
+        y1 = min(y + h, clip[3])
+        x = max(x, clip[0])
+        y = max(y, clip[1])
+        w = x1 - x
+        h = y1 - y
+        if w <= 0 or h <= 0:
+            return
     fill_rect(x, y, w, h, bg)
-    round_rect(x, y, w, h, CARD_BRD, 2)
-    lx = x + (w - text_px(label, 1)) // 2
-    draw_text(label, lx, y + 4, WHITE, bg, 1)
+
+
+def _put_text(key, text, x, y, fg, bg, scale=1, painted=False, clip=None):
+    """Draw text, touching only what differs from the last text drawn for key.
+    painted=True means the area was just filled with bg. clip is the
+    owning card's inside (x0, y0, x1, y1): text wider than the card is
+    cut at its border and stale text is never cleared outside it."""
+    old = _spans.get(key)
+    if old == (x, y, text, fg, bg, scale):
+        return
+    _spans[key] = (x, y, text, fg, bg, scale)
+    if old is None:
+        draw_text(text, x, y, fg, bg, scale, painted, clip)
+        return
+    ox, oy, otext, ofg, obg, oscale = old
+    step = 16 * scale
+    if (ox, oy, ofg, obg, oscale) == (x, y, fg, bg, scale) and len(otext) == len(text):
+        # Same span: redraw only the characters that changed
+        for i in range(len(text)):
+            if text[i] != otext[i]:
+                cx = x + i * step
+                if clip is None or (cx >= clip[0] and cx + step <= clip[2]):
+                    draw_char16(text[i], cx, y, fg, bg, scale)
+                else:
+                    draw_text(text[i], cx, y, fg, bg, scale, False, clip)
+        return
+    # Clear whatever part of the old span the new one won't cover
+    ow = text_px(otext, oscale)
+    oh = 16 * oscale
+    nw = text_px(text, scale)
+    if oy != y or oscale != scale or bg != obg:
+        _clear(ox, oy, ow, oh, bg, clip)
+    else:
+        if ox < x:
+            _clear(ox, oy, min(ow, x - ox), oh, bg, clip)
+        if ox + ow > x + nw:
+            rx = max(ox, x + nw)
+            _clear(rx, oy, ox + ow - rx, oh, bg, clip)
+    draw_text(text, x, y, fg, bg, scale, False, clip)
+
+
+# --- Off-screen card compositing ---
+# A card that needs its chrome repainted is rendered into an RGB565
+# sprite (big-endian, panel byte order) and pushed with one window and
+# one write. framebuf does the fills when available; the pure-Python
+# path produces the same bytes on the host. Off by default: the sprite
+# for a dashboard card is ~24 KB and stays allocated for reuse, on top
+# of the glyph and fill caches. main.py sets it from config.COMPOSITE_CARDS.
+
+COMPOSITE_CARDS = False
+SPRITE_MAX_BYTES = 24 * 1024
+
+_sprite = None
+_sprite_fb = None
+_sprite_dim = None
+
+
+def _sprite_for(w, h):
+    """Return (memoryview, FrameBuffer or None) for a w x h sprite,
+    or (None, None) if the heap can't hold it"""
+    global _sprite, _sprite_fb, _sprite_dim
+    if _sprite is None or len(_sprite) < w * h * 2:
+        # Drop the old buffer first so the two never coexist
+        _sprite = None
+        _sprite_fb = None
+        _sprite_dim = None
+        try:
+            _sprite = memoryview(bytearray(w * h * 2))
+        except MemoryError:
+            print("[Display] No heap for a {}x{} sprite, drawing direct".format(w, h))
+            return None, None
+    if _sprite_dim != (w, h):
+        _sprite_fb = None
+        if framebuf is not None:
+            _sprite_fb = framebuf.FrameBuffer(_sprite, w, h, framebuf.RGB565)
+        _sprite_dim = (w, h)
+    return _sprite, _sprite_fb
+
+
+def _sprite_rect(buf, fb, stride, x, y, w, h, color):
+    if fb is not None:
+        # framebuf stores RGB565 little-endian; swap so bytes match the panel
+        fb.fill_rect(x, y, w, h, ((color & 0xFF) << 8) | (color >> 8))
+        return
+    pat = _fill_pattern(color)
+    n = w * 2
+    for r in range(y, y + h):
+        o = (r * stride + x) * 2
+        buf[o:o + n] = pat[:n]
+
+
+def _sprite_text(buf, stride, clip, text, x, y, fg, bg, scale):
+    """Copy cached glyph rasters into the sprite, cut to clip
+    (x0, y0, x1, y1 in sprite pixels) like draw_text(..., clip)"""
+    cw = 16 * scale
+    r0 = max(0, clip[1] - y)
+    r1 = min(cw, clip[3] - y)
+    if r1 <= r0:
+        return
+    row_len = cw * 2
+    for i in range(len(text)):
+        cx = x + i * cw
+        c0 = max(0, clip[0] - cx)
+        c1 = min(cw, clip[2] - cx)
+        if c1 <= c0:
+            continue
+        g = memoryview(_glyph(text[i], fg, bg, scale))
+        n = (c1 - c0) * 2
+        src = r0 * row_len + c0 * 2
+        dst = ((y + r0) * stride + cx + c0) * 2
+        for _ in range(r1 - r0):
+            buf[dst:dst + n] = g[src:src + n]
+            src += row_len
+            dst += stride * 2
+
+
+def _compose_card(x, y, w, h, bg, spans):
+    """Render card chrome and text spans off-screen, then push in one burst.
+    Returns False, drawing nothing, if no sprite could be allocated."""
+    buf, fb = _sprite_for(w, h)
+    if buf is None:
+        return False
+    _sprite_rect(buf, fb, w, 0, 0, w, h, bg)
+    # Same border strips as round_rect(..., thick=2)
+    _sprite_rect(buf, fb, w, 2, 0, w - 4, 2, CARD_BRD)
+    _sprite_rect(buf, fb, w, 2, h - 2, w - 4, 2, CARD_BRD)
+    _sprite_rect(buf, fb, w, 0, 2, 2, h - 4, CARD_BRD)
+    _sprite_rect(buf, fb, w, w - 2, 2, 2, h - 4, CARD_BRD)
+    inside = (2, 2, w - 2, h - 2)
+    for _, text, tx, ty, fg, scale in spans:
+        _sprite_text(buf, w, inside, text, tx - x, ty - y, fg, bg, scale)
+    with _tx:
+        _window(x, y, x + w - 1, y + h - 1)
+        spi.write(buf[:w * h * 2])
+    _counts[0] += 1
+    _counts[2] += w * h * 2
+    return True
+
+
+def _can_compose(x, y, w, h):
+    return (COMPOSITE_CARDS and w * h * 2 <= SPRITE_MAX_BYTES and
+            x >= 0 and y >= 0 and x + w <= W and y + h <= H)
+
+
+def _update_spans(x, y, w, h, bg, spans):
+    """Bring a card up to date. spans is a sequence of
+    (slot, text, x, y, fg, scale) in screen coordinates."""
+    painted = False
+    if _cards.get((x, y)) != (w, h, bg):
+        for slot in ('l', 'v', 'u', 't', 'd'):
+            _spans.pop((x, y, slot), None)
+        _cards[(x, y)] = (w, h, bg)
+        spark = _sparks.get((x, y))
+        if _can_compose(x, y, w, h) and _compose_card(x, y, w, h, bg, spans):
+            for slot, text, tx, ty, fg, scale in spans:
+                _spans[(x, y, slot)] = (tx, ty, text, fg, bg, scale)
+            if spark:
+                spark.redraw()
+            return
+        fill_rect(x, y, w, h, bg)
+        round_rect(x, y, w, h, CARD_BRD, 2)
+        if spark:
+            spark.redraw()
+        painted = True
+    # Text stays inside the 2px border
+    clip = (x + 2, y + 2, x + w - 2, y + h - 2)
+    for slot, text, tx, ty, fg, scale in spans:
+        _put_text((x, y, slot), text, tx, ty, fg, bg, scale, painted, clip)
+
+
+def _update_card(x, y, w, h, label, value, unit, val_color, bg=CARD_BG):
     # Clamp value to fit card width
     vscale = 2
     if text_px(value, 2) > w - 8:
         vscale = 1
-    vx = x + (w - text_px(value, vscale)) // 2
-    draw_text(value, vx, y + 24, val_color, bg, vscale)
-    ux = x + (w - text_px(unit, 1)) // 2
-    draw_text(unit, ux, y + 60, LTGRAY, bg, 1)
+    _update_spans(x, y, w, h, bg, (
+        ('l', label, x + (w - text_px(label, 1)) // 2, y + 4, WHITE, 1),
+        ('v', value, x + (w - text_px(value, vscale)) // 2, y + 24, val_color, vscale),
+        ('u', unit, x + (w - text_px(unit, 1)) // 2, y + 60, LTGRAY, 1)))
 
 
-def draw_dashboard(co2, temp, hum, lux=0, pressure=0, sd_free="--",
-                   status="", unit_label="F", time_str="", date_str="",
-                   batt_pct=-1):
-    """Draw the full EnvMonitor dashboard - 3x3 grid"""
-    # Title bar
-    fill_rect(0, 0, W, 26, DKBLUE)
-    draw_text("EnvMonitor", 8, 5, CYAN, DKBLUE, 1)
-    # Battery gauge top right
+def draw_card(x, y, w, h, label, value, unit, val_color, bg=CARD_BG):
+    """Draw a sensor reading card"""
+    _cards.pop((x, y), None)
+    _update_card(x, y, w, h, label, value, unit, val_color, bg)
+
+
+def _update_time_card(x, y, w, h, time_str, date_str):
+    """Time card - value drawn at scale 1 on two lines"""
+    _update_spans(x, y, w, h, CARD_BG, (
+        ('l', "TIME", x + (w - text_px("TIME", 1)) // 2, y + 4, WHITE, 1),
+        ('t', time_str, x + (w - text_px(time_str, 1)) // 2, y + 28, YELLOW, 1),
+        ('d', date_str, x + (w - text_px(date_str, 1)) // 2, y + 48, LTGRAY, 1)))
+
+
+# --- Sparklines ---
+
+class Sparkline:
+    """Sweep-style trend line backed by a fixed ring buffer.
+
+    Sample i is drawn in column i % w; each push() draws only that
+    column (a segment from the previous sample) and blanks the column
+    after it, which holds the oldest sample. The cost per sample is two
+    one-pixel-wide windows regardless of how much history is shown.
+    Values are clamped to the fixed lo..hi range so new samples never
+    force a rescale and full redraw.
+    """
+
+    def __init__(self, x, y, w, h, lo, hi, fg=CYAN, bg=CARD_BG):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.lo = lo
+        self.hi = hi
+        self.fg = fg
+        self.bg = bg
+        self.rows = bytearray(w)   # plotted row per column (0 = top)
+        self.count = 0
+        self.head = 0              # column the next sample goes into
+        self.pending = 0           # samples added but not yet drawn
+        self._col = memoryview(bytearray(h * 2))
+
+    def _row(self, v):
+        if v <= self.lo:
+            return self.h - 1
+        if v >= self.hi:
+            return 0
+        return int((self.hi - v) * (self.h - 1) / (self.hi - self.lo))
+
+    def _segment(self, col, prev, cur):
+        """Paint one column: bg with an fg run from prev row to cur row"""
+        buf = self._col
+        n = self.h * 2
+        buf[:n] = _fill_pattern(self.bg)[:n]
+        hi = self.fg >> 8; lo = self.fg & 0xFF
+        a, b = (prev, cur) if prev <= cur else (cur, prev)
+        for r in range(a, b + 1):
+            buf[r * 2] = hi
+            buf[r * 2 + 1] = lo
+        x = self.x + col
+        with _tx:
+            _window(x, self.y, x, self.y + self.h - 1)
+            spi.write(buf)
+        _counts[0] += 1
+        _counts[2] += n
+
+    def add(self, v):
+        """Record a sample without drawing; flush() draws it"""
+        self.rows[self.head] = self._row(v)
+        self.head = (self.head + 1) % self.w
+        if self.count < self.w:
+            self.count += 1
+        if self.pending < self.w:
+            self.pending += 1
+
+    def flush(self):
+        """Draw the samples added since the last flush/redraw: one column
+        each, then erase the column holding the oldest sample"""
+        n = self.pending
+        if not n:
+            return
+        if n >= self.count:
+            self.redraw()
+            return
+        w = self.w
+        for k in range(n):
+            i = (self.head - n + k) % w
+            self._segment(i, self.rows[(i - 1) % w], self.rows[i])
+        self.pending = 0
+        fill_rect(self.x + self.head, self.y, 1, self.h, self.bg)
+
+    def push(self, v):
+        """Append a sample; draws one column and erases the oldest"""
+        self.add(v)
+        self.flush()
+
+    def redraw(self):
+        """Repaint the whole widget, e.g. after its card was repainted"""
+        self.pending = 0
+        fill_rect(self.x, self.y, self.w, self.h, self.bg)
+        if not self.count:
+            return
+        start = (self.head - self.count) % self.w
+        prev = self.rows[start]
+        for k in range(self.count):
+            i = (start + k) % self.w
+            self._segment(i, prev, self.rows[i])
+            prev = self.rows[i]
+        fill_rect(self.x + self.head, self.y, 1, self.h, self.bg)
+
+
+SHOW_TRENDS = True
+_sparks = {}   # card (x, y) -> Sparkline drawn in its bottom-right corner
+
+# Card name -> (lo, hi, color) of its sparkline
+TRENDS = {'co2': (400, 2000, CYAN), 'temp': (10, 35, ORANGE),
+          'humid': (0, 100, CYAN), 'light': (0, 1000, YELLOW),
+          'pressure': (980, 1040, WHITE)}
+
+
+def clear_trends():
+    """Forget all card sparklines (history and widgets)"""
+    _sparks.clear()
+
+
+def _spark_add(name, value):
+    x, y, w, h = layout.DASH.rect(name)
+    spark = _sparks.get((x, y))
+    if spark is None:
+        lo, hi, fg = TRENDS[name]
+        spark = _sparks[(x, y)] = Sparkline(x + w - 46, y + h - 20, 44, 16, lo, hi, fg)
+    spark.add(value)
+
+
+def trend_sample(co2=0, temp_c=0.0, hum=0.0, lux=0, pressure=0):
+    """Record one sensor reading in the card sparklines. Call once per
+    reading: repaints never add points. Nothing is drawn here; the next
+    draw_dashboard() shows the new columns. Zero CO2, humidity or
+    pressure means no reading (temperature goes with humidity)."""
+    if not SHOW_TRENDS:
+        return
+    if co2 > 0:
+        _spark_add('co2', co2)
+    if hum > 0:
+        _spark_add('temp', temp_c)
+        _spark_add('humid', hum)
+    _spark_add('light', lux)
+    if pressure > 0:
+        _spark_add('pressure', pressure)
+
+
+def _trend(x, y):
+    """Draw a card's sparkline columns added since it was last drawn"""
+    spark = _sparks.get((x, y))
+    if spark is not None and SHOW_TRENDS:
+        spark.flush()
+
+
+# --- History page (hardware scrolling) ---
+# With MADCTL 0x28 (landscape, MV set) screen x runs along the panel's
+# 480 gate lines, so the controller's vertical scroll (VSCRDEF 0x33,
+# VSCRSADD 0x37) slides columns sideways. Columns 0..HIST_LEFT-1 are the
+# fixed top area holding the labels; the rest scrolls. A new sample is
+# one column written over the oldest line plus one VSCRSADD update.
+
+HIST_LEFT = 96
+_HIST_TOP = 8          # plot margin inside the column
+_hist = None
+
+
+def _scroll_area(tfa, vsa, bfa):
+    cmd_data(0x33, [tfa >> 8, tfa & 0xFF, vsa >> 8, vsa & 0xFF, bfa >> 8, bfa & 0xFF])
+
+
+def _scroll_start(line):
+    cmd_data(0x37, [line >> 8, line & 0xFF])
+
+
+def history_begin(title, lo, hi, unit="", fg=CYAN):
+    """Switch to the full-screen scrolling history chart.
+    lo/hi fix the vertical range; call history_push() per sample and
+    history_end() to return to the dashboard."""
+    global _hist
+    fill_screen(BLACK)
+    fill_rect(0, 0, HIST_LEFT - 2, H, DKBLUE)
+    draw_text(title, 8, 8, CYAN, DKBLUE, 1, True)
+    draw_text(unit, 8, 28, LTGRAY, DKBLUE, 1, True)
+    draw_text(str(hi), 8, 60, LTGRAY, DKBLUE, 1, True)
+    draw_text(str(lo), 8, H - 24, LTGRAY, DKBLUE, 1, True)
+    draw_text("Tap to", 8, H - 64, GRAY, DKBLUE, 1, True)
+    draw_text("return", 8, H - 46, GRAY, DKBLUE, 1, True)
+    vsa = W - HIST_LEFT
+    _scroll_area(HIST_LEFT, vsa, 0)
+    _scroll_start(HIST_LEFT)
+    _hist = {'lo': lo, 'hi': hi, 'fg': fg, 'vsa': vsa, 'off': 0,
+             'prev': -1, 'col': memoryview(bytearray(H * 2))}
+    # Gridlines; every pushed column repeats them
+    for gy in _hist_grid():
+        hline(HIST_LEFT, gy, vsa, DKGRAY)
+
+
+def _hist_grid():
+    span = H - 2 * _HIST_TOP
+    return (_HIST_TOP, _HIST_TOP + span // 4, _HIST_TOP + span // 2,
+            _HIST_TOP + 3 * span // 4, H - _HIST_TOP - 1)
+
+
+def history_active():
+    return _hist is not None
+
+
+def history_push(v):
+    """Append one sample at the right edge by rewriting the oldest
+    column and advancing the scroll start. Cost: one H-pixel column."""
+    st = _hist
+    if st is None:
+        return
+    lo = st['lo']; hi = st['hi']
+    span = H - 2 * _HIST_TOP - 1
+    if v <= lo:
+        row = H - _HIST_TOP - 1
+    elif v >= hi:
+        row = _HIST_TOP
+    else:
+        row = _HIST_TOP + int((hi - v) * span / (hi - lo))
+    prev = st['prev'] if st['prev'] >= 0 else row
+    st['prev'] = row
+    col = st['col']
+    col[:] = _fill_pattern(BLACK)[:H * 2]
+    gh = DKGRAY >> 8; gl = DKGRAY & 0xFF
+    for gy in _hist_grid():
+        col[gy * 2] = gh
+        col[gy * 2 + 1] = gl
+    fh = st['fg'] >> 8; fl = st['fg'] & 0xFF
+    a, b = (prev, row) if prev <= row else (row, prev)
+    for r in range(a, b + 1):
+        col[r * 2] = fh
+        col[r * 2 + 1] = fl
+    # The oldest line is the one about to wrap to the right edge
+    line = HIST_LEFT + st['off']
+    with _tx:
+        _window(line, 0, line, H - 1)
+        spi.write(col)
+    _counts[0] += 1
+    _counts[2] += H * 2
+    st['off'] = (st['off'] + 1) % st['vsa']
+    _scroll_start(HIST_LEFT + st['off'])
+    # Latest value in the fixed label area
+    fill_rect(8, 100, HIST_LEFT - 12, 16, DKBLUE)
+    draw_text(str(int(v)), 8, 100, st['fg'], DKBLUE, 1, True)
+
+
+def history_end():
+    """Leave the history page: scrolling off, dashboard repaints fully"""
+    global _hist
+    if _hist is None:
+        return
+    _hist = None
+    _scroll_start(0)
+    _scroll_area(0, W, 0)
+    cmd(0x13)  # normal display mode
+    fill_screen(BLACK)
+
+
+def _draw_battery(batt_pct):
     batt_x = W - 44
     batt_y = 6
     batt_w = 30
     batt_h = 14
-    # Battery outline
-    fill_rect(batt_x, batt_y, batt_w, batt_h, DKBLUE)
-    # Border
-    fill_rect(batt_x, batt_y, batt_w, 1, LTGRAY)
-    fill_rect(batt_x, batt_y + batt_h - 1, batt_w, 1, LTGRAY)
-    fill_rect(batt_x, batt_y, 1, batt_h, LTGRAY)
-    fill_rect(batt_x + batt_w - 1, batt_y, 1, batt_h, LTGRAY)
-    # Tip
-    fill_rect(batt_x + batt_w, batt_y + 4, 3, 6, LTGRAY)
-    # Fill based on percentage
+    fill_w = 0
+    bc = DKBLUE
     if batt_pct >= 0:
         fill_w = max(0, min(batt_w - 4, int((batt_w - 4) * batt_pct / 100)))
         if batt_pct > 50:
@@ -308,66 +1182,146 @@ def draw_dashboard(co2, temp, hum, lux=0, pressure=0, sd_free="--",
             bc = YELLOW
         else:
             bc = RED
-        if fill_w > 0:
-            fill_rect(batt_x + 2, batt_y + 2, fill_w, batt_h - 4, bc)
-
-    # 3x3 card grid
-    card_w = 152
-    card_h = 78
-    gap = 5
-    row1_y = 28
-    row2_y = row1_y + card_h + gap
-    row3_y = row2_y + card_h + gap
-    x0 = (W - (3 * card_w + 2 * gap)) // 2
-
-    # Row 1: CO2, Temperature, Humidity
+    if _chrome.get('batt') == (fill_w, bc):
+        return
+    if 'batt' not in _chrome:
+        # Battery outline
+        fill_rect(batt_x, batt_y, batt_w, batt_h, DKBLUE)
+        # Border
+        fill_rect(batt_x, batt_y, batt_w, 1, LTGRAY)
+        fill_rect(batt_x, batt_y + batt_h - 1, batt_w, 1, LTGRAY)
+        fill_rect(batt_x, batt_y, 1, batt_h, LTGRAY)
+        fill_rect(batt_x + batt_w - 1, batt_y, 1, batt_h, LTGRAY)
+        # Tip
+        fill_rect(batt_x + batt_w, batt_y + 4, 3, 6, LTGRAY)
+    else:
+        # Only the inside changes
+        fill_rect(batt_x + 2, batt_y + 2, batt_w - 4, batt_h - 4, DKBLUE)
+    if fill_w > 0:
+        fill_rect(batt_x + 2, batt_y + 2, fill_w, batt_h - 4, bc)
+    _chrome['batt'] = (fill_w, bc)
+
+
+# --- Dashboard widgets ---
+# One function per layout.DASH cell, drawing from the last values given
+# to draw_dashboard(). Sparklines are fed by trend_sample(); widgets
+# only draw them, so update_widget() and repaints add no points.
+
+_vals = {'co2': 0, 'temp': 0.0, 'hum': 0.0, 'lux': 0, 'pressure': 0,
+         'sd_free': "--", 'status': "", 'unit_label': "F",
+         'time_str': "", 'date_str': ""}
+
+
+def _w_co2(x, y, w, h):
+    co2 = _vals['co2']
     co2_color = GREEN if co2 < 1000 else (YELLOW if co2 < 1500 else RED)
-    draw_card(x0, row1_y, card_w, card_h, "CO2", str(co2), "ppm", co2_color)
+    _update_card(x, y, w, h, "CO2", str(co2), "ppm", co2_color)
+    _trend(x, y)
+
+
+def _w_temp(x, y, w, h):
+    temp = _vals['temp']
+    unit_label = _vals['unit_label']
+    _update_card(x, y, w, h, "TEMP", "{:.1f}".format(temp), unit_label, ORANGE)
+    _trend(x, y)
+
 
-    draw_card(x0 + card_w + gap, row1_y, card_w, card_h,
-              "TEMP", "{:.1f}".format(temp), unit_label, ORANGE)
+def _w_humid(x, y, w, h):
+    hum = _vals['hum']
+    _update_card(x, y, w, h, "HUMID", "{:.1f}".format(hum), "%", CYAN)
+    _trend(x, y)
 
-    draw_card(x0 + 2 * (card_w + gap), row1_y, card_w, card_h,
-              "HUMID", "{:.1f}".format(hum), "%", CYAN)
 
-    # Row 2: Light, Air Quality, Pressure
-    lux_str = str(int(lux))
+def _w_light(x, y, w, h):
+    lux = _vals['lux']
     lux_color = YELLOW if lux < 10 else (GREEN if lux < 1000 else WHITE)
-    draw_card(x0, row2_y, card_w, card_h, "LIGHT", lux_str, "lux", lux_color)
+    _update_card(x, y, w, h, "LIGHT", str(int(lux)), "lux", lux_color)
+    _trend(x, y)
 
+
+def _w_air(x, y, w, h):
+    co2 = _vals['co2']
     co2_status = "Good" if co2 < 1000 else ("Fair" if co2 < 1500 else "Poor")
     co2_st_color = GREEN if co2 < 1000 else (YELLOW if co2 < 1500 else RED)
-    draw_card(x0 + card_w + gap, row2_y, card_w, card_h,
-              "AIR", co2_status, "quality", co2_st_color)
+    _update_card(x, y, w, h, "AIR", co2_status, "quality", co2_st_color)
+
 
+def _w_pressure(x, y, w, h):
+    pressure = _vals['pressure']
     p_str = "{:.0f}".format(pressure) if pressure > 0 else "--"
-    draw_card(x0 + 2 * (card_w + gap), row2_y, card_w, card_h,
-              "PRESS", p_str, "hPa", WHITE)
+    _update_card(x, y, w, h, "PRESS", p_str, "hPa", WHITE)
+    _trend(x, y)
+
 
-    # Row 3: SD Card, WiFi, Time
-    draw_card(x0, row3_y, card_w, card_h, "SD", sd_free, "used", GREEN)
+def _w_sd(x, y, w, h):
+    _update_card(x, y, w, h, "SD", _vals['sd_free'], "used", GREEN)
 
+
+def _w_wifi(x, y, w, h):
+    status = _vals['status']
     wifi_str = "OK" if "." in status else "OFF"
     wifi_color = GREEN if "." in status else RED
-    draw_card(x0 + card_w + gap, row3_y, card_w, card_h,
-              "WIFI", wifi_str, "", wifi_color)
-
-    # Time card - draw manually with scale 1 value
-    tx3 = x0 + 2 * (card_w + gap)
-    fill_rect(tx3, row3_y, card_w, card_h, CARD_BG)
-    round_rect(tx3, row3_y, card_w, card_h, CARD_BRD, 2)
-    tlx = tx3 + (card_w - text_px("TIME", 1)) // 2
-    draw_text("TIME", tlx, row3_y + 4, WHITE, CARD_BG, 1)
-    if time_str:
-        tvx = tx3 + (card_w - text_px(time_str, 1)) // 2
-        draw_text(time_str, tvx, row3_y + 28, YELLOW, CARD_BG, 1)
-    if date_str:
-        dvx = tx3 + (card_w - text_px(date_str, 1)) // 2
-        draw_text(date_str, dvx, row3_y + 48, LTGRAY, CARD_BG, 1)
+    _update_card(x, y, w, h, "WIFI", wifi_str, "", wifi_color)
+
+
+def _w_time(x, y, w, h):
+    _update_time_card(x, y, w, h, _vals['time_str'], _vals['date_str'])
+
+
+_widgets = {'co2': _w_co2, 'temp': _w_temp, 'humid': _w_humid,
+            'light': _w_light, 'air': _w_air, 'pressure': _w_pressure,
+            'sd': _w_sd, 'wifi': _w_wifi, 'time': _w_time}
+
+
+def update_widget(name, **vals):
+    """Redraw one dashboard card now, e.g. after a tap changed its units.
+    Keyword values (same names as draw_dashboard's arguments) replace
+    the last ones drawn; only changed text reaches the panel."""
+    for k in vals:
+        _vals[k] = vals[k]
+    x, y, w, h = layout.DASH.rect(name)
+    _widgets[name](x, y, w, h)
+
+
+def draw_dashboard(co2, temp, hum, lux=0, pressure=0, sd_free="--",
+                   status="", unit_label="F", time_str="", date_str="",
+                   batt_pct=-1):
+    """Draw the EnvMonitor dashboard - 3x3 grid.
+    Only cards, text spans and gauges that changed since the last call
+    are pushed to the panel; call invalidate() to force a full repaint."""
+    global _trim_saved, _frame_trim_saved
+    _trim_saved = 0
+    # Title bar
+    if 'title' not in _chrome:
+        fill_rect(0, 0, W, layout.TITLE_H, DKBLUE)
+        draw_text("EnvMonitor", 8, 5, CYAN, DKBLUE, 1, True)
+        _chrome['title'] = True
+    # Battery gauge top right
+    _draw_battery(batt_pct)
+
+    # 3x3 card grid, one widget per cell
+    _vals['co2'] = co2
+    _vals['temp'] = temp
+    _vals['hum'] = hum
+    _vals['lux'] = lux
+    _vals['pressure'] = pressure
+    _vals['sd_free'] = sd_free
+    _vals['status'] = status
+    _vals['unit_label'] = unit_label
+    _vals['time_str'] = time_str
+    _vals['date_str'] = date_str
+    for name in layout.DASH.names:
+        x, y, w, h = layout.DASH.rect(name)
+        _widgets[name](x, y, w, h)
 
     # Bottom bar with IP
-    bot_y = row3_y + card_h + 2
-    fill_rect(0, bot_y, W, H - bot_y, DKBLUE)
-    if status and "." in status:
-        ip_x = (W - text_px(status, 1)) // 2
-        draw_text(status, ip_x, bot_y + 1, GREEN, DKBLUE, 1)
+    bot_y = layout.BOTTOM_Y
+    painted = 'bottom' not in _chrome
+    if painted:
+        fill_rect(0, bot_y, W, H - bot_y, DKBLUE)
+        _chrome['bottom'] = True
+        _spans.pop('ip', None)
+    ip = status if (status and "." in status) else ""
+    ip_x = (W - text_px(ip, 1)) // 2
+    _put_text('ip', ip, ip_x, bot_y + 1, GREEN, DKBLUE, 1, painted)
+    _frame_trim_saved = _trim_saved
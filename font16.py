@@ -1,252 +1,164 @@
-# 16x16 bitmap font - each char is 16 rows of 16-bit values
-FONT16 = {
-    ' ': [0]*16,
-    '0': [
-        0x0000,0x0FF0,0x1C38,0x381C,0x300C,0x300C,0x300C,0x300C,
-        0x300C,0x300C,0x381C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,
-    ],
-    '1': [
-        0x0000,0x0300,0x0700,0x0F00,0x0300,0x0300,0x0300,0x0300,
-        0x0300,0x0300,0x0300,0x0300,0x0FF0,0x0000,0x0000,0x0000,
-    ],
-    '2': [
-        0x0000,0x0FF0,0x1C38,0x300C,0x000C,0x0018,0x0070,0x01C0,
-        0x0700,0x0C00,0x1800,0x3000,0x3FFC,0x0000,0x0000,0x0000,
-    ],
-    '3': [
-        0x0000,0x0FF0,0x1C38,0x000C,0x000C,0x0038,0x03F0,0x0038,
-        0x000C,0x000C,0x000C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,
-    ],
-    '4': [
-        0x0000,0x0070,0x00F0,0x01B0,0x0330,0x0630,0x0C30,0x1830,
-        0x3FFC,0x0030,0x0030,0x0030,0x0030,0x0000,0x0000,0x0000,
-    ],
-    '5': [
-        0x0000,0x3FFC,0x3000,0x3000,0x3000,0x3FF0,0x0038,0x000C,
-        0x000C,0x000C,0x000C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,
-    ],
-    '6': [
-        0x0000,0x03F0,0x0E00,0x1C00,0x3000,0x3FF0,0x3C38,0x300C,
-        0x300C,0x300C,0x3C38,0x1FF0,0x0FE0,0x0000,0x0000,0x0000,
-    ],
-    '7': [
-        0x0000,0x3FFC,0x000C,0x0018,0x0030,0x0060,0x00C0,0x0180,
-        0x0180,0x0300,0x0300,0x0300,0x0300,0x0000,0x0000,0x0000,
-    ],
-    '8': [
-        0x0000,0x0FF0,0x1C38,0x300C,0x300C,0x1C38,0x0FF0,0x1C38,
-        0x300C,0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,
-    ],
-    '9': [
-        0x0000,0x0FF0,0x1C38,0x300C,0x300C,0x300C,0x1C3C,0x0FFC,
-        0x0018,0x0030,0x0060,0x01C0,0x0F00,0x0000,0x0000,0x0000,
-    ],
-    '.': [
-        0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,
-        0x0000,0x0000,0x0380,0x0380,0x0380,0x0000,0x0000,0x0000,
-    ],
-    ':': [
-        0x0000,0x0000,0x0000,0x0380,0x0380,0x0380,0x0000,0x0000,
-        0x0000,0x0380,0x0380,0x0380,0x0000,0x0000,0x0000,0x0000,
-    ],
-    '%': [
-        0x0000,0x3804,0x3808,0x3810,0x0020,0x0040,0x0080,0x0100,
-        0x0200,0x0400,0x0800,0x101C,0x201C,0x0000,0x0000,0x0000,
-    ],
-    'A': [
-        0x0000,0x03C0,0x07E0,0x0E70,0x1C38,0x381C,0x300C,0x300C,
-        0x3FFC,0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,
-    ],
-    'B': [
-        0x0000,0x3FF0,0x3018,0x300C,0x300C,0x3018,0x3FF0,0x3018,
-        0x300C,0x300C,0x3018,0x3FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'C': [
-        0x0000,0x0FF0,0x1C38,0x3000,0x3000,0x3000,0x3000,0x3000,
-        0x3000,0x3000,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'D': [
-        0x0000,0x3FE0,0x3070,0x3038,0x300C,0x300C,0x300C,0x300C,
-        0x300C,0x3038,0x3070,0x3FE0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'E': [
-        0x0000,0x3FFC,0x3000,0x3000,0x3000,0x3FF0,0x3FF0,0x3000,
-        0x3000,0x3000,0x3000,0x3FFC,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'F': [
-        0x0000,0x3FFC,0x3000,0x3000,0x3000,0x3FF0,0x3FF0,0x3000,
-        0x3000,0x3000,0x3000,0x3000,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'H': [
-        0x0000,0x300C,0x300C,0x300C,0x300C,0x3FFC,0x3FFC,0x300C,
-        0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'I': [
-        0x0000,0x0FF0,0x0180,0x0180,0x0180,0x0180,0x0180,0x0180,
-        0x0180,0x0180,0x0180,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'M': [
-        0x0000,0x300C,0x381C,0x3C3C,0x3E7C,0x36DC,0x338C,0x300C,
-        0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'N': [
-        0x0000,0x300C,0x380C,0x3C0C,0x3E0C,0x370C,0x338C,0x31CC,
-        0x30EC,0x307C,0x303C,0x301C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'O': [
-        0x0000,0x0FF0,0x1C38,0x300C,0x300C,0x300C,0x300C,0x300C,
-        0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'P': [
-        0x0000,0x3FF0,0x3018,0x300C,0x300C,0x3018,0x3FF0,0x3000,
-        0x3000,0x3000,0x3000,0x3000,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'R': [
-        0x0000,0x3FF0,0x3018,0x300C,0x300C,0x3018,0x3FF0,0x3070,
-        0x3038,0x301C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'S': [
-        0x0000,0x0FF0,0x1C38,0x3000,0x3000,0x1C00,0x0FF0,0x0038,
-        0x000C,0x000C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'T': [
-        0x0000,0x3FFC,0x0180,0x0180,0x0180,0x0180,0x0180,0x0180,
-        0x0180,0x0180,0x0180,0x0180,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'V': [
-        0x0000,0x300C,0x300C,0x300C,0x1818,0x1818,0x0C30,0x0C30,
-        0x0660,0x0660,0x03C0,0x0180,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'W': [
-        0x0000,0x300C,0x300C,0x300C,0x300C,0x338C,0x36DC,0x3E7C,
-        0x3C3C,0x381C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'a': [
-        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x001C,0x000C,0x0FFC,
-        0x1C0C,0x300C,0x300C,0x1FFC,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'd': [
-        0x0000,0x000C,0x000C,0x000C,0x0FEC,0x1C3C,0x381C,0x300C,
-        0x300C,0x381C,0x1C3C,0x0FEC,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'e': [
-        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x1C38,0x300C,0x3FFC,
-        0x3000,0x3000,0x1C00,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'i': [
-        0x0000,0x0180,0x0180,0x0000,0x0780,0x0180,0x0180,0x0180,
-        0x0180,0x0180,0x0180,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'l': [
-        0x0000,0x0700,0x0300,0x0300,0x0300,0x0300,0x0300,0x0300,
-        0x0300,0x0300,0x0300,0x0FC0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'm': [
-        0x0000,0x0000,0x0000,0x0000,0x7EF8,0x3318,0x330C,0x330C,
-        0x330C,0x330C,0x330C,0x330C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'n': [
-        0x0000,0x0000,0x0000,0x0000,0x3BF0,0x3E18,0x3C0C,0x300C,
-        0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'o': [
-        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x1C38,0x300C,0x300C,
-        0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'p': [
-        0x0000,0x0000,0x0000,0x0000,0x3FF0,0x3018,0x300C,0x300C,
-        0x3018,0x3FF0,0x3000,0x3000,0x3000,0x0000,0x0000,0x0000,
-    ],
-    'q': [
-        0x0000,0x0000,0x0000,0x0000,0x0FFC,0x180C,0x300C,0x300C,
-        0x180C,0x0FFC,0x000C,0x000C,0x000C,0x0000,0x0000,0x0000,
-    ],
-    'r': [
-        0x0000,0x0000,0x0000,0x0000,0x0DF0,0x0F38,0x0E00,0x0E00,
-        0x0E00,0x0E00,0x0E00,0x0E00,0x0000,0x0000,0x0000,0x0000,
-    ],
-    't': [
-        0x0000,0x0600,0x0600,0x0600,0x1FE0,0x0600,0x0600,0x0600,
-        0x0600,0x0600,0x0700,0x03E0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'u': [
-        0x0000,0x0000,0x0000,0x0000,0x300C,0x300C,0x300C,0x300C,
-        0x300C,0x300C,0x1C3C,0x0FEC,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'y': [
-        0x0000,0x0000,0x0000,0x0000,0x300C,0x1818,0x0C30,0x0660,
-        0x03C0,0x0180,0x0300,0x0600,0x0C00,0x0000,0x0000,0x0000,
-    ],
-    '-': [
-        0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x1FF8,0x1FF8,
-        0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,
-    ],
-    '/': [
-        0x0000,0x0008,0x0010,0x0020,0x0040,0x0080,0x0100,0x0200,
-        0x0400,0x0800,0x1000,0x2000,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'c': [
-        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x1C38,0x3000,0x3000,
-        0x3000,0x3000,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'h': [
-        0x0000,0x3000,0x3000,0x3000,0x3FF0,0x3818,0x300C,0x300C,
-        0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'g': [
-        0x0000,0x0000,0x0000,0x0000,0x0FEC,0x1C3C,0x300C,0x300C,
-        0x1C3C,0x0FEC,0x000C,0x001C,0x0FF0,0x0000,0x0000,0x0000,
-    ],
-    'x': [
-        0x0000,0x0000,0x0000,0x0000,0x300C,0x1818,0x0C30,0x0660,
-        0x0660,0x0C30,0x1818,0x300C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'L': [
-        0x0000,0x3000,0x3000,0x3000,0x3000,0x3000,0x3000,0x3000,
-        0x3000,0x3000,0x3000,0x3FFC,0x0000,0x0000,0x0000,0x0000,
-    ],
-    's': [
-        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x1C00,0x1C00,0x0FF0,
-        0x003C,0x003C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'f': [
-        0x0000,0x03E0,0x0600,0x0600,0x1FC0,0x0600,0x0600,0x0600,
-        0x0600,0x0600,0x0600,0x0600,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'G': [
-        0x0000,0x0FF0,0x1C38,0x3000,0x3000,0x3000,0x33FC,0x300C,
-        0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'U': [
-        0x0000,0x300C,0x300C,0x300C,0x300C,0x300C,0x300C,0x300C,
-        0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'Q': [
-        0x0000,0x0FF0,0x1C38,0x300C,0x300C,0x300C,0x300C,0x300C,
-        0x336C,0x1C38,0x0FF8,0x000C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'J': [
-        0x0000,0x01FC,0x0018,0x0018,0x0018,0x0018,0x0018,0x0018,
-        0x0018,0x3018,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'K': [
-        0x0000,0x300C,0x3018,0x3030,0x3060,0x30C0,0x3F80,0x30C0,
-        0x3060,0x3030,0x3018,0x300C,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'b': [
-        0x0000,0x3000,0x3000,0x3000,0x3FF0,0x3818,0x300C,0x300C,
-        0x300C,0x3818,0x3FF0,0x0000,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'v': [
-        0x0000,0x0000,0x0000,0x0000,0x300C,0x1818,0x1818,0x0C30,
-        0x0C30,0x0660,0x03C0,0x0180,0x0000,0x0000,0x0000,0x0000,
-    ],
-    'w': [
-        0x0000,0x0000,0x0000,0x0000,0x300C,0x300C,0x338C,0x338C,
-        0x36DC,0x3C3C,0x1818,0x1818,0x0000,0x0000,0x0000,0x0000,
-    ],
-    ',': [
-        0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,
-        0x0000,0x0380,0x0380,0x0300,0x0600,0x0000,0x0000,0x0000,
-    ],
-}
+"""
+16x16 bitmap font, packed for flash
+Generated by utils/gen_font16.py from utils/font16_src.py - do not edit.
+
+Glyph i (the i-th character of CHARS) is DATA[32*i:32*i+32]: 16 rows of
+big-endian 16-bit values, MSB = leftmost pixel. BOXES holds each
+glyph's ink bounding box, computed at import.
+"""
+
+CHARS = ' 0123456789.:%ABCDEFHIMNOPRSTVWadeilmnopqrtuy-/chgxLsfGUQJKbvw,'
+
+DATA = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # ' '
+    b'\x00\x00\x0f\xf0\x1c\x38\x38\x1c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x38\x1c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00'  # '0'
+    b'\x00\x00\x03\x00\x07\x00\x0f\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x0f\xf0\x00\x00\x00\x00\x00\x00'  # '1'
+    b'\x00\x00\x0f\xf0\x1c\x38\x30\x0c\x00\x0c\x00\x18\x00\x70\x01\xc0\x07\x00\x0c\x00\x18\x00\x30\x00\x3f\xfc\x00\x00\x00\x00\x00\x00'  # '2'
+    b'\x00\x00\x0f\xf0\x1c\x38\x00\x0c\x00\x0c\x00\x38\x03\xf0\x00\x38\x00\x0c\x00\x0c\x00\x0c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00'  # '3'
+    b'\x00\x00\x00\x70\x00\xf0\x01\xb0\x03\x30\x06\x30\x0c\x30\x18\x30\x3f\xfc\x00\x30\x00\x30\x00\x30\x00\x30\x00\x00\x00\x00\x00\x00'  # '4'
+    b'\x00\x00\x3f\xfc\x30\x00\x30\x00\x30\x00\x3f\xf0\x00\x38\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00'  # '5'
+    b'\x00\x00\x03\xf0\x0e\x00\x1c\x00\x30\x00\x3f\xf0\x3c\x38\x30\x0c\x30\x0c\x30\x0c\x3c\x38\x1f\xf0\x0f\xe0\x00\x00\x00\x00\x00\x00'  # '6'
+    b'\x00\x00\x3f\xfc\x00\x0c\x00\x18\x00\x30\x00\x60\x00\xc0\x01\x80\x01\x80\x03\x00\x03\x00\x03\x00\x03\x00\x00\x00\x00\x00\x00\x00'  # '7'
+    b'\x00\x00\x0f\xf0\x1c\x38\x30\x0c\x30\x0c\x1c\x38\x0f\xf0\x1c\x38\x30\x0c\x30\x0c\x30\x0c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00'  # '8'
+    b'\x00\x00\x0f\xf0\x1c\x38\x30\x0c\x30\x0c\x30\x0c\x1c\x3c\x0f\xfc\x00\x18\x00\x30\x00\x60\x01\xc0\x0f\x00\x00\x00\x00\x00\x00\x00'  # '9'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x03\x80\x03\x80\x00\x00\x00\x00\x00\x00'  # '.'
+    b'\x00\x00\x00\x00\x00\x00\x03\x80\x03\x80\x03\x80\x00\x00\x00\x00\x00\x00\x03\x80\x03\x80\x03\x80\x00\x00\x00\x00\x00\x00\x00\x00'  # ':'
+    b'\x00\x00\x38\x04\x38\x08\x38\x10\x00\x20\x00\x40\x00\x80\x01\x00\x02\x00\x04\x00\x08\x00\x10\x1c\x20\x1c\x00\x00\x00\x00\x00\x00'  # '%'
+    b'\x00\x00\x03\xc0\x07\xe0\x0e\x70\x1c\x38\x38\x1c\x30\x0c\x30\x0c\x3f\xfc\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00'  # 'A'
+    b'\x00\x00\x3f\xf0\x30\x18\x30\x0c\x30\x0c\x30\x18\x3f\xf0\x30\x18\x30\x0c\x30\x0c\x30\x18\x3f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'B'
+    b'\x00\x00\x0f\xf0\x1c\x38\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'C'
+    b'\x00\x00\x3f\xe0\x30\x70\x30\x38\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x38\x30\x70\x3f\xe0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'D'
+    b'\x00\x00\x3f\xfc\x30\x00\x30\x00\x30\x00\x3f\xf0\x3f\xf0\x30\x00\x30\x00\x30\x00\x30\x00\x3f\xfc\x00\x00\x00\x00\x00\x00\x00\x00'  # 'E'
+    b'\x00\x00\x3f\xfc\x30\x00\x30\x00\x30\x00\x3f\xf0\x3f\xf0\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 'F'
+    b'\x00\x00\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x3f\xfc\x3f\xfc\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'H'
+    b'\x00\x00\x0f\xf0\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'I'
+    b'\x00\x00\x30\x0c\x38\x1c\x3c\x3c\x3e\x7c\x36\xdc\x33\x8c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'M'
+    b'\x00\x00\x30\x0c\x38\x0c\x3c\x0c\x3e\x0c\x37\x0c\x33\x8c\x31\xcc\x30\xec\x30\x7c\x30\x3c\x30\x1c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'N'
+    b'\x00\x00\x0f\xf0\x1c\x38\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'O'
+    b'\x00\x00\x3f\xf0\x30\x18\x30\x0c\x30\x0c\x30\x18\x3f\xf0\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 'P'
+    b'\x00\x00\x3f\xf0\x30\x18\x30\x0c\x30\x0c\x30\x18\x3f\xf0\x30\x70\x30\x38\x30\x1c\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'R'
+    b'\x00\x00\x0f\xf0\x1c\x38\x30\x00\x30\x00\x1c\x00\x0f\xf0\x00\x38\x00\x0c\x00\x0c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'S'
+    b'\x00\x00\x3f\xfc\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00'  # 'T'
+    b'\x00\x00\x30\x0c\x30\x0c\x30\x0c\x18\x18\x18\x18\x0c\x30\x0c\x30\x06\x60\x06\x60\x03\xc0\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00'  # 'V'
+    b'\x00\x00\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x33\x8c\x36\xdc\x3e\x7c\x3c\x3c\x38\x1c\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'W'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x1c\x00\x0c\x0f\xfc\x1c\x0c\x30\x0c\x30\x0c\x1f\xfc\x00\x00\x00\x00\x00\x00\x00\x00'  # 'a'
+    b'\x00\x00\x00\x0c\x00\x0c\x00\x0c\x0f\xec\x1c\x3c\x38\x1c\x30\x0c\x30\x0c\x38\x1c\x1c\x3c\x0f\xec\x00\x00\x00\x00\x00\x00\x00\x00'  # 'd'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x1c\x38\x30\x0c\x3f\xfc\x30\x00\x30\x00\x1c\x00\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'e'
+    b'\x00\x00\x01\x80\x01\x80\x00\x00\x07\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'i'
+    b'\x00\x00\x07\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x0f\xc0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'l'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x7e\xf8\x33\x18\x33\x0c\x33\x0c\x33\x0c\x33\x0c\x33\x0c\x33\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'm'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x3b\xf0\x3e\x18\x3c\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'n'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x1c\x38\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'o'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xf0\x30\x18\x30\x0c\x30\x0c\x30\x18\x3f\xf0\x30\x00\x30\x00\x30\x00\x00\x00\x00\x00\x00\x00'  # 'p'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xfc\x18\x0c\x30\x0c\x30\x0c\x18\x0c\x0f\xfc\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00'  # 'q'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0d\xf0\x0f\x38\x0e\x00\x0e\x00\x0e\x00\x0e\x00\x0e\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 'r'
+    b'\x00\x00\x06\x00\x06\x00\x06\x00\x1f\xe0\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x07\x00\x03\xe0\x00\x00\x00\x00\x00\x00\x00\x00'  # 't'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x1c\x3c\x0f\xec\x00\x00\x00\x00\x00\x00\x00\x00'  # 'u'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x30\x0c\x18\x18\x0c\x30\x06\x60\x03\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x00\x00\x00\x00\x00\x00'  # 'y'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf8\x1f\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # '-'
+    b'\x00\x00\x00\x08\x00\x10\x00\x20\x00\x40\x00\x80\x01\x00\x02\x00\x04\x00\x08\x00\x10\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # '/'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x1c\x38\x30\x00\x30\x00\x30\x00\x30\x00\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'c'
+    b'\x00\x00\x30\x00\x30\x00\x30\x00\x3f\xf0\x38\x18\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'h'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xec\x1c\x3c\x30\x0c\x30\x0c\x1c\x3c\x0f\xec\x00\x0c\x00\x1c\x0f\xf0\x00\x00\x00\x00\x00\x00'  # 'g'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x30\x0c\x18\x18\x0c\x30\x06\x60\x06\x60\x0c\x30\x18\x18\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'x'
+    b'\x00\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x3f\xfc\x00\x00\x00\x00\x00\x00\x00\x00'  # 'L'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x1c\x00\x1c\x00\x0f\xf0\x00\x3c\x00\x3c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 's'
+    b'\x00\x00\x03\xe0\x06\x00\x06\x00\x1f\xc0\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 'f'
+    b'\x00\x00\x0f\xf0\x1c\x38\x30\x00\x30\x00\x30\x00\x33\xfc\x30\x0c\x30\x0c\x30\x0c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'G'
+    b'\x00\x00\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'U'
+    b'\x00\x00\x0f\xf0\x1c\x38\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x33\x6c\x1c\x38\x0f\xf8\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'Q'
+    b'\x00\x00\x01\xfc\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x30\x18\x1c\x38\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 'J'
+    b'\x00\x00\x30\x0c\x30\x18\x30\x30\x30\x60\x30\xc0\x3f\x80\x30\xc0\x30\x60\x30\x30\x30\x18\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00'  # 'K'
+    b'\x00\x00\x30\x00\x30\x00\x30\x00\x3f\xf0\x38\x18\x30\x0c\x30\x0c\x30\x0c\x38\x18\x3f\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 'b'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x30\x0c\x18\x18\x18\x18\x0c\x30\x0c\x30\x06\x60\x03\xc0\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00'  # 'v'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x30\x0c\x30\x0c\x33\x8c\x33\x8c\x36\xdc\x3c\x3c\x18\x18\x18\x18\x00\x00\x00\x00\x00\x00\x00\x00'  # 'w'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x03\x80\x03\x00\x06\x00\x00\x00\x00\x00\x00\x00'  # ','
+)
+
+_DATA = memoryview(DATA)
+
+
+def glyph(ch):
+    """Return the 32-byte row data for ch as a memoryview, or None"""
+    i = CHARS.find(ch) if len(ch) == 1 else -1
+    if i < 0:
+        return None
+    return _DATA[i * 32:i * 32 + 32]
+
+
+def _ink_boxes():
+    """Per-glyph ink bounding box: top, bottom, left, right (inclusive).
+    Blank glyphs get top=16 so they can be skipped entirely."""
+    boxes = bytearray(len(CHARS) * 4)
+    for i in range(len(CHARS)):
+        top = 16; bottom = 0; left = 16; right = 0
+        for row in range(16):
+            bits = (DATA[i * 32 + row * 2] << 8) | DATA[i * 32 + row * 2 + 1]
+            if not bits:
+                continue
+            if row < top:
+                top = row
+            bottom = row
+            col = 0
+            while not bits & (0x8000 >> col):
+                col += 1
+            if col < left:
+                left = col
+            col = 15
+            while not bits & (0x8000 >> col):
+                col -= 1
+            if col > right:
+                right = col
+        boxes[i * 4:i * 4 + 4] = bytes((top, bottom, left, right))
+    return boxes
+
+
+# Computed once at import
+BOXES = _ink_boxes()
+
+
+def bbox(ch):
+    """Return (top, bottom, left, right) of ch's ink, or None if blank/unknown"""
+    i = CHARS.find(ch) if len(ch) == 1 else -1
+    if i < 0 or BOXES[i * 4] > 15:
+        return None
+    return (BOXES[i * 4], BOXES[i * 4 + 1], BOXES[i * 4 + 2], BOXES[i * 4 + 3])
+
+
+class _Glyph:
+    """Read-only 16-row view of a glyph; glyph[row] -> 16-bit int"""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __getitem__(self, row):
+        return (self._rows[row * 2] << 8) | self._rows[row * 2 + 1]
+
+    def __len__(self):
+        return 16
+
+
+class _Font16:
+    """dict-like accessor compatible with the old FONT16 dict"""
+
+    def get(self, ch, default=None):
+        rows = glyph(ch)
+        return default if rows is None else _Glyph(rows)
+
+    def __getitem__(self, ch):
+        rows = glyph(ch)
+        if rows is None:
+            raise KeyError(ch)
+        return _Glyph(rows)
+
+    def __contains__(self, ch):
+        return glyph(ch) is not None
+
+    def __len__(self):
+        return len(CHARS)
+
+    def keys(self):
+        return iter(CHARS)
+
+
+FONT16 = _Font16()
@@ -0,0 +1,122 @@
+"""
+Touch gesture recognizer: tap, long-press, swipe
+=================================================
+Fed one screen-coordinate sample per poll while the pen is down, then
+up() on release. Positions are smoothed with a running median of the
+last 3 samples held in a fixed array, so feeding allocates nothing.
+
+Latency is bounded in samples: a tap is reported while the pen is
+still down, once it has stayed within SLOP_PX for TAP_MS (or at
+release, for a shorter press); a swipe as soon as the stroke passes
+SWIPE_PX; a long-press once the pen has stayed within SLOP_PX for
+LONG_MS. A long-press is always preceded by the tap of the same
+stroke, so a tap action should not conflict with the long-press one.
+Once a tap has been reported, the stroke cannot become a swipe.
+"""
+
+import time
+
+# Event codes; touch.py queues these next to PRESS(1) / RELEASE(3)
+LONG = 2
+TAP = 4
+SWIPE_LEFT = 5
+SWIPE_RIGHT = 6
+SWIPE_UP = 7
+SWIPE_DOWN = 8
+
+NAMES = {LONG: "long", TAP: "tap", SWIPE_LEFT: "swipe_left",
+         SWIPE_RIGHT: "swipe_right", SWIPE_UP: "swipe_up",
+         SWIPE_DOWN: "swipe_down"}
+
+
+def _med3(a, b, c):
+    if a > b:
+        a, b = b, a
+    if b > c:
+        b = c
+    return a if a > b else b
+
+
+class Recognizer:
+    """Tunable thresholds are plain attributes (pixels / ms)"""
+
+    SLOP_PX = 14        # movement still counted as a stationary press
+    SWIPE_PX = 60       # travel that makes a stroke a swipe
+    TAP_MS = 60         # stationary press that is reported as a tap
+    LONG_MS = 600       # stationary press that becomes a long-press
+
+    def __init__(self):
+        self._hx = [0, 0, 0]
+        self._hy = [0, 0, 0]
+        self._n = 0
+        self.x0 = 0         # smoothed start of the current stroke
+        self.y0 = 0
+        self.x = 0          # latest smoothed position
+        self.y = 0
+        self._t0 = 0
+        self._moved = False
+        self._tapped = False    # TAP already reported for this stroke
+        self._done = False      # final gesture already reported
+
+    def _smooth(self, x, y):
+        """Update self.x/self.y with the median of the last 3 samples"""
+        i = self._n % 3
+        self._hx[i] = x
+        self._hy[i] = y
+        self._n += 1
+        if self._n < 3:
+            self.x = x
+            self.y = y
+            return
+        hx = self._hx
+        hy = self._hy
+        self.x = _med3(hx[0], hx[1], hx[2])
+        self.y = _med3(hy[0], hy[1], hy[2])
+
+    def down(self, x, y, t):
+        """First sample of a stroke"""
+        self._n = 0
+        self._smooth(x, y)
+        self.x0 = x
+        self.y0 = y
+        self._t0 = t
+        self._moved = False
+        self._tapped = False
+        self._done = False
+        return 0
+
+    def move(self, x, y, t):
+        """Next sample while the pen is down. Returns a gesture or 0."""
+        self._smooth(x, y)
+        if self._done:
+            return 0
+        dx = self.x - self.x0
+        dy = self.y - self.y0
+        adx = dx if dx >= 0 else -dx
+        ady = dy if dy >= 0 else -dy
+        if adx > self.SLOP_PX or ady > self.SLOP_PX:
+            self._moved = True
+        if not self._tapped and (adx >= self.SWIPE_PX or ady >= self.SWIPE_PX):
+            self._done = True
+            if adx >= ady:
+                return SWIPE_RIGHT if dx > 0 else SWIPE_LEFT
+            return SWIPE_DOWN if dy > 0 else SWIPE_UP
+        if self._moved:
+            return 0
+        held = time.ticks_diff(t, self._t0)
+        if not self._tapped:
+            if held >= self.TAP_MS:
+                self._tapped = True
+                return TAP
+        elif held >= self.LONG_MS:
+            self._done = True
+            return LONG
+        return 0
+
+    def up(self, t):
+        """Pen released. Returns TAP for a press too short to have been
+        reported while down, else 0."""
+        if self._done or self._tapped:
+            return 0
+        self._done = True
+        return 0 if self._moved else TAP
@@ -0,0 +1,74 @@
+"""
+Screen layout shared by drawing (display.py) and touch (main.py)
+================================================================
+Geometry is computed once at import. Hit-testing is arithmetic:
+a tap maps to a grid cell with two divisions, no scan over zones.
+Changing card sizes or adding a page is an edit here only.
+"""
+
+SCREEN_W = 480
+SCREEN_H = 320
+
+
+class Grid:
+    """Uniform grid of named cells, centered horizontally.
+    names lists the cells row by row; None leaves a cell empty."""
+
+    def __init__(self, cols, rows, cell_w, cell_h, gap, top, names,
+                 width=SCREEN_W):
+        self.cols = cols
+        self.rows = rows
+        self.cell_w = cell_w
+        self.cell_h = cell_h
+        self.gap = gap
+        self.top = top
+        self.names = tuple(names)
+        self.x0 = (width - (cols * cell_w + (cols - 1) * gap)) // 2
+        self.pitch_x = cell_w + gap
+        self.pitch_y = cell_h + gap
+        self.width = cols * cell_w + (cols - 1) * gap
+        self.bottom = top + rows * cell_h + (rows - 1) * gap
+        self._rects = {}
+        for i, name in enumerate(self.names):
+            if name is not None:
+                self._rects[name] = (self.x0 + (i % cols) * self.pitch_x,
+                                     top + (i // cols) * self.pitch_y,
+                                     cell_w, cell_h)
+
+    def rect(self, name):
+        """(x, y, w, h) of a named cell"""
+        return self._rects[name]
+
+    def row_rect(self, row):
+        """(x, y, w, h) spanning a whole row, e.g. for an overlay"""
+        return (self.x0, self.top + row * self.pitch_y, self.width, self.cell_h)
+
+    def hit(self, x, y):
+        """Name of the cell containing (x, y), or None for gaps/margins.
+        Edges count as inside, as the old zone table did."""
+        dx = x - self.x0
+        dy = y - self.top
+        if dx < 0 or dy < 0:
+            return None
+        c = dx // self.pitch_x
+        r = dy // self.pitch_y
+        if c >= self.cols or r >= self.rows:
+            return None
+        if dx - c * self.pitch_x > self.cell_w or dy - r * self.pitch_y > self.cell_h:
+            return None
+        return self.names[r * self.cols + c]
+
+
+# --- Dashboard page ---
+TITLE_H = 26
+
+DASH = Grid(3, 3, 152, 78, 5, TITLE_H + 2, (
+    'co2', 'temp', 'humid',
+    'light', 'air', 'pressure',
+    'sd', 'wifi', 'time'))
+
+# Detail overlays (WIFI, TIME) cover the bottom card row
+OVERLAY = DASH.row_rect(2)
+
+# Bottom bar with the IP address
+BOTTOM_Y = DASH.bottom + 2
@@ -7,60 +7,140 @@ import time
 import gc
 import machine
 import ntptime
+import uasyncio as asyncio
+import config
 import display
+import gesture
+import layout
 import wifi
 import sdlog
 import audio
 from config import WIFI_SSID, WIFI_PASSWORD, WIFI_NETWORKS, I2C_SCL_PIN, I2C_SDA_PIN, I2C_FREQUENCY, TIMEZONE_OFFSET, LOG_INTERVAL, TOUCH_ENABLED
 
+# Fast boot: WiFi associates in the background while the SD card and
+# sensors come up, fixed pauses are skipped and the dashboard appears
+# at the first valid reading
+FAST_BOOT = getattr(config, "FAST_BOOT", False)
+FIRST_READING_TIMEOUT_MS = 12000
+
+# MPL3115A2 oversampling: 128 = ~512 ms conversions, least noise
+PRESSURE_OVERSAMPLE = getattr(config, "PRESSURE_OVERSAMPLE", 128)
+
 print("[Main] ESP32 EnvMonitor starting...")
 
-# Init display
-display.init()
+# Boot timeline: (phase, ms since reset), printed and logged to SD
+boot_marks = []
 
-# === BOOT SEQUENCE ===
-# Phase 1: Logo with line reveal
-if display.show_logo("logo.bin"):
-    time.sleep(2)
 
-# Phase 2: Title screen with scan effect
-display.boot_title()
-time.sleep_ms(500)
+def boot_mark(phase):
+    boot_marks.append((phase, time.ticks_ms()))
 
-# Phase 3: Init systems with progress bar
-display.boot_progress(5, "Connecting WiFi...")
-ip, wifi_ok = wifi.connect_multi(WIFI_NETWORKS)
-if wifi_ok:
-    display.boot_progress(25, "WiFi: " + ip, display.GREEN)
-    print("[Main] WiFi:", ip)
-else:
-    display.boot_progress(25, "WiFi: Failed", display.RED)
-    print("[Main] WiFi failed")
-time.sleep_ms(400)
 
-# NTP sync
-ntp_ok = False
-if wifi_ok:
-    display.boot_progress(35, "Syncing time...")
+def boot_report():
+    """Print the boot timeline and append it to /sd/boot.log"""
+    prev = 0
+    for phase, ms in boot_marks:
+        print("[Boot] {:<10} {:>6} ms  (+{})".format(phase, ms, ms - prev))
+        prev = ms
+    sdlog.log_boot(boot_marks, FAST_BOOT)
+
+
+def sync_ntp():
+    """Set the RTC from NTP. Returns True on success."""
     try:
         ntptime.host = "time.google.com"
         ntptime.settime()
-        ntp_ok = True
-        display.boot_progress(45, "NTP synced", display.GREEN)
         print("[Main] NTP synced")
+        return True
     except Exception as e:
-        display.boot_progress(45, "NTP failed", display.RED)
         print("[Main] NTP error:", e)
-time.sleep_ms(400)
+        return False
+
+
+def poll_wifi():
+    """Finish a background wifi.begin(); sync NTP once it connects"""
+    global wifi_ok, ntp_ok
+    if not wifi.pending():
+        return
+    result = wifi.poll()
+    if result is None:
+        return
+    ip, wifi_ok = result
+    boot_mark("wifi")
+    if wifi_ok:
+        print("[Main] WiFi:", ip)
+        ntp_ok = sync_ntp()
+        boot_mark("ntp")
+    else:
+        print("[Main] WiFi failed")
+
+
+boot_mark("start")
+ip, wifi_ok = "", False
+ntp_ok = False
+if FAST_BOOT:
+    wifi.begin(WIFI_NETWORKS)
+
+# Init display
+display.init()
+boot_mark("display")
+
+# === BOOT SEQUENCE ===
+# Phase 1: Logo with line reveal (compressed logo.rle, else raw logo.bin).
+# Fast boot pushes it in one window instead of row by row.
+reveal = not FAST_BOOT
+if (display.show_logo("logo.rle", reveal=reveal) or
+        display.show_logo("logo.bin", reveal=reveal)):
+    if not FAST_BOOT:
+        time.sleep(2)
+boot_mark("logo")
+
+# Fast boot mounts the SD card while the logo is still up
+sd_ok = False
+if FAST_BOOT:
+    sd_ok = sdlog.init()
+    boot_mark("sd")
+
+# Phase 2: Title screen with scan effect
+display.boot_title()
+if not FAST_BOOT:
+    time.sleep_ms(500)
+boot_mark("title")
 
-# SD Card
-display.boot_progress(50, "Mounting SD card...")
-sd_ok = sdlog.init()
+# Phase 3: Init systems with progress bar
+if not FAST_BOOT:
+    display.boot_progress(5, "Connecting WiFi...")
+    ip, wifi_ok = wifi.connect_multi(WIFI_NETWORKS)
+    if wifi_ok:
+        display.boot_progress(25, "WiFi: " + ip, display.GREEN)
+        print("[Main] WiFi:", ip)
+    else:
+        display.boot_progress(25, "WiFi: Failed", display.RED)
+        print("[Main] WiFi failed")
+    boot_mark("wifi")
+    time.sleep_ms(400)
+
+    # NTP sync
+    if wifi_ok:
+        display.boot_progress(35, "Syncing time...")
+        ntp_ok = sync_ntp()
+        if ntp_ok:
+            display.boot_progress(45, "NTP synced", display.GREEN)
+        else:
+            display.boot_progress(45, "NTP failed", display.RED)
+        boot_mark("ntp")
+    time.sleep_ms(400)
+
+    # SD Card
+    display.boot_progress(50, "Mounting SD card...")
+    sd_ok = sdlog.init()
+    boot_mark("sd")
 if sd_ok:
     display.boot_progress(60, "SD card ready", display.GREEN)
 else:
     display.boot_progress(60, "No SD card", display.RED)
-time.sleep_ms(400)
+if not FAST_BOOT:
+    time.sleep_ms(400)
 
 # Init I2C + sensors
 display.boot_progress(65, "Scanning sensors...")
@@ -79,12 +159,20 @@ try:
     if 0x62 in devices:
         display.boot_progress(70, "Init CO2 sensor...")
         from scd4x import SCD4X
-        sensor = SCD4X(i2c)
-        sensor.stop_periodic_measurement()
-        time.sleep(1)
-        sensor.start_periodic_measurement()
+        if FAST_BOOT:
+            # Init commands run in the background: each init_poll() issues
+            # the next one once the last has executed, so the 500 ms stop
+            # overlaps the other sensors' init. The loop below finishes it.
+            sensor = SCD4X(i2c, settle=False, blocking=False)
+            sensor.init_poll()
+        else:
+            sensor = SCD4X(i2c)
+            sensor.stop_periodic_measurement()
+            time.sleep(1)
+            sensor.start_periodic_measurement()
+            time.sleep(2)
         print("[Main] SCD4x OK")
-        time.sleep(2)
+    poll_wifi()
 
     if 0x10 in devices:
         display.boot_progress(80, "Init light sensor...")
@@ -101,20 +189,48 @@ try:
     if 0x60 in devices:
         display.boot_progress(90, "Init pressure sensor...")
         from mpl3115a2 import MPL3115A2
-        pressure_sensor = MPL3115A2(i2c)
+        # One-shot: each pass collects the conversion started by the
+        # previous one, so reading it never waits on the ADC
+        pressure_sensor = MPL3115A2(i2c, oversample=PRESSURE_OVERSAMPLE,
+                                    oneshot=True)
+        pressure_sensor.start()
         print("[Main] MPL3115A2 OK")
 
 except Exception as e:
     print("[Main] Sensor error:", e)
-
-display.boot_progress(95, "Audio init...")
-try:
-    display.boot_progress(100, "Ready!", display.GREEN)
-    audio.boot_melody()
-except Exception as e:
-    print("[Main] Audio error:", e)
+boot_mark("sensors")
+
+if FAST_BOOT:
+    # Keep WiFi moving until the SCD4x has its first measurement
+    display.boot_progress(95, "Waiting for data...")
+    deadline = time.ticks_add(time.ticks_ms(), FIRST_READING_TIMEOUT_MS)
+    while sensor and time.ticks_diff(deadline, time.ticks_ms()) > 0:
+        poll_wifi()
+        try:
+            if not sensor.init_poll():
+                time.sleep_ms(min(100, sensor.remaining_ms()))
+                continue
+        except Exception as e:
+            print("[Main] SCD4x init error:", e)
+            break
+        if sensor.data_ready:
+            break
+        time.sleep_ms(100)
+    boot_mark("reading")
     display.boot_progress(100, "Ready!", display.GREEN)
-    time.sleep_ms(800)
+    try:
+        audio.beep(1000, 60)
+    except Exception as e:
+        print("[Main] Audio error:", e)
+else:
+    display.boot_progress(95, "Audio init...")
+    try:
+        display.boot_progress(100, "Ready!", display.GREEN)
+        audio.boot_melody()
+    except Exception as e:
+        print("[Main] Audio error:", e)
+        display.boot_progress(100, "Ready!", display.GREEN)
+        time.sleep_ms(800)
 display.fill_screen(display.BLACK)
 
 # Touch screen
@@ -136,18 +252,108 @@ led_b = machine.Pin(17, machine.Pin.OUT, value=1)
 batt_adc = machine.ADC(machine.Pin(34))
 batt_adc.atten(machine.ADC.ATTN_11DB)  # Full range 0-3.3V
 
-def read_battery_pct():
-    """Read battery percentage from ADC. Returns -1 if no battery."""
-    raw = batt_adc.read()
+def read_battery_v():
+    """Battery voltage from ADC, averaged over 8 reads"""
+    raw = 0
+    for _ in range(8):
+        raw += batt_adc.read()
     # ESP32 ADC is 12-bit (0-4095), with voltage divider on board
     # Typical: 4.2V full = ~2.1V at ADC, 3.0V empty = ~1.5V at ADC
     # With 11dB atten, ~0-3.6V range
-    voltage = raw / 4095 * 3.6 * 2  # x2 for voltage divider
+    return raw / 8 / 4095 * 3.6 * 2  # x2 for voltage divider
+
+def battery_pct(voltage):
     if voltage < 2.5:
         return -1  # No battery connected
     pct = int((voltage - 3.0) / (4.2 - 3.0) * 100)
     return max(0, min(100, pct))
 
+def read_battery_pct():
+    """Read battery percentage from ADC. Returns -1 if no battery."""
+    return battery_pct(read_battery_v())
+
+
+# Power policy. On USB the SCD4x measures every 5 s and everything
+# follows LOG_INTERVAL. On battery it drops to low-power periodic (30 s),
+# and below BATT_LOW_PCT to single-shot readings; logging and display
+# refresh slow down with it. Set USB_SENSE_PIN to a GPIO that reads high
+# with VBUS present and that decides it. Without one, USB is inferred
+# from the cell voltage: with no cell the ADC reads ~0, and while
+# charging the cell is held near 4.2 V. A freshly charged cell rests
+# there too, so the voltage has to stay above USB_ON_V for USB_SAMPLES
+# readings without falling; until then the board is taken to be on
+# battery. USB is given up as soon as the voltage falls below USB_OFF_V,
+# drops USB_DROP_V from the recent peak (charger unplugged) or trends
+# down. The low-battery threshold has hysteresis so a sagging cell
+# doesn't flap between modes.
+# Single-shot needs an SCD41; the driver measures in low-power mode on
+# an SCD40.
+# profile: (scd4x mode name, sensor read s, SD log s, display refresh s)
+POWER_PROFILES = {
+    'usb':     ("periodic", LOG_INTERVAL, LOG_INTERVAL, LOG_INTERVAL),
+    'battery': ("low-power", 30, max(LOG_INTERVAL, 60), 30),
+    'low':     ("single-shot", 120, max(LOG_INTERVAL, 300), 120),
+}
+USB_ON_V = 4.15
+USB_OFF_V = 4.05
+USB_SAMPLES = 4         # readings the voltage must hold before 'usb'
+USB_DROP_V = 0.03       # fall from the recent peak that means unplugged
+USB_NOISE_V = 0.015     # ADC noise allowed before a trend counts as falling
+BATT_LOW_PCT = 20
+BATT_OK_PCT = 30
+POWER_MODE = getattr(config, "POWER_MODE", "auto")
+
+_usb_pin = getattr(config, "USB_SENSE_PIN", None)
+usb_sense = machine.Pin(_usb_pin, machine.Pin.IN) if _usb_pin is not None else None
+vbatt_hist = []         # last USB_SAMPLES battery voltages, oldest first
+
+
+def on_usb(v, prev):
+    """True if the board is on USB power. v is the battery voltage just
+    read, prev the previous profile name."""
+    if usb_sense:
+        return usb_sense.value() == 1
+    if v < 2.5:
+        return True     # no cell: nothing else can be powering the board
+    hist = vbatt_hist
+    hist.append(v)
+    if len(hist) > USB_SAMPLES:
+        hist.pop(0)
+    if v < USB_OFF_V or v < max(hist) - USB_DROP_V:
+        return False
+    if hist[-1] < hist[0] - USB_NOISE_V:
+        return False    # a discharging cell, however full
+    if prev == 'usb':
+        return True
+    return (len(hist) == USB_SAMPLES and min(hist) >= USB_ON_V
+            and hist[-1] >= hist[0])
+
+
+def choose_power(prev):
+    """Profile name for the current supply, given the previous one"""
+    if POWER_MODE in POWER_PROFILES:
+        return POWER_MODE
+    v = read_battery_v()
+    if on_usb(v, prev):
+        return 'usb'
+    pct = battery_pct(v)
+    if pct <= BATT_LOW_PCT or (prev == 'low' and pct < BATT_OK_PCT):
+        return 'low'
+    return 'battery'
+
+
+def update_power():
+    """Re-evaluate the supply; switch the SCD4x mode on a change.
+    Returns the active profile."""
+    name = choose_power(state['power'])
+    if name != state['power']:
+        print("[Main] Power:", name)
+        state['power'] = name
+        if sensor:
+            from scd4x import MODE_NAMES
+            sensor.set_mode(MODE_NAMES.index(POWER_PROFILES[name][0]))
+    return POWER_PROFILES[name]
+
 def set_led(r, g, b):
     """Set RGB LED (1=on, 0=off). Inverted for common anode."""
     led_r.value(0 if r else 1)
@@ -172,258 +378,395 @@ def get_date_str():
     return "{}-{}-{}".format(t[1], t[2], t[0] % 100)
 
 
-# --- Touch zones (match dashboard card grid) ---
-# Card grid: 3x3, card_w=152, card_h=78, gap=5
-_card_w = 152
-_card_h = 78
-_gap = 5
-_row1_y = 28
-_row2_y = _row1_y + _card_h + _gap
-_row3_y = _row2_y + _card_h + _gap
-_x0 = (display.W - (3 * _card_w + 2 * _gap)) // 2
-
-TOUCH_ZONES = {
-    'co2':      (_x0, _row1_y, _card_w, _card_h),
-    'temp':     (_x0 + _card_w + _gap, _row1_y, _card_w, _card_h),
-    'humid':    (_x0 + 2 * (_card_w + _gap), _row1_y, _card_w, _card_h),
-    'light':    (_x0, _row2_y, _card_w, _card_h),
-    'air':      (_x0 + _card_w + _gap, _row2_y, _card_w, _card_h),
-    'pressure': (_x0 + 2 * (_card_w + _gap), _row2_y, _card_w, _card_h),
-    'sd':       (_x0, _row3_y, _card_w, _card_h),
-    'wifi':     (_x0 + _card_w + _gap, _row3_y, _card_w, _card_h),
-    'time':     (_x0 + 2 * (_card_w + _gap), _row3_y, _card_w, _card_h),
+# --- Runtime: uasyncio tasks sharing the latest readings ---
+# The sensor task fills `state`; render, SD logging and alerts each wake
+# on their own event when a new reading lands. Touch polls every 50 ms
+# and the network has its own task, so a reconnect, NTP resync or alert
+# tone never holds up the screen or touch.
+NTP_RESYNC_MS = 3600 * 1000   # resync every hour
+WIFI_CHECK_MS = 60 * 1000     # check wifi every minute
+
+state = {
+    'co2': 0, 'temp_c': 0.0, 'hum': 0.0, 'lux': 0, 'pressure': 0.0,
+    'show_f': True,      # alternates C/F each reading; TEMP tap toggles
+    'overlay': None,     # bottom-row detail on screen; the next render paints over it
+    'page': None,        # HISTORY key of the open detail page
+    'ntp_now': False,    # TIME tap asked for a resync
+    'wifi_now': False,   # WIFI tap asked for a reconnect, then its details
+    'power': None,       # POWER_PROFILES key in use
 }
+render_ev = asyncio.Event()
+log_ev = asyncio.Event()
+alert_ev = asyncio.Event()
 
-def _zone_hit(tx, ty):
-    """Return which zone was tapped, or None."""
-    for name, (zx, zy, zw, zh) in TOUCH_ZONES.items():
-        if zx <= tx <= zx + zw and zy <= ty <= zy + zh:
-            return name
-    return None
-
-touch_prev = False
-
-# Alternate C/F each cycle
-show_f = True
-loop_count = 0
-NTP_RESYNC_CYCLES = int(3600 / LOG_INTERVAL)  # resync every hour
-WIFI_CHECK_CYCLES = int(60 / LOG_INTERVAL)    # check wifi every minute
-
-# Main loop
-print("[Main] Running...")
-while True:
-  try:
-    # WiFi auto-reconnect
-    if loop_count > 0 and loop_count % WIFI_CHECK_CYCLES == 0:
-        if not wifi.is_connected():
-            print("[Main] WiFi lost, reconnecting...")
-            ip, wifi_ok = wifi.connect_multi(WIFI_NETWORKS)
-            if wifi_ok:
-                print("[Main] WiFi reconnected:", ip)
-
-    # NTP resync periodically
-    if wifi.is_connected() and loop_count > 0 and loop_count % NTP_RESYNC_CYCLES == 0:
-        try:
-            ntptime.settime()
-            ntp_ok = True
-            print("[Main] NTP resynced")
-        except:
-            pass
 
-    co2 = 0
-    temp_val = 0.0
-    temp_c_log = 0.0
-    hum = 0.0
-    lux = 0
-    pressure = 0.0
-    status = wifi.get_ip() or "No WiFi"
-    time_str = get_time_str() if ntp_ok else ""
-    date_str = get_date_str() if ntp_ok else ""
+def temp_display():
+    """Latest temperature as (value, unit) in the current unit"""
+    t = state['temp_c']
+    if state['show_f']:
+        return t * 9.0 / 5.0 + 32.0, "F"
+    return t, "C"
+
 
+async def read_sensors():
+    """One pass over all sensors into state. A sensor with nothing new
+    keeps its last value."""
+    temp_c = None
     if sensor:
         try:
-            if sensor.data_ready:
-                co2 = sensor.CO2
-                temp_c = sensor.temperature
-                hum = sensor.relative_humidity
-                temp_c_log = temp_c
-                if show_f:
-                    temp_val = temp_c * 9.0 / 5.0 + 32.0
-                else:
-                    temp_val = temp_c
+            # One ready check + one read; all three from the same cycle.
+            # Yields through the command execution times.
+            snap = await sensor.read_measurement_async()
+            if snap is not None:
+                state['co2'], temp_c, state['hum'], _ = snap
         except Exception as e:
             print("[Main] SCD4x error:", e)
 
     # SHT4x as backup only if SCD4x didn't provide temp
-    if sht and temp_c_log == 0.0:
+    if sht and temp_c is None:
         try:
-            st, sh = sht.read()
-            temp_c_log = st
-            if show_f:
-                temp_val = st * 9.0 / 5.0 + 32.0
-            else:
-                temp_val = st
-            hum = sh
+            temp_c, state['hum'] = sht.read()
         except Exception as e:
             print("[Main] SHT4x error:", e)
+    if temp_c is not None:
+        state['temp_c'] = temp_c
 
     if light_sensor:
         try:
-            lux = light_sensor.read_lux()
+            state['lux'] = light_sensor.read_lux()
         except:
             try:
-                lux = light_sensor.lux
+                state['lux'] = light_sensor.lux
             except Exception as e:
                 print("[Main] Light error:", e)
 
     if pressure_sensor:
         try:
-            pressure = pressure_sensor.pressure()
+            r = pressure_sensor.fetch()
+            if r is None:
+                # First pass, or a pass shorter than the conversion
+                r = await pressure_sensor.read_async()
+            if r is not None:
+                state['pressure'] = r[0]
+            pressure_sensor.start()
         except Exception as e:
             print("[Main] Pressure error:", e)
 
-    unit = "F" if show_f else "C"
-    print("[Data] CO2:{} T:{:.1f}{} H:{:.1f}% L:{}lux P:{:.0f}hPa {}".format(
-        co2, temp_val, unit, hum, lux, pressure, time_str))
-    display.draw_dashboard(co2, temp_val, hum, lux=lux, pressure=pressure,
+
+async def sensor_task():
+    last_render = last_log = None
+    while True:
+        _, read_s, log_s, render_s = update_power()
+        await read_sensors()
+        # One sparkline point per reading; renders only draw them
+        display.trend_sample(state['co2'], state['temp_c'], state['hum'],
+                             state['lux'], state['pressure'])
+        temp_val, unit = temp_display()
+        print("[Data] CO2:{} T:{:.1f}{} H:{:.1f}% L:{}lux P:{:.0f}hPa {}".format(
+            state['co2'], temp_val, unit, state['hum'], state['lux'],
+            state['pressure'], get_time_str() if ntp_ok else ""))
+        now = time.ticks_ms()
+        if last_render is None or time.ticks_diff(now, last_render) >= render_s * 1000:
+            last_render = now
+            render_ev.set()
+        if last_log is None or time.ticks_diff(now, last_log) >= log_s * 1000:
+            last_log = now
+            log_ev.set()
+        alert_ev.set()
+        await asyncio.sleep(read_s)
+        state['show_f'] = not state['show_f']
+
+
+# Detail pages: full-screen scrolling history of one reading, opened by
+# long-pressing its card; swipes step through them in this order.
+# widget: (title, lo, hi, unit, color, state key)
+HISTORY = {
+    'co2':      ("CO2", 400, 2000, "ppm", display.CYAN, 'co2'),
+    'temp':     ("TEMP", 10, 35, "C", display.ORANGE, 'temp_c'),
+    'humid':    ("HUMID", 0, 100, "%", display.CYAN, 'hum'),
+    'light':    ("LIGHT", 0, 1000, "lux", display.YELLOW, 'lux'),
+    'pressure': ("PRESS", 980, 1040, "hPa", display.WHITE, 'pressure'),
+}
+PAGES = (None, 'co2', 'temp', 'humid', 'light', 'pressure')
+
+
+def show_page(page):
+    """Switch to a history page, or back to the dashboard with None"""
+    state['page'] = page
+    if page is None:
+        display.history_end()
+        render()
+        print("[Touch] Dashboard")
+        return
+    title, lo, hi, unit, color, key = HISTORY[page]
+    display.history_begin(title, lo, hi, unit, color)
+    if state[key] > 0:
+        display.history_push(state[key])
+    print("[Touch] {} history".format(title))
+
+
+def render():
+    """Bring the screen up to date with state"""
+    if state['page'] is not None:
+        # History page: one new column per reading, dashboard stays retained
+        v = state[HISTORY[state['page']][5]]
+        if v > 0:
+            display.history_push(v)
+        return
+    temp_val, unit = temp_display()
+    display.draw_dashboard(state['co2'], temp_val, state['hum'],
+                           lux=state['lux'], pressure=state['pressure'],
                            sd_free=sdlog.free_space(),
-                           status=status, unit_label=unit,
-                           time_str=time_str, date_str=date_str,
+                           status=wifi.get_ip() or "No WiFi", unit_label=unit,
+                           time_str=get_time_str() if ntp_ok else "",
+                           date_str=get_date_str() if ntp_ok else "",
                            batt_pct=read_battery_pct())
-    if sd_ok and time_str:
+    state['overlay'] = None
+    print("[Display]", display.stats_line())
+    display.reset_stats()
+
+
+async def render_task():
+    first = True
+    while True:
+        await render_ev.wait()
+        render_ev.clear()
+        try:
+            render()
+        except Exception as e:
+            print("[Main] Render error:", e)
+        if first:
+            boot_mark("dashboard")
+            boot_report()
+            first = False
+        gc.collect()
+
+
+async def log_task():
+    global sd_ok
+    while True:
+        await log_ev.wait()
+        log_ev.clear()
+        if not (sd_ok and ntp_ok):
+            continue
         lt = time.localtime(time.time() + TIMEZONE_OFFSET * 3600)
-        if not sdlog.log(date_str + " " + time_str, co2, temp_c_log, hum, lux, pressure, lt):
+        stamp = get_date_str() + " " + get_time_str()
+        if not sdlog.log(stamp, state['co2'], state['temp_c'], state['hum'],
+                         state['lux'], state['pressure'], lt):
             print("[Main] SD log failed, remounting...")
             sd_ok = sdlog.init()
-    # LED: green=good, yellow=fair, red=poor CO2
-    if co2 > 0 and co2 < 1000:
-        set_led(0, 1, 0)
-    elif co2 >= 1000 and co2 < 1500:
-        set_led(1, 1, 0)
+
+
+async def alert_task():
+    while True:
+        await alert_ev.wait()
+        alert_ev.clear()
+        co2 = state['co2']
+        # LED: green=good, yellow=fair, red=poor CO2
+        if co2 > 0 and co2 < 1000:
+            set_led(0, 1, 0)
+        elif co2 >= 1000 and co2 < 1500:
+            set_led(1, 1, 0)
+        else:
+            set_led(1, 0, 0)
+        # Audio alerts
+        try:
+            if co2 >= 1500:
+                await audio.alert_tone_async()
+            if state['hum'] >= 80:
+                await audio.beep_async(600, 200)
+        except:
+            pass
+
+
+async def net_task():
+    global ip, wifi_ok, ntp_ok
+    last_check = last_ntp = time.ticks_ms()
+    while True:
+        # Background connect from fast boot
+        poll_wifi()
+        now = time.ticks_ms()
+        if state['wifi_now'] or time.ticks_diff(now, last_check) >= WIFI_CHECK_MS:
+            last_check = now
+            if not wifi.pending() and not wifi.is_connected():
+                print("[Main] WiFi lost, reconnecting...")
+                ip, wifi_ok = await wifi.connect_multi_async(WIFI_NETWORKS)
+                if wifi_ok:
+                    print("[Main] WiFi reconnected:", ip)
+            if state['wifi_now']:
+                # Set by a tap, not by drawing, so a render in between
+                # doesn't cancel the details
+                state['wifi_now'] = False
+                if state['page'] is None:
+                    show_wifi_detail()
+        if wifi.is_connected() and (state['ntp_now'] or
+                                    time.ticks_diff(now, last_ntp) >= NTP_RESYNC_MS):
+            last_ntp = now
+            synced = sync_ntp()
+            ntp_ok = ntp_ok or synced
+            if state['ntp_now']:
+                state['ntp_now'] = False
+                if state['overlay'] == 'time':
+                    show_time_detail("synced" if synced else "failed",
+                                     display.GREEN if synced else display.RED)
+        await asyncio.sleep_ms(250)
+
+
+def _overlay_box():
+    ox, oy, ow, oh = layout.OVERLAY
+    display.fill_rect(ox, oy, ow, oh, display.DKBLUE)
+    display.round_rect(ox, oy, ow, oh, display.CYAN, 2)
+    # Overlay covers the bottom row; repaint it on next refresh
+    display.invalidate()
+    return ox, oy
+
+
+def show_wifi_detail():
+    """WiFi network details over the bottom row"""
+    ifcfg = wifi.wlan.ifconfig() if wifi.is_connected() else None
+    ox, oy = _overlay_box()
+    state['overlay'] = 'wifi'
+    if ifcfg:
+        display.draw_text("IP: " + ifcfg[0], ox + 8, oy + 6, display.GREEN, display.DKBLUE, 1)
+        display.draw_text("GW: " + ifcfg[2], ox + 8, oy + 26, display.WHITE, display.DKBLUE, 1)
+        display.draw_text("DNS: " + ifcfg[3], ox + 8, oy + 46, display.WHITE, display.DKBLUE, 1)
+        display.draw_text("Mask: " + ifcfg[1], ox + 240, oy + 6, display.LTGRAY, display.DKBLUE, 1)
+        print("[Touch] WiFi IP:{} GW:{} DNS:{} Mask:{}".format(*ifcfg))
     else:
-        set_led(1, 0, 0)
-    # Audio alerts
-    try:
-        if co2 >= 1500:
-            audio.alert_tone()
-        if hum >= 80:
-            audio.beep(600, 200)
-    except:
-        pass
-    # --- Touch input ---
+        display.draw_text("WiFi not connected", ox + 8, oy + 26, display.RED, display.DKBLUE, 1)
+        print("[Touch] WiFi not connected")
+
+
+def show_time_detail(ntp_str, ntp_clr):
+    """Time details and NTP status over the bottom row"""
+    ts = get_time_str() if ntp_ok else "--:--"
+    ds = get_date_str() if ntp_ok else "--"
+    utc_t = time.localtime()
+    utc_str = "{:02d}:{:02d} UTC".format(utc_t[3], utc_t[4])
+    ox, oy = _overlay_box()
+    state['overlay'] = 'time'
+    display.draw_text("Time: " + ts, ox + 8, oy + 6, display.YELLOW, display.DKBLUE, 1)
+    display.draw_text("Date: " + ds, ox + 8, oy + 26, display.WHITE, display.DKBLUE, 1)
+    display.draw_text("UTC:  " + utc_str, ox + 8, oy + 46, display.LTGRAY, display.DKBLUE, 1)
+    display.draw_text("NTP: " + ntp_str, ox + 240, oy + 6, ntp_clr, display.DKBLUE, 1)
+    display.draw_text("TZ: UTC{:+d}".format(TIMEZONE_OFFSET), ox + 240, oy + 26, display.LTGRAY, display.DKBLUE, 1)
+    uptime_s = time.ticks_ms() // 1000
+    up_h, up_m = divmod(uptime_s // 60, 60)
+    display.draw_text("Up: {}h {}m".format(up_h, up_m % 60), ox + 240, oy + 46, display.LTGRAY, display.DKBLUE, 1)
+    print("[Touch] Time:{} {} NTP:{}".format(ts, ds, ntp_str))
+
+
+def on_gesture(g, x, y):
+    """Dispatch one gesture from the touch queue"""
+    if g == gesture.TAP:
+        on_tap(x, y)
+    elif g == gesture.LONG:
+        # Every long-press starts as a tap, already handled by on_tap
+        zone = layout.DASH.hit(x, y)
+        if state['page'] is None and zone in HISTORY:
+            if zone == 'temp':
+                # Undo the C/F toggle of this stroke's tap
+                state['show_f'] = not state['show_f']
+            show_page(zone)
+    elif g == gesture.SWIPE_LEFT or g == gesture.SWIPE_RIGHT:
+        # Left steps forward through PAGES, right steps back
+        i = PAGES.index(state['page'])
+        i += 1 if g == gesture.SWIPE_LEFT else -1
+        show_page(PAGES[i % len(PAGES)])
+
+
+def on_tap(x, y):
+    """Handle one tap. Anything slow is handed to another task."""
+    if state['page'] is not None:
+        # Any tap leaves the history page
+        show_page(None)
+        return
+
+    zone = layout.DASH.hit(x, y)
+    if zone:
+        print("[Touch] {} at ({},{})".format(zone, x, y))
+
+    if zone == 'air':
+        show_page('co2')
+
+    elif zone == 'temp':
+        # Toggle C/F and refresh immediately
+        state['show_f'] = not state['show_f']
+        temp_val, unit = temp_display()
+        display.update_widget('temp', temp=temp_val, unit_label=unit)
+        print("[Touch] Temp unit:", unit)
+
+    elif zone == 'wifi':
+        # Show WiFi network details (reconnect if not connected)
+        if wifi.is_connected():
+            show_wifi_detail()
+        else:
+            x0, y0, w, h = layout.DASH.rect('wifi')
+            display.draw_card(x0, y0, w, h, "WIFI", "...", "connecting", display.YELLOW)
+            # net_task shows the details once the attempt finishes
+            state['wifi_now'] = True
+
+    elif zone == 'time':
+        # Show time details; net_task resyncs NTP and updates the status
+        if wifi.is_connected():
+            state['ntp_now'] = True
+            show_time_detail("syncing", display.YELLOW)
+        else:
+            show_time_detail("failed", display.RED)
+
+    elif zone == 'co2':
+        # Flash CO2 level detail
+        co2 = state['co2']
+        if co2 < 400:
+            msg, clr = "Outdoor", display.GREEN
+        elif co2 < 1000:
+            msg, clr = "Good", display.GREEN
+        elif co2 < 1500:
+            msg, clr = "Ventilate", display.YELLOW
+        elif co2 < 2000:
+            msg, clr = "Poor!", display.ORANGE
+        else:
+            msg, clr = "Danger!", display.RED
+        x0, y0, w, h = layout.DASH.rect('co2')
+        display.draw_card(x0, y0, w, h, "CO2 " + str(co2), msg, "ppm", clr)
+        print("[Touch] CO2 detail:", msg)
+
+
+async def touch_task():
+    # Woken by the PENIRQ interrupt; polls only while the pen is down
+    flag = asyncio.ThreadSafeFlag()
+    touch_mod.start(flag)
+    while True:
+        await flag.wait()
+        while True:
+            touch_mod.poll()
+            ev = touch_mod.get()
+            while ev:
+                if ev[0] in gesture.NAMES:
+                    try:
+                        on_gesture(ev[0], ev[1], ev[2])
+                    except Exception as e:
+                        print("[Main] Touch error:", e)
+                ev = touch_mod.get()
+            if not touch_mod.active():
+                break
+            await asyncio.sleep_ms(touch_mod.POLL_MS)
+
+
+async def main():
+    tasks = [sensor_task(), render_task(), log_task(), alert_task(), net_task()]
     if touch_mod:
-        touch_start = time.ticks_ms()
-        while time.ticks_diff(time.ticks_ms(), touch_start) < (LOG_INTERVAL * 1000):
-            try:
-                pos = touch_mod.read()
-            except:
-                pos = None
-
-            if pos is not None and not touch_prev:
-                zone = _zone_hit(pos[0], pos[1])
-                if zone:
-                    print("[Touch] {} at ({},{})".format(zone, pos[0], pos[1]))
-
-                if zone == 'temp':
-                    # Toggle C/F and refresh immediately
-                    show_f = not show_f
-                    unit = "F" if show_f else "C"
-                    if show_f:
-                        temp_val = temp_c_log * 9.0 / 5.0 + 32.0
-                    else:
-                        temp_val = temp_c_log
-                    display.draw_card(
-                        TOUCH_ZONES['temp'][0], TOUCH_ZONES['temp'][1],
-                        _card_w, _card_h,
-                        "TEMP", "{:.1f}".format(temp_val), unit, display.ORANGE)
-                    print("[Touch] Temp unit:", unit)
-
-                elif zone == 'wifi':
-                    # Show WiFi network details (reconnect if not connected)
-                    if not wifi.is_connected():
-                        display.draw_card(
-                            TOUCH_ZONES['wifi'][0], TOUCH_ZONES['wifi'][1],
-                            _card_w, _card_h,
-                            "WIFI", "...", "connecting", display.YELLOW)
-                        ip, wifi_ok = wifi.connect_multi(WIFI_NETWORKS)
-                    ifcfg = wifi.wlan.ifconfig() if wifi.is_connected() else None
-                    ox = _x0
-                    oy = _row3_y
-                    ow = 3 * _card_w + 2 * _gap
-                    oh = _card_h
-                    display.fill_rect(ox, oy, ow, oh, display.DKBLUE)
-                    display.round_rect(ox, oy, ow, oh, display.CYAN, 2)
-                    if ifcfg:
-                        display.draw_text("IP: " + ifcfg[0], ox + 8, oy + 6, display.GREEN, display.DKBLUE, 1)
-                        display.draw_text("GW: " + ifcfg[2], ox + 8, oy + 26, display.WHITE, display.DKBLUE, 1)
-                        display.draw_text("DNS: " + ifcfg[3], ox + 8, oy + 46, display.WHITE, display.DKBLUE, 1)
-                        display.draw_text("Mask: " + ifcfg[1], ox + 240, oy + 6, display.LTGRAY, display.DKBLUE, 1)
-                        print("[Touch] WiFi IP:{} GW:{} DNS:{} Mask:{}".format(*ifcfg))
-                    else:
-                        display.draw_text("WiFi not connected", ox + 8, oy + 26, display.RED, display.DKBLUE, 1)
-                        print("[Touch] WiFi not connected")
-
-                elif zone == 'time':
-                    # Show time details and NTP resync
-                    synced = False
-                    if wifi.is_connected():
-                        try:
-                            ntptime.settime()
-                            ntp_ok = True
-                            synced = True
-                        except:
-                            pass
-                    ts = get_time_str() if ntp_ok else "--:--"
-                    ds = get_date_str() if ntp_ok else "--"
-                    utc_t = time.localtime()
-                    utc_str = "{:02d}:{:02d} UTC".format(utc_t[3], utc_t[4])
-                    ox = _x0
-                    oy = _row3_y
-                    ow = 3 * _card_w + 2 * _gap
-                    oh = _card_h
-                    display.fill_rect(ox, oy, ow, oh, display.DKBLUE)
-                    display.round_rect(ox, oy, ow, oh, display.CYAN, 2)
-                    display.draw_text("Time: " + ts, ox + 8, oy + 6, display.YELLOW, display.DKBLUE, 1)
-                    display.draw_text("Date: " + ds, ox + 8, oy + 26, display.WHITE, display.DKBLUE, 1)
-                    display.draw_text("UTC:  " + utc_str, ox + 8, oy + 46, display.LTGRAY, display.DKBLUE, 1)
-                    ntp_str = "synced" if synced else "failed"
-                    ntp_clr = display.GREEN if synced else display.RED
-                    display.draw_text("NTP: " + ntp_str, ox + 240, oy + 6, ntp_clr, display.DKBLUE, 1)
-                    display.draw_text("TZ: UTC{:+d}".format(TIMEZONE_OFFSET), ox + 240, oy + 26, display.LTGRAY, display.DKBLUE, 1)
-                    uptime_s = time.ticks_ms() // 1000
-                    up_h, up_m = divmod(uptime_s // 60, 60)
-                    display.draw_text("Up: {}h {}m".format(up_h, up_m % 60), ox + 240, oy + 46, display.LTGRAY, display.DKBLUE, 1)
-                    print("[Touch] Time:{} {} NTP:{}".format(ts, ds, ntp_str))
-
-                elif zone == 'co2':
-                    # Flash CO2 level detail
-                    if co2 < 400:
-                        msg, clr = "Outdoor", display.GREEN
-                    elif co2 < 1000:
-                        msg, clr = "Good", display.GREEN
-                    elif co2 < 1500:
-                        msg, clr = "Ventilate", display.YELLOW
-                    elif co2 < 2000:
-                        msg, clr = "Poor!", display.ORANGE
-                    else:
-                        msg, clr = "Danger!", display.RED
-                    display.draw_card(
-                        TOUCH_ZONES['co2'][0], TOUCH_ZONES['co2'][1],
-                        _card_w, _card_h,
-                        "CO2 " + str(co2), msg, "ppm", clr)
-                    print("[Touch] CO2 detail:", msg)
-
-                touch_prev = True
-            elif pos is None:
-                touch_prev = False
-
-            time.sleep_ms(50)
-    else:
-        time.sleep(LOG_INTERVAL)
+        tasks.append(touch_task())
+    print("[Main] Running...")
+    await asyncio.gather(*tasks)
+
 
-    show_f = not show_f
-    loop_count += 1
-    gc.collect()
-  except Exception as e:
-    print("[Main] Loop error:", e)
+# Per-function display timing for the per-refresh stats line (debug only:
+# it wraps every drawing call)
+if getattr(config, "DISPLAY_TIMING", False):
+    display.enable_timing()
+# Off-screen card compositing: fewer SPI windows for ~24 KB of heap
+display.COMPOSITE_CARDS = getattr(config, "COMPOSITE_CARDS", False)
+display.reset_stats()
 
+asyncio.run(main())
@@ -1,45 +1,93 @@
 """MPL3115A2 Barometric Pressure / Altitude / Temperature Sensor Driver
 From Growing-Beyond-Earth/gbe-micropython, cleaned up for ESP32 EnvMonitor
 I2C address: 0x60
+
+Two ways to acquire besides the blocking pressure():
+- oneshot=True: start() triggers a conversion and returns; fetch()
+  collects it once conv_ms (set by oversample) has passed.
+- fifo_start(): the chip samples on its own into a 32-sample FIFO;
+  fifo_read() drains the whole batch in one burst read.
 """
 import time
+from array import array
+import uasyncio as asyncio
 
 MPL3115_I2CADDR = const(0x60)
 MPL3115_STATUS = const(0x00)
 MPL3115_PRESSURE_DATA_MSB = const(0x01)
 MPL3115_TEMP_DATA_MSB = const(0x04)
 MPL3115_TEMP_DATA_LSB = const(0x05)
+MPL3115_F_STATUS = const(0x0D)
+MPL3115_F_DATA = const(0x0E)
+MPL3115_F_SETUP = const(0x0F)
 MPL3115_PT_DATA_CFG = const(0x13)
 MPL3115_CTRL_REG1 = const(0x26)
+MPL3115_CTRL_REG2 = const(0x27)
+
+# CTRL_REG1 bits
+_ALT = const(0x80)
+_OST = const(0x02)
+_SBYB = const(0x01)
 
 PRESSURE = const(0)
 ALTITUDE = const(1)
 
+# Oversampling ratio -> minimum conversion time (ms), from the datasheet.
+# Higher ratios are less noisy but slower.
+OVERSAMPLE_MS = {1: 6, 2: 10, 4: 18, 8: 34, 16: 66, 32: 130, 64: 258, 128: 512}
+_OS_RATIOS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+FIFO_LEN = const(32)
+
 
 class MPL3115A2:
-    def __init__(self, i2c, mode=PRESSURE):
+    def __init__(self, i2c, mode=PRESSURE, oversample=128, oneshot=False):
+        """mode: PRESSURE (barometer) or ALTITUDE.
+        oversample: 1..128, see OVERSAMPLE_MS.
+        oneshot: stay in standby and convert only on start();
+        otherwise the chip converts continuously."""
+        if mode != PRESSURE and mode != ALTITUDE:
+            raise ValueError("Invalid mode")
         self.i2c = i2c
         self.addr = MPL3115_I2CADDR
         self.mode = mode
+        self.oneshot = oneshot
+        self.fifo = False
         self._buf = bytearray(1)
+        self._data = bytearray(5)           # P/alt MSB..LSB, T MSB, LSB
+        self._fifo = bytearray(FIFO_LEN * 5)
+        self._fifo_mv = memoryview(self._fifo)
+        self.fifo_p = array('f', [0.0] * FIFO_LEN)    # hPa, or m in ALTITUDE
+        self.fifo_t = array('f', [0.0] * FIFO_LEN)    # deg C
         self._last_p = 0.0
+        self.last_t = 0.0
+        self._due = None    # ticks_ms when the one-shot in flight is done
 
-        if mode == PRESSURE:
-            # Barometer mode, oversampling 128, min time 512ms
-            self.i2c.writeto_mem(self.addr, MPL3115_CTRL_REG1, bytes([0x38]))
-            self.i2c.writeto_mem(self.addr, MPL3115_PT_DATA_CFG, bytes([0x07]))
-            self.i2c.writeto_mem(self.addr, MPL3115_CTRL_REG1, bytes([0x39]))
-        elif mode == ALTITUDE:
-            # Altitude mode, oversampling 128
-            self.i2c.writeto_mem(self.addr, MPL3115_CTRL_REG1, bytes([0xB8]))
-            self.i2c.writeto_mem(self.addr, MPL3115_PT_DATA_CFG, bytes([0x07]))
-            self.i2c.writeto_mem(self.addr, MPL3115_CTRL_REG1, bytes([0xB9]))
-        else:
-            raise ValueError("Invalid mode")
+        self._write(MPL3115_CTRL_REG1, 0)   # standby
+        self._write(MPL3115_PT_DATA_CFG, 0x07)
+        self.set_oversample(oversample)
+
+        if not oneshot:
+            # Wait for first reading
+            if not self._wait_ready(timeout=2000):
+                raise OSError("MPL3115A2 not responding")
 
-        # Wait for first reading
-        if not self._wait_ready(timeout=2000):
-            raise OSError("MPL3115A2 not responding")
+    def _write(self, reg, value):
+        self._buf[0] = value
+        self.i2c.writeto_mem(self.addr, reg, self._buf)
+
+    def set_oversample(self, oversample):
+        """Set the oversampling ratio; conv_ms becomes its conversion time"""
+        if oversample not in OVERSAMPLE_MS:
+            raise ValueError("Invalid oversample")
+        self.oversample = oversample
+        self.conv_ms = OVERSAMPLE_MS[oversample]
+        self._ctrl = (_ALT if self.mode == ALTITUDE else 0) | (_OS_RATIOS.index(oversample) << 3)
+        self._due = None
+        # OS can only change in standby
+        self._write(MPL3115_CTRL_REG1, self._ctrl)
+        if not self.oneshot:
+            self._write(MPL3115_CTRL_REG1, self._ctrl | _SBYB)
 
     def _wait_ready(self, timeout=600):
         start = time.ticks_ms()
@@ -51,32 +99,155 @@ class MPL3115A2:
                 return False
             time.sleep_ms(10)
 
+    # --- One-shot: start() now, fetch() later ---
+
+    def start(self):
+        """Trigger a one-shot conversion and return at once; fetch() has
+        the result conv_ms later. No-op while one is already running."""
+        if self._due is not None:
+            return
+        self._write(MPL3115_CTRL_REG1, self._ctrl | _OST)
+        self._due = time.ticks_add(time.ticks_ms(), self.conv_ms)
+
+    def remaining_ms(self):
+        """ms until the running one-shot should be done (0 if none)"""
+        if self._due is None:
+            return 0
+        return max(0, time.ticks_diff(self._due, time.ticks_ms()))
+
+    def fetch(self):
+        """(hPa or m, deg C) from a finished conversion, or None if it is
+        not done yet. No I2C before conv_ms is up; then one status read
+        and one 5-byte burst read."""
+        if self.fifo:
+            raise RuntimeError("FIFO running; use fifo_read()")
+        if self.oneshot and (self._due is None or self.remaining_ms()):
+            return None
+        self.i2c.readfrom_mem_into(self.addr, MPL3115_STATUS, self._buf)
+        if not self._buf[0] & 0x04:
+            return None
+        self._due = None
+        self.i2c.readfrom_mem_into(self.addr, MPL3115_PRESSURE_DATA_MSB, self._data)
+        self._last_p = self._decode_p(self._data, 0)
+        self.last_t = self._decode_t(self._data, 3)
+        return self._last_p, self.last_t
+
+    def read(self, timeout=600):
+        """Blocking fetch(): starts a one-shot if needed. None on timeout."""
+        if self.oneshot:
+            self.start()
+        time.sleep_ms(self.remaining_ms())
+        start = time.ticks_ms()
+        while True:
+            r = self.fetch()
+            if r is not None:
+                return r
+            if time.ticks_diff(time.ticks_ms(), start) > timeout:
+                return None
+            time.sleep_ms(10)
+
+    async def read_async(self, timeout=600):
+        """read() for uasyncio: yields while the conversion finishes"""
+        if self.oneshot:
+            self.start()
+        await asyncio.sleep_ms(self.remaining_ms())
+        start = time.ticks_ms()
+        while True:
+            r = self.fetch()
+            if r is not None:
+                return r
+            if time.ticks_diff(time.ticks_ms(), start) > timeout:
+                return None
+            await asyncio.sleep_ms(10)
+
+    def _decode_p(self, b, o):
+        if self.mode == ALTITUDE:
+            alt_int = (b[o] << 8) | b[o + 1]
+            if alt_int > 32767:
+                alt_int -= 65536
+            return alt_int + ((b[o + 2] >> 4) & 0x0F) / 16.0
+        p_int = (b[o] << 10) | (b[o + 1] << 2) | ((b[o + 2] >> 6) & 0x03)
+        p_frac = (b[o + 2] >> 4) & 0x03
+        return (p_int + p_frac / 4.0) / 100.0
+
+    @staticmethod
+    def _decode_t(b, o):
+        t = b[o]
+        if t > 127:
+            t -= 256
+        return t + b[o + 1] / 256.0
+
+    # --- FIFO batching ---
+
+    def fifo_start(self, step=0, circular=False):
+        """Sample autonomously every 2**step s (step 0..15) into the
+        32-sample FIFO. It stops filling when full, or overwrites the
+        oldest samples with circular=True. Keep 2**step s above conv_ms."""
+        self._write(MPL3115_CTRL_REG1, self._ctrl)      # standby
+        self._write(MPL3115_F_SETUP, 0)                 # mode change needs off first
+        self._write(MPL3115_F_SETUP, 0x40 if circular else 0x80)
+        self._write(MPL3115_CTRL_REG2, step & 0x0F)
+        self._write(MPL3115_CTRL_REG1, self._ctrl | _SBYB)
+        self.fifo = True
+        self._due = None
+
+    def fifo_stop(self):
+        """Disable the FIFO and go back to one-shot or continuous mode"""
+        self._write(MPL3115_CTRL_REG1, self._ctrl)
+        self._write(MPL3115_F_SETUP, 0)
+        self._write(MPL3115_CTRL_REG2, 0)
+        if not self.oneshot:
+            self._write(MPL3115_CTRL_REG1, self._ctrl | _SBYB)
+        self.fifo = False
+
+    def fifo_count(self):
+        """Samples waiting in the FIFO"""
+        self.i2c.readfrom_mem_into(self.addr, MPL3115_F_STATUS, self._buf)
+        return self._buf[0] & 0x3F
+
+    def fifo_read(self):
+        """Drain the FIFO with one burst read. Returns n; samples are
+        in fifo_p[:n] / fifo_t[:n], oldest first."""
+        n = self.fifo_count()
+        if n == 0:
+            return 0
+        buf = self._fifo
+        self.i2c.readfrom_mem_into(self.addr, MPL3115_F_DATA, self._fifo_mv[:n * 5])
+        for i in range(n):
+            self.fifo_p[i] = self._decode_p(buf, i * 5)
+            self.fifo_t[i] = self._decode_t(buf, i * 5 + 3)
+        self._last_p = self.fifo_p[n - 1]
+        self.last_t = self.fifo_t[n - 1]
+        return n
+
+    # --- Blocking reads ---
+
     def pressure(self):
         """Read pressure in Pascals, returns hPa (mbar)"""
         if self.mode != PRESSURE:
             raise ValueError("Not in pressure mode")
-        if not self._wait_ready():
-            return self._last_p
-        data = self.i2c.readfrom_mem(self.addr, MPL3115_PRESSURE_DATA_MSB, 3)
-        p_int = (data[0] << 10) | (data[1] << 2) | ((data[2] >> 6) & 0x03)
-        p_frac = (data[2] >> 4) & 0x03
-        self._last_p = (p_int + p_frac / 4.0) / 100.0
+        self.read()
+        return self._last_p
+
+    async def pressure_async(self, timeout=600):
+        """pressure() for uasyncio: yields while the conversion finishes"""
+        if self.mode != PRESSURE:
+            raise ValueError("Not in pressure mode")
+        await self.read_async(timeout)
         return self._last_p
 
     def altitude(self):
         """Read altitude in meters"""
         if self.mode != ALTITUDE:
             raise ValueError("Not in altitude mode")
-        self._wait_ready()
-        data = self.i2c.readfrom_mem(self.addr, MPL3115_PRESSURE_DATA_MSB, 3)
-        alt_int = (data[0] << 8) | data[1]
-        alt_frac = (data[2] >> 4) & 0x0F
-        if alt_int > 32767:
-            alt_int -= 65536
-        return alt_int + alt_frac / 16.0
+        r = self.read()
+        return r[0] if r is not None else None
 
     def temperature(self):
         """Read temperature in Celsius"""
+        if self.oneshot:
+            self.read()
+            return self.last_t
         self._wait_ready()
         msb = self.i2c.readfrom_mem(self.addr, MPL3115_TEMP_DATA_MSB, 1)
         lsb = self.i2c.readfrom_mem(self.addr, MPL3115_TEMP_DATA_LSB, 1)
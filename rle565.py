@@ -0,0 +1,144 @@
+"""RLE-compressed RGB565 images (boot logo, splash screens)
+
+File layout:
+    b'R565'             magic
+    width, height       big-endian uint16 each
+    packets...          until width*height pixels are produced
+
+Packet control byte c:
+    c & 0x80            run: (c & 0x7F) + 1 copies of the next 2-byte pixel
+    otherwise           literal: c + 1 pixels (2 bytes each) follow
+
+Pixels are RGB565 big-endian, the same byte order the ST7796S expects,
+so decoded output can go straight to spi.write. encode() is meant for
+the host (utils/logo_convert.py); Decoder runs on the board.
+"""
+
+MAGIC = b'R565'
+_MAX_RUN = 128
+
+
+class Decoder:
+    """Streaming decoder with a file-like readinto().
+
+    Compressed input is read through a small fixed buffer and output is
+    written into the caller's buffer, so decoding allocates nothing per
+    chunk regardless of image size.
+    """
+
+    def __init__(self, f, in_size=512):
+        self._f = f
+        self._in = bytearray(in_size)
+        self._in_mv = memoryview(self._in)
+        self._ip = 0
+        self._iend = 0
+        self._left = 0      # pixels left in the current packet
+        self._run = False
+        self._hi = 0
+        self._lo = 0
+
+    def _fill(self):
+        n = self._f.readinto(self._in)
+        self._iend = n or 0
+        self._ip = 0
+        return self._iend
+
+    def _byte(self):
+        if self._ip >= self._iend and not self._fill():
+            return -1
+        b = self._in[self._ip]
+        self._ip += 1
+        return b
+
+    def readinto(self, buf):
+        """Decode up to len(buf) bytes of pixels into buf, return bytes written"""
+        mv = memoryview(buf)
+        n = len(buf) & ~1
+        pos = 0
+        while pos < n:
+            if self._left == 0:
+                c = self._byte()
+                if c < 0:
+                    break
+                if c & 0x80:
+                    self._left = (c & 0x7F) + 1
+                    self._run = True
+                    self._hi = self._byte()
+                    self._lo = self._byte()
+                    if self._lo < 0:
+                        break
+                else:
+                    self._left = c + 1
+                    self._run = False
+            k = min(self._left, (n - pos) >> 1)
+            if self._run:
+                mv[pos] = self._hi
+                mv[pos + 1] = self._lo
+                end = pos + k * 2
+                m = pos + 2
+                while m < end:
+                    c = min(m - pos, end - m)
+                    mv[m:m + c] = mv[pos:pos + c]
+                    m += c
+            else:
+                # Literal pixels: copy straight out of the input buffer
+                end = pos + k * 2
+                while pos < end:
+                    if self._ip >= self._iend and not self._fill():
+                        return pos
+                    c = min(end - pos, self._iend - self._ip)
+                    mv[pos:pos + c] = self._in_mv[self._ip:self._ip + c]
+                    self._ip += c
+                    pos += c
+                self._left -= k
+                continue
+            pos = end
+            self._left -= k
+        return pos
+
+
+def open_image(f):
+    """Read the header from an open file. Returns (width, height, Decoder)
+    or raises ValueError if the file is not RLE565."""
+    hdr = f.read(8)
+    if len(hdr) < 8 or hdr[:4] != MAGIC:
+        raise ValueError("not an RLE565 image")
+    w = (hdr[4] << 8) | hdr[5]
+    h = (hdr[6] << 8) | hdr[7]
+    return w, h, Decoder(f)
+
+
+def encode(pixels, width, height):
+    """Compress big-endian RGB565 pixel bytes into an RLE565 image (bytes)"""
+    npx = width * height
+    if len(pixels) < npx * 2:
+        raise ValueError("need %d bytes of pixels, got %d" % (npx * 2, len(pixels)))
+    out = bytearray(MAGIC)
+    out += bytes((width >> 8, width & 0xFF, height >> 8, height & 0xFF))
+    lit = bytearray()
+
+    def flush_literal():
+        i = 0
+        while i < len(lit):
+            chunk = lit[i:i + _MAX_RUN * 2]
+            out.append(len(chunk) // 2 - 1)
+            out.extend(chunk)
+            i += len(chunk)
+        del lit[:]
+
+    i = 0
+    while i < npx:
+        px = pixels[i * 2:i * 2 + 2]
+        run = 1
+        while (i + run < npx and run < _MAX_RUN and
+               pixels[(i + run) * 2:(i + run) * 2 + 2] == px):
+            run += 1
+        if run >= 2:
+            flush_literal()
+            out.append(0x80 | (run - 1))
+            out.extend(px)
+        else:
+            lit.extend(px)
+        i += run
+    flush_literal()
+    return bytes(out)
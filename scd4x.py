@@ -4,6 +4,8 @@ import time
 import struct
 from micropython import const
 import config
+import sensirion_crc
+import uasyncio as asyncio
 
 # Constants for SCD4X
 SCD4X_DEFAULT_ADDR = const(0x62)
@@ -29,21 +31,72 @@ _SCD4X_GETASCE = const(0x2313)
 _SCD4X_SETASCE = const(0x2416)
 _SCD4X_MEASURESINGLESHOT = const(0x219D)
 _SCD4X_MEASURESINGLESHOTRHTONLY = const(0x2196)
+_SCD4X_GETSENSORVARIANT = const(0x202F)
+
+# Datasheet execution time (ms) of each command. The sensor does not
+# answer I2C until it has finished, so the scheduler below never issues
+# the next command or reads a reply before this has elapsed.
+_EXEC_MS = {
+    _SCD4X_REINIT: 30,
+    _SCD4X_FACTORYRESET: 1200,
+    _SCD4X_FORCEDRECAL: 400,
+    _SCD4X_SELFTEST: 10000,
+    _SCD4X_DATAREADY: 1,
+    _SCD4X_STOPPERIODICMEASUREMENT: 500,
+    _SCD4X_STARTPERIODICMEASUREMENT: 0,
+    _SCD4X_STARTLOWPOWERPERIODICMEASUREMENT: 0,
+    _SCD4X_READMEASUREMENT: 1,
+    _SCD4X_SERIALNUMBER: 1,
+    _SCD4X_GETTEMPOFFSET: 1,
+    _SCD4X_SETTEMPOFFSET: 1,
+    _SCD4X_GETALTITUDE: 1,
+    _SCD4X_SETALTITUDE: 1,
+    _SCD4X_SETPRESSURE: 1,
+    _SCD4X_PERSISTSETTINGS: 800,
+    _SCD4X_GETASCE: 1,
+    _SCD4X_SETASCE: 1,
+    _SCD4X_MEASURESINGLESHOT: 5000,
+    _SCD4X_MEASURESINGLESHOTRHTONLY: 50,
+    _SCD4X_GETSENSORVARIANT: 1,
+}
+
+# read_measurement*() wait for begin()/set_mode() at most this many
+# init_poll() calls, sleeping at least _INIT_MIN_SLEEP_MS between them
+_INIT_MAX_POLLS = const(50)
+_INIT_MIN_SLEEP_MS = const(10)
+
+# Measurement modes (see set_mode)
+PERIODIC = 0        # new reading every 5 s, ~15 mA average
+LOW_POWER = 1       # new reading every 30 s, ~3 mA average
+SINGLE_SHOT = 2     # idle between on-demand readings (SCD41 only)
+
+MODE_NAMES = ("periodic", "low-power", "single-shot")
+
+# Measurement interval of each mode; single-shot readings are taken
+# whenever read_measurement() is called, so it has none
+_MODE_PERIOD_MS = (5000, 30000, 0)
+_MODE_START = (_SCD4X_STARTPERIODICMEASUREMENT,
+               _SCD4X_STARTLOWPOWERPERIODICMEASUREMENT, None)
 
 class SCD4X:
     """Driver for Sensirion SCD4X CO2 sensor with enhanced error handling"""
     
-    def __init__(self, i2c, address=None):
+    def __init__(self, i2c, address=None, settle=True, blocking=True):
         """Initialize the SCD4X CO2 sensor
         
         Args:
             i2c: I2C bus instance
             address: Optional I2C address override
+            settle: Wait for the first measurement before returning.
+                With False, poll data_ready instead (first result ~5 s)
+            blocking: With False, only begin() the init sequence; call
+                init_poll() until it returns True
         """
         print("[SCD4X] Initializing SCD4X CO2 sensor")
         self.i2c = i2c
         self.address = address if address is not None else config.SCD4X_I2C_ADDR
         self._buffer = bytearray(18)
+        self._buf_mv = memoryview(self._buffer)
         self._cmd = bytearray(2)
         self._crc_buffer = bytearray(2)
 
@@ -51,6 +104,34 @@ class SCD4X:
         self._relative_humidity = None
         self._co2 = None
         self._pressure = config.SENSOR_PRESSURE
+        self._settle = settle
+
+        # Latest (co2, temp, rh, ticks_ms) from read_measurement()
+        self._snapshot = None
+        self.period_ms = 5000       # periodic measurement interval
+        self.recheck_ms = 250       # min gap between data-ready checks
+        self._checked = None        # ticks of the last data-ready check
+        self._not_ready = None      # ticks of the last not-ready check
+        self._next_due = None       # no check before this (see _note_ready)
+        # I2C transaction counters (every write/read attempt)
+        self.transactions = 0
+        self.readings = 0
+
+        # Command scheduler: the command in flight and when it is done
+        self._pending = None
+        self._reply_len = 0
+        self._due = time.ticks_ms()
+        self._steps = None
+        self._step = 0
+        self._step_errors = 0
+        self.mode = PERIODIC
+        # Single-shot support: None until the variant has been read
+        # (SCD40: False, SCD41/SCD43: True) or a single shot has failed
+        self.single_shot = None
+
+        if not blocking:
+            self.begin()
+            return
 
         # Add delay before first command
         time.sleep(config.SENSOR_RETRY_DELAY)
@@ -88,28 +169,91 @@ class SCD4X:
         """Perform a soft reset of the sensor"""
         try:
             print("[SCD4X] Performing soft reset")
-            self._send_command(_SCD4X_REINIT, cmd_delay=0.02)
+            self._send_command(_SCD4X_REINIT)
         except Exception as e:
             print(f"[SCD4X] Soft reset error: {e}")
         time.sleep(config.SENSOR_RETRY_DELAY)
 
-    def _send_command(self, cmd, cmd_delay=0):
-        """Send command to the sensor with retry logic
+    # --- Command scheduler ---
+    # issue() writes a command, notes when the datasheet says it will be
+    # done and returns at once. poll() finishes it (reading the reply,
+    # if any) once that time has passed; complete() awaits it. The
+    # blocking methods below are issue() + sleep until done.
+
+    def busy(self):
+        """True while the last issued command is still executing"""
+        return time.ticks_diff(self._due, time.ticks_ms()) > 0
+
+    def remaining_ms(self):
+        """ms until the sensor accepts the next command"""
+        return max(0, time.ticks_diff(self._due, time.ticks_ms()))
+
+    def issue(self, cmd, value=None, reply=0):
+        """Write a command (with an optional 16-bit value) and return
+        without waiting. reply is the number of reply bytes poll() will
+        read. Raises RuntimeError if a command is still in flight."""
+        if self._pending is not None or self.busy():
+            raise RuntimeError("SCD4X busy")
+        if value is None:
+            self._cmd[0] = (cmd >> 8) & 0xFF
+            self._cmd[1] = cmd & 0xFF
+            self.transactions += 1
+            self.i2c.writeto(self.address, self._cmd)
+        else:
+            self._buffer[0] = (cmd >> 8) & 0xFF
+            self._buffer[1] = cmd & 0xFF
+            self._crc_buffer[0] = self._buffer[2] = (value >> 8) & 0xFF
+            self._crc_buffer[1] = self._buffer[3] = value & 0xFF
+            self._buffer[4] = self._crc8(self._crc_buffer)
+            self.transactions += 1
+            self.i2c.writeto(self.address, self._buf_mv[:5])
+        self._pending = cmd
+        self._reply_len = reply
+        self._due = time.ticks_add(time.ticks_ms(), _EXEC_MS.get(cmd, 1))
+
+    def poll(self):
+        """Finish the command in flight if its execution time is up.
+        Returns None while it is still executing, otherwise True, or the
+        CRC-checked reply (a view into the shared buffer, valid until
+        the next command) for a command issued with reply > 0."""
+        if self._pending is None:
+            return True
+        if self.busy():
+            return None
+        self._pending = None
+        if self._reply_len:
+            self._read_reply(self._reply_len)
+            return self._buf_mv[:self._reply_len]
+        return True
+
+    async def complete(self):
+        """Await the command in flight; returns what poll() returns"""
+        while True:
+            r = self.poll()
+            if r is not None:
+                return r
+            await asyncio.sleep_ms(self.remaining_ms())
+
+    def _wait(self):
+        """Block until the command in flight has finished"""
+        ms = self.remaining_ms()
+        if ms:
+            time.sleep_ms(ms)
+        self.poll()
+
+    def _send_command(self, cmd, value=None):
+        """Send command to the sensor with retry logic and wait for it
         
         Args:
             cmd: Command code
-            cmd_delay: Delay after sending command
+            value: Optional 16-bit value sent with the command
         """
+        self._wait()
         retry_count = config.MAX_CONSECUTIVE_ERRORS
         while retry_count > 0:
             try:
-                self._cmd[0] = (cmd >> 8) & 0xFF
-                self._cmd[1] = cmd & 0xFF
-                self.i2c.writeto(self.address, self._cmd)
-                time.sleep(0.01)  # Small delay after I2C operation
-                if cmd_delay > 0:
-                    time.sleep(cmd_delay)
-                return
+                self.issue(cmd, value)
+                break
             except OSError as e:
                 retry_count -= 1
                 if retry_count == 0:
@@ -117,35 +261,16 @@ class SCD4X:
                     raise e
                 print(f"[SCD4X] Command retry after error")
                 time.sleep(config.SENSOR_RETRY_DELAY)
+        self._wait()
 
-    def _set_command_value(self, cmd, value, cmd_delay=0):
+    def _set_command_value(self, cmd, value):
         """Send command with value to the sensor
         
         Args:
             cmd: Command code
             value: Value to send
-            cmd_delay: Delay after sending command
         """
-        retry_count = config.MAX_CONSECUTIVE_ERRORS
-        while retry_count > 0:
-            try:
-                self._buffer[0] = (cmd >> 8) & 0xFF
-                self._buffer[1] = cmd & 0xFF
-                self._crc_buffer[0] = self._buffer[2] = (value >> 8) & 0xFF
-                self._crc_buffer[1] = self._buffer[3] = value & 0xFF
-                self._buffer[4] = self._crc8(self._crc_buffer)
-                self.i2c.writeto(self.address, self._buffer[:5])
-                time.sleep(0.01)  # Small delay after I2C operation
-                if cmd_delay > 0:
-                    time.sleep(cmd_delay)
-                return
-            except OSError as e:
-                retry_count -= 1
-                if retry_count == 0:
-                    print(f"[SCD4X] Command with value failed: {e}")
-                    raise e
-                print(f"[SCD4X] Command with value retry")
-                time.sleep(config.SENSOR_RETRY_DELAY)
+        self._send_command(cmd, value)
 
     def _read_reply(self, num):
         """Read reply from the sensor
@@ -156,10 +281,9 @@ class SCD4X:
         retry_count = config.MAX_CONSECUTIVE_ERRORS
         while retry_count > 0:
             try:
-                read_data = self.i2c.readfrom(self.address, num)
-                for i in range(num):
-                    self._buffer[i] = read_data[i]
-                self._check_buffer_crc(self._buffer[:num])
+                self.transactions += 1
+                self.i2c.readfrom_into(self.address, self._buf_mv[:num])
+                self._check_buffer_crc(self._buffer, num)
                 return
             except OSError as e:
                 retry_count -= 1
@@ -169,53 +293,61 @@ class SCD4X:
                 print(f"[SCD4X] Read reply retry")
                 time.sleep(config.SENSOR_RETRY_DELAY)
 
-    def _check_buffer_crc(self, buf):
-        """Check CRC of received data"""
-        for i in range(0, len(buf), 3):
-            if i+2 < len(buf) and self._crc8(buf[i:i+2]) != buf[i+2]:
-                raise RuntimeError("CRC check failed")
+    def _check_buffer_crc(self, buf, num=None):
+        """Check CRC of received data (in place, first num bytes)"""
+        if not sensirion_crc.verify(buf, num):
+            raise RuntimeError("CRC check failed")
 
     @staticmethod
     def _crc8(buffer):
         """Calculate CRC-8 checksum"""
-        crc = 0xFF
-        for byte in buffer:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ 0x31
-                else:
-                    crc <<= 1
-        return crc & 0xFF
+        return sensirion_crc.crc8(buffer)
 
     def stop_periodic_measurement(self):
         """Stop periodic measurement."""
-        self._send_command(_SCD4X_STOPPERIODICMEASUREMENT, cmd_delay=0.5)
+        self._send_command(_SCD4X_STOPPERIODICMEASUREMENT)
 
-    def start_periodic_measurement(self):
+    def start_periodic_measurement(self, settle=True):
         """Start periodic measurement."""
         self._send_command(_SCD4X_STARTPERIODICMEASUREMENT)
-        time.sleep(1)
+        if settle:
+            time.sleep(1)
+
+    def start_low_power_periodic_measurement(self):
+        """Start low-power periodic measurement (one reading per 30 s)."""
+        self._send_command(_SCD4X_STARTLOWPOWERPERIODICMEASUREMENT)
+
+    def measure_single_shot(self, rht_only=False):
+        """Take one measurement while idle; blocks 5 s (50 ms with
+        rht_only, which leaves CO2 at 0). Read it with read_measurement()."""
+        if rht_only:
+            self._send_command(_SCD4X_MEASURESINGLESHOTRHTONLY)
+        else:
+            self._send_command(_SCD4X_MEASURESINGLESHOT)
 
     def get_temperature_offset(self):
         """Get the current temperature offset in degrees C."""
-        self._send_command(_SCD4X_GETTEMPOFFSET, cmd_delay=0.001)
+        self._send_command(_SCD4X_GETTEMPOFFSET)
         self._read_reply(3)
         temp_offset_raw = struct.unpack_from(">H", self._buffer[0:2])[0]
         return temp_offset_raw * 175.0 / 65535.0
 
     def set_temperature_offset(self, offset_c):
         """Set temperature offset in degrees C."""
+        self._set_command_value(_SCD4X_SETTEMPOFFSET, self._offset_raw(offset_c))
+
+    @staticmethod
+    def _offset_raw(offset_c):
+        """Validate an offset in degrees C and encode it for the sensor"""
         if offset_c < 0 or offset_c > 175:
             raise ValueError("Offset must be between 0 and 175 degrees C")
-        offset_raw = int(offset_c * 65535 / 175)
-        self._set_command_value(_SCD4X_SETTEMPOFFSET, offset_raw)
+        return int(offset_c * 65535 / 175)
 
     @property
     def data_ready(self):
         """Check if data is ready to be read."""
         try:
-            self._send_command(_SCD4X_DATAREADY, cmd_delay=0.001)
+            self._send_command(_SCD4X_DATAREADY)
             self._read_reply(3)
             return not ((self._buffer[0] & 0x07 == 0) and (self._buffer[1] == 0))
         except Exception as e:
@@ -225,40 +357,62 @@ class SCD4X:
     def _read_data(self):
         """Internal method to read sensor data."""
         retry_count = config.MAX_CONSECUTIVE_ERRORS
-        while retry_count > 0:
+        while True:
             try:
-                self._send_command(_SCD4X_READMEASUREMENT, cmd_delay=0.001)
+                self._send_command(_SCD4X_READMEASUREMENT)
                 self._read_reply(9)
-                
-                self._co2 = struct.unpack_from(">H", self._buffer[0:2])[0]
-                temp_raw = struct.unpack_from(">H", self._buffer[3:5])[0]
-
-                if temp_raw == 0:
-                    self._temperature = -45
-                elif temp_raw == 65535:
-                    self._temperature = 130
-                else:
-                    self._temperature = -45 + 175 * (temp_raw / 65535)
-
-                # Apply temperature offset from config
-                self._temperature += config.TEMP_OFFSET
-
-                humi_raw = struct.unpack_from(">H", self._buffer[6:8])[0]
-                self._relative_humidity = 100 * (humi_raw / 65535)
-
-                # Validate readings
-                if not self._validate_readings():
-                    raise ValueError("Readings outside valid ranges")
-
+                self._parse_data()
                 return
             except Exception as e:
                 retry_count -= 1
-                if retry_count == 0:
-                    print(f"[SCD4X] Error reading data: {e}")
-                    raise
-                print("[SCD4X] Retrying data read")
+                self._read_failed(e, retry_count)
                 time.sleep(config.SENSOR_RETRY_DELAY)
 
+    async def _read_data_async(self):
+        """_read_data() for uasyncio: same retries, yielding while waiting"""
+        retry_count = config.MAX_CONSECUTIVE_ERRORS
+        while True:
+            try:
+                self.issue(_SCD4X_READMEASUREMENT, reply=9)
+                await self.complete()
+                self._parse_data()
+                return
+            except Exception as e:
+                retry_count -= 1
+                self._read_failed(e, retry_count)
+                await asyncio.sleep_ms(int(config.SENSOR_RETRY_DELAY * 1000))
+
+    @staticmethod
+    def _read_failed(e, retries_left):
+        """Retry policy shared by both read paths: an I2C, CRC or range
+        error is retried until retries_left reaches 0, then re-raised"""
+        if retries_left <= 0:
+            print(f"[SCD4X] Error reading data: {e}")
+            raise e
+        print("[SCD4X] Retrying data read")
+
+    def _parse_data(self):
+        """Decode a 9-byte measurement reply in the buffer"""
+        self._co2 = struct.unpack_from(">H", self._buffer[0:2])[0]
+        temp_raw = struct.unpack_from(">H", self._buffer[3:5])[0]
+
+        if temp_raw == 0:
+            self._temperature = -45
+        elif temp_raw == 65535:
+            self._temperature = 130
+        else:
+            self._temperature = -45 + 175 * (temp_raw / 65535)
+
+        # Apply temperature offset from config
+        self._temperature += config.TEMP_OFFSET
+
+        humi_raw = struct.unpack_from(">H", self._buffer[6:8])[0]
+        self._relative_humidity = 100 * (humi_raw / 65535)
+
+        # Validate readings
+        if not self._validate_readings():
+            raise ValueError("Readings outside valid ranges")
+
     def _validate_readings(self):
         """Validate all sensor readings against config ranges."""
         return (
@@ -267,25 +421,131 @@ class SCD4X:
             config.VALID_HUMIDITY_RANGE[0] <= self._relative_humidity <= config.VALID_HUMIDITY_RANGE[1]
         )
 
+    def read_measurement(self):
+        """Get one consistent (co2, temp_c, rh, ticks_ms) snapshot.
+
+        Costs one data-ready check and, if a new measurement is waiting,
+        one 9-byte read. The cached snapshot is returned with no I2C
+        traffic at all within recheck_ms of the last check, or while the
+        next measurement cannot have landed yet: when a not-ready check
+        was followed by a ready one, the measurement was taken after
+        that not-ready check, so the next is at least period_ms later
+        (checks resume recheck_ms before that). Returns None until the
+        first measurement has been read.
+        """
+        for _ in range(_INIT_MAX_POLLS):
+            if self.init_poll():
+                break
+            time.sleep_ms(max(_INIT_MIN_SLEEP_MS, self.remaining_ms()))
+        else:
+            self._init_stuck()
+        if not self._due_check():
+            return self._snapshot
+        if self.mode == SINGLE_SHOT:
+            try:
+                self.measure_single_shot()
+                self._read_data()
+                self.single_shot = True
+            except OSError:
+                if self.single_shot:
+                    raise
+                self._no_single_shot("no reply")
+                return self._snapshot
+            self._store()
+        elif self._note_ready(self.data_ready):
+            self._read_data()
+            self._store()
+        return self._snapshot
+
+    async def read_measurement_async(self):
+        """read_measurement() for uasyncio: yields during the command
+        execution times instead of sleeping. Finishes a begin() that is
+        still in progress first."""
+        for _ in range(_INIT_MAX_POLLS):
+            if self.init_poll():
+                break
+            await asyncio.sleep_ms(max(_INIT_MIN_SLEEP_MS, self.remaining_ms()))
+        else:
+            self._init_stuck()
+        if not self._due_check():
+            return self._snapshot
+        await self.complete()
+        if self.mode == SINGLE_SHOT:
+            try:
+                self.issue(_SCD4X_MEASURESINGLESHOT)
+                await self.complete()
+                await self._read_data_async()
+                self.single_shot = True
+            except OSError:
+                if self.single_shot:
+                    raise
+                self._no_single_shot("no reply")
+                return self._snapshot
+        else:
+            self.issue(_SCD4X_DATAREADY, reply=3)
+            r = await self.complete()
+            if not self._note_ready(not ((r[0] & 0x07 == 0) and (r[1] == 0))):
+                return self._snapshot
+            await self._read_data_async()
+        self._store()
+        return self._snapshot
+
+    def _init_stuck(self):
+        """begin()/set_mode() steps did not finish within _INIT_MAX_POLLS
+        polls; they resume on the next read"""
+        print(f"[SCD4X] Init stuck at step {self._step}")
+        raise OSError("SCD4X init did not finish")
+
+    def _due_check(self):
+        """True if it is time to ask the sensor for a new measurement"""
+        now = time.ticks_ms()
+        if self._next_due is not None and time.ticks_diff(self._next_due, now) > 0:
+            return False
+        if self._checked is not None and time.ticks_diff(now, self._checked) < self.recheck_ms:
+            return False
+        self._checked = now
+        return True
+
+    def _note_ready(self, ready):
+        """Record one data-ready check (made at self._checked); returns
+        ready. A ready bit right after a not-ready check dates the
+        measurement, so checks can pause until just before the next."""
+        if not ready:
+            self._not_ready = self._checked
+            return False
+        if self._not_ready is not None and self.period_ms:
+            self._next_due = time.ticks_add(self._not_ready,
+                                            self.period_ms - self.recheck_ms)
+        else:
+            self._next_due = None
+        self._not_ready = None
+        return True
+
+    def _store(self):
+        self._snapshot = (self._co2, self._temperature,
+                          self._relative_humidity, time.ticks_ms())
+        self.readings += 1
+
+    def transactions_per_reading(self):
+        """Average I2C transactions per new measurement so far"""
+        return self.transactions / self.readings if self.readings else 0.0
+
     @property
     def CO2(self):
         """Get CO2 measurement in ppm."""
-        if self.data_ready:
-            self._read_data()
+        self.read_measurement()
         return self._co2
 
     @property
     def temperature(self):
         """Get temperature in degrees Celsius."""
-        if self.data_ready:
-            self._read_data()
+        self.read_measurement()
         return self._temperature
 
     @property
     def relative_humidity(self):
         """Get relative humidity in percent."""
-        if self.data_ready:
-            self._read_data()
+        self.read_measurement()
         return self._relative_humidity
 
     @property
@@ -308,24 +568,134 @@ class SCD4X:
 
     def factory_reset(self):
         """Perform a factory reset."""
-        self._send_command(_SCD4X_FACTORYRESET, cmd_delay=1.2)
+        self._send_command(_SCD4X_FACTORYRESET)
 
     def self_test(self):
         """Perform a self-test."""
-        self._send_command(_SCD4X_SELFTEST, cmd_delay=10)
+        self._send_command(_SCD4X_SELFTEST)
         self._read_reply(3)
         return (self._buffer[0] << 8) | self._buffer[1]
 
     def get_serial_number(self):
         """Get the serial number of the sensor."""
-        self._send_command(_SCD4X_SERIALNUMBER, cmd_delay=0.001)
+        self._send_command(_SCD4X_SERIALNUMBER)
         self._read_reply(9)
         return (self._buffer[0] << 40) | (self._buffer[1] << 32) | (self._buffer[3] << 24) | \
                (self._buffer[4] << 16) | (self._buffer[6] << 8) | self._buffer[7]
 
     def persist_settings(self):
         """Persist settings to EEPROM."""
-        self._send_command(_SCD4X_PERSISTSETTINGS, cmd_delay=0.8)
+        self._send_command(_SCD4X_PERSISTSETTINGS)
+
+    def begin(self):
+        """Start the init sequence without blocking: stop, configure
+        from config, start measuring in the current mode. Call
+        init_poll() until it returns True; each call issues at most one
+        command. Config values get the same range checks as the
+        set_* methods (ValueError before anything is sent)."""
+        if not (config.VALID_PRESSURE_RANGE[0] <= config.SENSOR_PRESSURE <= config.VALID_PRESSURE_RANGE[1]):
+            raise ValueError("SENSOR_PRESSURE out of range")
+        if config.SENSOR_ALTITUDE < 0 or config.SENSOR_ALTITUDE > 65535:
+            raise ValueError("Altitude must be between 0 and 65535 meters")
+        offset_raw = self._offset_raw(config.TEMP_OFFSET)
+        self._pressure = config.SENSOR_PRESSURE
+        self._steps = (
+            (_SCD4X_STOPPERIODICMEASUREMENT, None),
+            (_SCD4X_SETALTITUDE, config.SENSOR_ALTITUDE),
+            (_SCD4X_SETPRESSURE, config.SENSOR_PRESSURE),
+            (_SCD4X_SETTEMPOFFSET, offset_raw),
+        ) + self._start_steps()
+        self._step = 0
+        self._step_errors = 0
+
+    def _start_steps(self):
+        start = _MODE_START[self.mode]
+        if start is not None:
+            return ((start, None),)
+        if self.single_shot is None:
+            # single-shot starts nothing; check the sensor can do it
+            return ((_SCD4X_GETSENSORVARIANT, None),)
+        return ()
+
+    def _check_variant(self, reply):
+        """Note single-shot support from a get_sensor_variant reply
+        (bits 15:12: 0 = SCD40, 1 = SCD41, 5 = SCD43)"""
+        variant = reply[0] >> 4
+        self.single_shot = variant != 0
+        print(f"[SCD4X] Sensor variant {variant}")
+        if not self.single_shot and self.mode == SINGLE_SHOT:
+            self._no_single_shot("SCD40")
+
+    def _no_single_shot(self, why):
+        """Single-shot is not available: measure in low-power mode instead"""
+        self.single_shot = False
+        print(f"[SCD4X] Single-shot not supported ({why}), using low-power mode")
+        self.set_mode(LOW_POWER)
+
+    def set_mode(self, mode):
+        """Switch to PERIODIC, LOW_POWER or SINGLE_SHOT without blocking.
+        The stop (500 ms) and start commands run through init_poll(),
+        which read_measurement() and read_measurement_async() drive.
+        period_ms follows the mode. SINGLE_SHOT first reads the sensor
+        variant; on an SCD40 (or if a single shot gets no reply) the
+        sensor measures in LOW_POWER mode instead."""
+        if mode == SINGLE_SHOT and self.single_shot is False:
+            mode = LOW_POWER
+        if mode == self.mode:
+            return
+        self.mode = mode
+        self.period_ms = _MODE_PERIOD_MS[mode]
+        self._not_ready = None
+        self._next_due = None
+        print(f"[SCD4X] Switching to {MODE_NAMES[mode]} mode")
+        if self._steps is not None and len(self._steps) >= 4 and self._step <= 4:
+            # begin() still configuring: only its start step changes
+            self._steps = self._steps[:4] + self._start_steps()
+            return
+        self._steps = ((_SCD4X_STOPPERIODICMEASUREMENT, None),) + self._start_steps()
+        self._step = 0
+        self._step_errors = 0
+
+    def init_poll(self):
+        """Advance begin() or set_mode(). Returns True once the mode's
+        measurement has been started, False while steps remain. A step that fails is
+        retried on the next call, up to MAX_CONSECUTIVE_ERRORS times."""
+        if self._steps is None:
+            return True
+        variant = self._pending == _SCD4X_GETSENSORVARIANT
+        try:
+            r = self.poll()
+        except (OSError, RuntimeError) as e:
+            if not variant:
+                raise
+            print(f"[SCD4X] Sensor variant unreadable: {e}")
+            r = True
+        if r is None:
+            return False
+        if variant and r is not True:
+            self._check_variant(r)
+        if self._step == len(self._steps):
+            self._steps = None
+            print(f"[SCD4X] Ready, {MODE_NAMES[self.mode]} mode")
+            return True
+        cmd, value = self._steps[self._step]
+        try:
+            self.issue(cmd, value, 3 if cmd == _SCD4X_GETSENSORVARIANT else 0)
+        except OSError as e:
+            if cmd == _SCD4X_GETSENSORVARIANT:
+                # older firmware: unknown, a failed single shot decides
+                print(f"[SCD4X] Sensor variant unreadable: {e}")
+                self._step += 1
+                return False
+            self._step_errors += 1
+            if self._step_errors >= config.MAX_CONSECUTIVE_ERRORS:
+                self._steps = None
+                print(f"[SCD4X] Init failed: {e}")
+                raise
+            return False
+        self._step += 1
+        self._step_errors = 0
+        return False
 
     def initialize_with_config(self):
         """Initialize sensor with settings from config file."""
@@ -334,9 +704,10 @@ class SCD4X:
             self.set_altitude(config.SENSOR_ALTITUDE)
             self.set_ambient_pressure(config.SENSOR_PRESSURE)
             self.set_temperature_offset(config.TEMP_OFFSET)
-            self.start_periodic_measurement()
-            print(f"[SCD4X] Waiting {config.SENSOR_INIT_DELAY}s for first measurement")
-            time.sleep(config.SENSOR_INIT_DELAY)
+            self.start_periodic_measurement(self._settle)
+            if self._settle:
+                print(f"[SCD4X] Waiting {config.SENSOR_INIT_DELAY}s for first measurement")
+                time.sleep(config.SENSOR_INIT_DELAY)
             return True
         except Exception as e:
             print(f"[SCD4X] Error initializing sensor with config: {e}")
@@ -6,6 +6,7 @@ _sd = None
 _mounted = False
 _LOG_FILE = "/sd/envlog.csv"
 _LOG_DIR = "/sd"
+_BOOT_FILE = "/sd/boot.log"
 
 
 def init():
@@ -67,6 +68,21 @@ def log(timestamp, co2, temp_c, humidity, lux, pressure, localtime=None):
         return False
 
 
+def log_boot(marks, fast=False):
+    """Append one boot timeline line: list of (phase, ms since reset)"""
+    if not _mounted:
+        return False
+    try:
+        with open(_BOOT_FILE, "a") as f:
+            f.write("fast={} {}\n".format(
+                1 if fast else 0,
+                " ".join("{}={}".format(p, ms) for p, ms in marks)))
+        return True
+    except Exception as e:
+        print("[SD] Boot log error:", e)
+        return False
+
+
 def is_mounted():
     return _mounted
 
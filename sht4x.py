@@ -1,23 +1,11 @@
 """Simple SHT4x temperature/humidity sensor driver"""
 import time
+import sensirion_crc
 
 SHT4X_ADDR = 0x44
 _MEASURE_HIGH = 0xFD  # High precision measurement
 
 
-def _crc8(data):
-    crc = 0xFF
-    for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 0x80:
-                crc = (crc << 1) ^ 0x31
-            else:
-                crc = crc << 1
-            crc &= 0xFF
-    return crc
-
-
 class SHT4X:
     def __init__(self, i2c, address=SHT4X_ADDR):
         self.i2c = i2c
@@ -31,7 +19,7 @@ class SHT4X:
         time.sleep_ms(10)
         data = self.i2c.readfrom(self.addr, 6)
         # Check CRCs
-        if _crc8(data[0:2]) != data[2] or _crc8(data[3:5]) != data[5]:
+        if not sensirion_crc.verify(data, 6):
             raise ValueError("SHT4x CRC error")
         t_raw = (data[0] << 8) | data[1]
         h_raw = (data[3] << 8) | data[4]
@@ -0,0 +1,71 @@
+"""
+Shared SPI bus arbiter
+======================
+One SPIBus owns an SPI peripheral; each chip on it gets a Device
+session holding its CS pin and bus settings:
+
+    bus = SPIBus(spi, baudrate=20000000)
+    lcd = bus.device(lcd_cs, 20000000)
+    tp = bus.device(touch_cs, 2000000)
+    with tp:
+        bus.spi.write(...)
+
+Entering a session asserts that device's CS. The peripheral is
+re-initialized only when the new device's settings differ from the
+last ones applied. Sessions are re-entrant for the same device; trying
+to open a second device while one holds the bus raises RuntimeError,
+so two chips are never selected at once.
+"""
+
+
+class Device:
+    """Session for one chip: use as a context manager around transfers"""
+
+    def __init__(self, bus, cs, baudrate, polarity=0, phase=0):
+        self.bus = bus
+        self.cs = cs
+        self.conf = (baudrate, polarity, phase)
+        self.depth = 0
+        cs.value(1)
+
+    def __enter__(self):
+        if self.depth == 0:
+            self.bus._acquire(self)
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.depth -= 1
+        if self.depth == 0:
+            self.cs.value(1)
+            self.bus._active = None
+        return False
+
+
+class SPIBus:
+    """Owner of one SPI peripheral shared by several devices.
+    baudrate/polarity/phase describe how spi is configured right now."""
+
+    def __init__(self, spi, baudrate, polarity=0, phase=0):
+        self.spi = spi
+        self._conf = (baudrate, polarity, phase)
+        self._active = None
+        self.reconfigs = 0
+
+    def device(self, cs, baudrate, polarity=0, phase=0):
+        return Device(self, cs, baudrate, polarity, phase)
+
+    def busy(self):
+        """True while some device holds the bus"""
+        return self._active is not None
+
+    def _acquire(self, dev):
+        if self._active is not None:
+            raise RuntimeError("SPI bus held by another device")
+        if dev.conf != self._conf:
+            baudrate, polarity, phase = dev.conf
+            self.spi.init(baudrate=baudrate, polarity=polarity, phase=phase)
+            self._conf = dev.conf
+            self.reconfigs += 1
+        self._active = dev
+        dev.cs.value(0)
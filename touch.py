@@ -6,7 +6,11 @@ Pins: Touch CS=GPIO33, Touch IRQ=GPIO36
 """
 
 from machine import Pin
+from array import array
+import micropython
+import time
 import display
+import gesture
 
 T_CS  = Pin(33, Pin.OUT, value=1)
 T_IRQ = Pin(36, Pin.IN)
@@ -20,51 +24,224 @@ Y_MIN = 380
 Y_MAX = 3720
 
 
+# XPT2046 session on the display's SPI bus (max ~2MHz)
+_dev = display.bus.device(T_CS, 2000000)
+_CMD_X = b'\x90'
+_CMD_Y = b'\xd0'
+_raw = bytearray(2)
+
+# Fixed sample arrays; read()/sample() allocate nothing per call
+_N = 5
+_sx = array('H', bytes(2 * _N))
+_sy = array('H', bytes(2 * _N))
+raw = array('H', [0, 0])    # median raw X/Y of the last sample()
+pos = array('h', [0, 0])    # screen x/y of the last sample()
+
+
+def _median(a, n):
+    """Median of a[:n] by in-place insertion sort (n is tiny)"""
+    for i in range(1, n):
+        v = a[i]
+        j = i - 1
+        while j >= 0 and a[j] > v:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = v
+    return a[n >> 1]
+
+
+def calibrate(rx, ry, out):
+    """Raw XPT2046 values -> screen coords in out[0], out[1]"""
+    # Both axes inverted: high raw = low screen coord
+    x = display.W - 1 - (rx - X_MIN) * display.W // (X_MAX - X_MIN)
+    y = display.H - 1 - (ry - Y_MIN) * display.H // (Y_MAX - Y_MIN)
+    out[0] = max(0, min(display.W - 1, x))
+    out[1] = max(0, min(display.H - 1, y))
+
+
+def sample():
+    """Read the panel into raw and pos. Returns True if touched."""
+    if T_IRQ.value() != 0:
+        return False
+
+    spi = display.spi
+    n = 0
+    with _dev:
+        for _ in range(_N):
+            spi.write(_CMD_X)  # X channel
+            spi.readinto(_raw)
+            rx = ((_raw[0] << 8) | _raw[1]) >> 3
+
+            spi.write(_CMD_Y)  # Y channel
+            spi.readinto(_raw)
+            ry = ((_raw[0] << 8) | _raw[1]) >> 3
+
+            if 100 < rx < 4000 and 100 < ry < 4000:
+                _sx[n] = rx
+                _sy[n] = ry
+                n += 1
+
+    if n < 2:
+        return False
+    raw[0] = _median(_sx, n)
+    raw[1] = _median(_sy, n)
+    calibrate(raw[0], raw[1], pos)
+    return True
+
+
 def read():
     """Read touch position. Returns (x, y) in screen coords or None."""
-    if T_IRQ.value() != 0:
+    if not sample():
         return None
+    return (pos[0], pos[1])
+
+
+# --- Interrupt-driven events ---
+# PENIRQ falls on pen-down; the IRQ handler only schedules a sample.
+# From that edge until PENIRQ has been high for RELEASE_POLLS polls the
+# pen counts as down (even if no sample was valid, e.g. a light touch),
+# so further edges are ignored and the owner calls poll() every POLL_MS
+# to get gestures and RELEASE; with nobody touching there is no SPI
+# traffic.
 
-    # Slow SPI for XPT2046 (max ~2MHz)
-    display.spi.init(baudrate=2000000)
-    display.cs.value(1)
+PRESS = 1
+HOLD = gesture.LONG
+RELEASE = 3
+# Gestures are queued too: gesture.TAP, LONG (== HOLD), SWIPE_*
 
-    samples_x = []
-    samples_y = []
+POLL_MS = 30
+RELEASE_POLLS = 2       # consecutive pen-up polls before RELEASE
 
-    for _ in range(5):
-        T_CS.value(0)
-        display.spi.write(bytes([0x90]))  # X channel
-        raw = display.spi.read(2)
-        rx = ((raw[0] << 8) | raw[1]) >> 3
-        T_CS.value(1)
+_QLEN = 8               # ring slots; holds _QLEN - 1 events
+_q_ev = bytearray(_QLEN)
+_q_x = [0] * _QLEN
+_q_y = [0] * _QLEN
+_q_wr = 0               # written only by the sampling side
+_q_rd = 0               # written only by get()
 
-        T_CS.value(0)
-        display.spi.write(bytes([0xD0]))  # Y channel
-        raw = display.spi.read(2)
-        ry = ((raw[0] << 8) | raw[1]) >> 3
-        T_CS.value(1)
+_pen = False            # PENIRQ seen, not yet released: ignore more edges
+_down = False           # valid samples since PRESS
+_up_polls = 0
+_rec = gesture.Recognizer()
+_deferred = False
+_sampling = False
+_flag = None
 
-        if 100 < rx < 4000 and 100 < ry < 4000:
-            samples_x.append(rx)
-            samples_y.append(ry)
 
-    # Restore fast SPI for display
-    display.spi.init(baudrate=20000000)
+def _push(ev, x, y):
+    """Queue an event; dropped if the queue is full"""
+    global _q_wr
+    nxt = (_q_wr + 1) % _QLEN
+    if nxt == _q_rd:
+        return
+    _q_ev[_q_wr] = ev
+    _q_x[_q_wr] = x
+    _q_y[_q_wr] = y
+    _q_wr = nxt
 
-    if len(samples_x) < 2:
+
+def get():
+    """Oldest queued (event, x, y), or None when the queue is empty"""
+    global _q_rd
+    i = _q_rd
+    if i == _q_wr:
         return None
+    ev = (_q_ev[i], _q_x[i], _q_y[i])
+    _q_rd = (i + 1) % _QLEN
+    return ev
 
-    samples_x.sort()
-    samples_y.sort()
-    mid = len(samples_x) // 2
-    rx = samples_x[mid]
-    ry = samples_y[mid]
 
-    # Both axes inverted: high raw = low screen coord
-    x = display.W - 1 - (rx - X_MIN) * display.W // (X_MAX - X_MIN)
-    y = display.H - 1 - (ry - Y_MIN) * display.H // (Y_MAX - Y_MIN)
-    x = max(0, min(display.W - 1, x))
-    y = max(0, min(display.H - 1, y))
+def pending():
+    """Number of queued events"""
+    return (_q_wr - _q_rd) % _QLEN
+
+
+def active():
+    """True while the pen is down or a sample is waiting for the bus"""
+    return _pen or _deferred
+
+
+def _sample(_):
+    global _sampling, _deferred
+    if _sampling:
+        return
+    if display.bus.busy():
+        # Scheduled in the middle of a display transfer: the owner's
+        # next poll() samples once the bus is free
+        _deferred = True
+        return
+    _deferred = False
+    _sampling = True
+    try:
+        _track(sample())
+    finally:
+        _sampling = False
+
+
+def _track(touched):
+    """Debounce one sample into PRESS / RELEASE and feed the gesture
+    recognizer; gestures are queued at the stroke's start point."""
+    global _pen, _down, _up_polls
+    now = time.ticks_ms()
+    if not touched:
+        _up_polls += 1
+        if _up_polls >= RELEASE_POLLS:
+            if _down:
+                _down = False
+                g = _rec.up(now)
+                if g:
+                    _push(g, _rec.x0, _rec.y0)
+                _push(RELEASE, _rec.x, _rec.y)
+            if T_IRQ.value():
+                # Pen really up (not just unreadable): rearm PENIRQ
+                _pen = False
+                _up_polls = 0
+        return
+    _pen = True
+    _up_polls = 0
+    if not _down:
+        _down = True
+        _rec.down(pos[0], pos[1], now)
+        _push(PRESS, pos[0], pos[1])
+    else:
+        g = _rec.move(pos[0], pos[1], now)
+        if g:
+            _push(g, _rec.x0, _rec.y0)
+
+
+def _scheduled(_):
+    _sample(None)
+    if _flag is not None:
+        _flag.set()
+
+
+def _irq(pin):
+    global _pen
+    if _pen:
+        return
+    # Down from the first edge, whether or not its samples are valid
+    _pen = True
+    try:
+        micropython.schedule(_scheduled, None)
+    except RuntimeError:
+        _pen = False    # schedule queue full; the next edge retries
+
+
+def start(flag=None):
+    """Enable pen-down interrupts. flag (e.g. a uasyncio.ThreadSafeFlag)
+    is set whenever a pen-down has been sampled."""
+    global _flag
+    _flag = flag
+    T_IRQ.irq(trigger=Pin.IRQ_FALLING, handler=_irq)
+
+
+def stop():
+    T_IRQ.irq(handler=None)
+
 
-    return (x, y)
+def poll():
+    """Sample while the pen is down (call every POLL_MS). Returns
+    active() so the caller knows whether to keep polling."""
+    if _pen or _deferred:
+        _sample(None)
+    return _pen or _deferred
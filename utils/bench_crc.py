@@ -0,0 +1,130 @@
+"""
+Sensirion CRC-8 check and benchmark
+====================================
+Verifies sensirion_crc against the datasheet vectors and the bitwise
+implementation the drivers used before, then times both on a 9-byte
+SCD4x measurement reply.
+
+Runs on the host (CPython) or on the board (MicroPython):
+    python utils/bench_crc.py            # checks + benchmark
+    python utils/bench_crc.py --table    # print the TABLE literal
+    mpremote run utils/bench_crc.py      # on the board
+"""
+
+import sys
+import time
+
+try:
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:
+    ticks_us = lambda: time.perf_counter_ns() // 1000
+    ticks_diff = lambda a, b: a - b
+
+sys.path.append(".")
+sys.path.append("..")
+import sensirion_crc  # noqa: E402
+
+# (bytes, crc): 0xBEEF -> 0x92 is the SCD4x / SHT4x datasheet example,
+# 0x0000 -> 0x81 catches a wrong init value
+VECTORS = (
+    (b"\xbe\xef", 0x92),
+    (b"\x00\x00", 0x81),
+)
+
+# SCD4x read_measurement reply: CO2 0x01F4 (500 ppm), T 0x6667, RH 0x5EB9
+REPLY = bytes((0x01, 0xF4, 0x33, 0x66, 0x67, 0xA2, 0x5E, 0xB9, 0x3C))
+
+
+def crc8_bitwise(buffer):
+    """The drivers' original bit-by-bit CRC"""
+    crc = 0xFF
+    for byte in buffer:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = (crc << 1) ^ 0x31
+            else:
+                crc <<= 1
+    return crc & 0xFF
+
+
+def check_bitwise(buf):
+    """The original _check_buffer_crc: a slice per word"""
+    for i in range(0, len(buf), 3):
+        if i + 2 < len(buf) and crc8_bitwise(buf[i:i + 2]) != buf[i + 2]:
+            return False
+    return True
+
+
+def table_bytes():
+    t = bytearray(256)
+    for i in range(256):
+        c = i
+        for _ in range(8):
+            c = ((c << 1) ^ 0x31) & 0xFF if c & 0x80 else (c << 1) & 0xFF
+        t[i] = c
+    return bytes(t)
+
+
+def run_checks():
+    failures = 0
+    if bytes(sensirion_crc.TABLE) != table_bytes():
+        print("FAIL TABLE differs from the generated table")
+        failures += 1
+    for data, want in VECTORS:
+        for name, got in (("crc8", sensirion_crc.crc8(data)),
+                          ("bitwise", crc8_bitwise(data)),
+                          ("word_crc", sensirion_crc.word_crc(data[0], data[1]))):
+            if got != want:
+                print("FAIL %s(%s) = 0x%02X, want 0x%02X" % (name, data, got, want))
+                failures += 1
+    # Every 16-bit word: table and bitwise agree
+    for hi in range(256):
+        for lo in range(0, 256, 1 if hi % 17 == 0 else 51):
+            w = bytes((hi, lo))
+            if sensirion_crc.crc8(w) != crc8_bitwise(w):
+                print("FAIL word 0x%02X%02X" % (hi, lo))
+                failures += 1
+    buf = bytearray(REPLY)
+    if not (sensirion_crc.verify(buf) and check_bitwise(buf)):
+        print("FAIL reply does not verify")
+        failures += 1
+    if not sensirion_crc.verify(memoryview(buf), 6):
+        print("FAIL memoryview prefix does not verify")
+        failures += 1
+    buf[4] ^= 0x01
+    if sensirion_crc.verify(buf) or check_bitwise(buf):
+        print("FAIL corrupted reply verifies")
+        failures += 1
+    print("checks: %s" % ("OK" if not failures else "%d failed" % failures))
+    return failures
+
+
+def bench(n=2000):
+    buf = bytearray(REPLY)
+    mv = memoryview(buf)
+    verify = sensirion_crc.verify
+    t0 = ticks_us()
+    for _ in range(n):
+        check_bitwise(buf)
+    old = ticks_diff(ticks_us(), t0)
+    t0 = ticks_us()
+    for _ in range(n):
+        verify(mv, 9)
+    new = ticks_diff(ticks_us(), t0)
+    print("9-byte reply x%d: bitwise %.2f us, table %.2f us per check (%.1fx)" % (
+        n, old / n, new / n, old / new if new else 0))
+
+
+if __name__ == "__main__":
+    if "--table" in sys.argv:
+        t = table_bytes()
+        print("TABLE = (")
+        for r in range(0, 256, 16):
+            print("    b'" + "".join("\\x%02x" % v for v in t[r:r + 16]) + "'")
+        print(")")
+        sys.exit(0)
+    failed = run_checks()
+    bench()
+    sys.exit(1 if failed else 0)
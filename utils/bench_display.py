@@ -0,0 +1,391 @@
+"""
+Host-side display benchmark (CPython, no board needed)
+=======================================================
+Runs display.py against the machine stand-in in utils/hostsim, which
+decodes the ST7796S command stream into a 480x320 framebuffer and
+counts SPI bytes, address windows and CS assertions per call.
+
+Scenarios: full and incremental draw_dashboard, boot_progress,
+show_logo (raw and RLE565) and draw_text.
+
+Usage (from the repo root):
+    python utils/bench_display.py                 # timings + SPI cost table
+    python utils/bench_display.py --png out/      # also dump each frame as PNG
+    python utils/bench_display.py --compare out/  # fail if frames differ from out/*.png
+    python utils/bench_display.py --check         # rendering self-consistency checks
+
+Host timings only compare code paths against each other; the SPI
+counters are what carry over to the board.
+"""
+
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "hostsim"))
+sys.path.insert(1, os.path.dirname(HERE))
+
+import st7796  # noqa: E402
+
+st7796.install_time()
+panel = st7796.Panel()
+
+import display  # noqa: E402
+import rle565  # noqa: E402
+
+DASH = dict(co2=612, temp=72.5, hum=45.2, lux=120, pressure=1013.0,
+            sd_free="12%", status="192.168.1.105", unit_label="F",
+            time_str="3:04 PM", date_str="10-17-26", batt_pct=70)
+
+
+def _make_logo(tmpdir):
+    """Synthetic 320x320 logo: white field, colored bands, a gradient"""
+    w = h = 320
+    px = bytearray(b"\xff\xff" * w * h)
+    for y in range(80, 240):
+        for x in range(40, 280):
+            if (x // 32) % 2:
+                c = display._rgb565(x - 40, y - 80, 128)
+            else:
+                c = (display.CYAN, display.ORANGE, display.DKBLUE)[(y // 40) % 3]
+            px[(y * w + x) * 2:(y * w + x) * 2 + 2] = struct.pack(">H", c)
+    raw = os.path.join(tmpdir, "logo.bin")
+    with open(raw, "wb") as f:
+        f.write(struct.pack(">HH", w, h) + px)
+    rle = os.path.join(tmpdir, "logo.rle")
+    with open(rle, "wb") as f:
+        f.write(rle565.encode(px, w, h))
+    return raw, rle
+
+
+def scenarios(tmpdir):
+    logo_raw, logo_rle = _make_logo(tmpdir)
+
+    def sample(d):
+        # As main.py does once per reading; trends are kept in C
+        display.trend_sample(d["co2"], (d["temp"] - 32.0) * 5.0 / 9.0,
+                             d["hum"], d["lux"], d["pressure"])
+
+    def dash_full():
+        sample(DASH)
+        display.invalidate()
+        display.draw_dashboard(**DASH)
+
+    def dash_incr():
+        d = dict(DASH, co2=DASH["co2"] + 3)
+        sample(d)
+        display.draw_dashboard(**d)
+
+    def progress():
+        for pct in (5, 25, 50, 75, 100):
+            display.boot_progress(pct, "Init sensors...")
+
+    return [
+        ("draw_dashboard (full)", lambda: display.fill_screen(display.BLACK), dash_full),
+        ("draw_dashboard (incremental)", dash_full, dash_incr),
+        ("boot_progress x5", lambda: display.fill_screen(display.BLACK), progress),
+        ("show_logo (raw)", None, lambda: display.show_logo(logo_raw)),
+        ("show_logo (rle565)", None, lambda: display.show_logo(logo_rle)),
+        ("draw_text (IP, scale 1)", None,
+         lambda: display.draw_text("192.168.1.105", 136, 300, display.GREEN, display.DKBLUE, 1)),
+        ("draw_text (value, scale 2)", None,
+         lambda: display.draw_text("1013", 40, 60, display.WHITE, display.CARD_BG, 2)),
+    ]
+
+
+def _slug(name):
+    return "".join(c if c.isalnum() else "_" for c in name).strip("_").lower()
+
+
+def run_bench(repeat, png_dir=None, compare_dir=None):
+    failures = 0
+    print("%-30s %9s %9s %8s %8s %8s %6s" % (
+        "scenario", "ms/call", "bytes", "windows", "cs", "cmds", "allocs"))
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, setup, fn in scenarios(tmp):
+            total_us = 0
+            for _ in range(repeat):
+                if setup:
+                    setup()
+                panel.reset_counters()
+                display.reset_stats()
+                t0 = time.ticks_us()
+                fn()
+                total_us += time.ticks_diff(time.ticks_us(), t0)
+            c = panel.counters()
+            f = display.fill_stats()
+            # fill_rect allocations in the last run: pattern buffers + tail views
+            print("%-30s %9.2f %9d %8d %8d %8d %6d" % (
+                name, total_us / repeat / 1000.0, c["bytes"], c["windows"],
+                c["cs_toggles"], c["commands"],
+                f["pattern_allocs"] + f["tail_views"]))
+            fname = _slug(name) + ".png"
+            if png_dir:
+                os.makedirs(png_dir, exist_ok=True)
+                panel.save_png(os.path.join(png_dir, fname))
+            if compare_dir:
+                ref = os.path.join(compare_dir, fname)
+                if not os.path.exists(ref):
+                    print("  no reference", ref)
+                elif st7796.read_png(ref)[2] != bytes(panel.to_rgb()):
+                    print("  FRAME DIFFERS from", ref)
+                    failures += 1
+    return failures
+
+
+def baseline_card(x, y, w, h, label, value, unit, val_color, bg=display.CARD_BG):
+    """draw_card as it was before retained rendering and compositing"""
+    display.fill_rect(x, y, w, h, bg)
+    display.round_rect(x, y, w, h, display.CARD_BRD, 2)
+    lx = x + (w - display.text_px(label, 1)) // 2
+    display.draw_text(label, lx, y + 4, display.WHITE, bg, 1)
+    vscale = 2
+    if display.text_px(value, 2) > w - 8:
+        vscale = 1
+    vx = x + (w - display.text_px(value, vscale)) // 2
+    display.draw_text(value, vx, y + 24, val_color, bg, vscale)
+    ux = x + (w - display.text_px(unit, 1)) // 2
+    display.draw_text(unit, ux, y + 60, display.LTGRAY, bg, 1)
+
+
+def run_checks():
+    """Rendering paths that must produce identical pixels"""
+    failures = 0
+
+    def frame():
+        return bytes(panel.fb)
+
+    # Off-screen card compositing matches direct drawing
+    cards = [(10, 30, 152, 78, "CO2 1234", "Ventilate", "ppm", display.YELLOW),
+             (200, 30, 152, 78, "TEMP", "72.5", "F", display.ORANGE),
+             (10, 150, 152, 78, "SD", "100%", "used", display.GREEN)]
+    saved = display.COMPOSITE_CARDS
+    frames = []
+    for composite in (True, False):
+        display.COMPOSITE_CARDS = composite
+        display.fill_screen(display.BLACK)
+        for c in cards:
+            display.draw_card(*c)
+        frames.append(frame())
+    display.COMPOSITE_CARDS = saved
+    if frames[0] != frames[1]:
+        print("FAIL composited cards differ from draw_card")
+        failures += 1
+    # ...and the original draw_card (chrome, then three unclipped strings)
+    display.fill_screen(display.BLACK)
+    for c in cards:
+        baseline_card(*c)
+    if frames[0] != frame():
+        print("FAIL composited cards differ from the original draw_card")
+        failures += 1
+
+    # Text wider than the card is clipped the same way in the sprite
+    wide = (10, 30, 152, 78, "WIFI", "...", "connecting", display.YELLOW)
+    frames = []
+    for composite in (True, False):
+        display.COMPOSITE_CARDS = composite
+        display.fill_screen(display.BLACK)
+        display.draw_card(*wide)
+        frames.append(frame())
+    display.COMPOSITE_CARDS = saved
+    if frames[0] != frames[1]:
+        diff = sum(1 for i in range(0, len(frames[0]), 2)
+                   if frames[0][i:i + 2] != frames[1][i:i + 2])
+        print("FAIL composited overflowing card differs from draw_card: %d px" % diff)
+        failures += 1
+
+    # No heap for the sprite: cards fall back to direct drawing
+    display._sprite = None
+    display.COMPOSITE_CARDS = True
+
+    def no_heap(n):
+        # Sprite-sized requests fail; glyphs and fill patterns still fit
+        if n > 8192:
+            raise MemoryError
+        return bytearray(n)
+    display.bytearray = no_heap
+    try:
+        display.fill_screen(display.BLACK)
+        for c in cards:
+            display.draw_card(*c)
+        starved = frame()
+    finally:
+        del display.bytearray
+    display.COMPOSITE_CARDS = False
+    display.fill_screen(display.BLACK)
+    for c in cards:
+        display.draw_card(*c)
+    display.COMPOSITE_CARDS = saved
+    if starved != frame():
+        print("FAIL cards drawn without sprite heap differ from draw_card")
+        failures += 1
+
+    # Incremental dashboard updates match a full repaint
+    states = [DASH,
+              dict(DASH, co2=1612, temp=22.5, hum=5.2, lux=12000, pressure=0,
+                   sd_free="--", status="No WiFi", unit_label="C",
+                   time_str="12:44 PM", date_str="1-1-26", batt_pct=10),
+              dict(DASH, co2=99999, temp=-5.5, hum=100.0, lux=3,
+                   status="10.0.0.12", time_str="", date_str="", batt_pct=-1)]
+    display.SHOW_TRENDS = False
+    display.clear_trends()
+    for a in states:
+        for b in states:
+            display.fill_screen(display.BLACK)
+            display.draw_dashboard(**b)
+            fresh = frame()
+            display.fill_screen(display.BLACK)
+            display.draw_dashboard(**a)
+            display.draw_dashboard(**b)
+            if frame() != fresh:
+                print("FAIL incremental dashboard %r -> %r differs" % (a["co2"], b["co2"]))
+                failures += 1
+
+    # Text wider than its card (WIFI "connecting") is cut at the card
+    # edges, and the next incremental dashboard matches a full repaint
+    wx, wy, ww, wh = display.layout.DASH.rect('wifi')
+    saved = display.COMPOSITE_CARDS
+    for composite in (True, False):
+        display.COMPOSITE_CARDS = composite
+        display.fill_screen(display.BLACK)
+        display.draw_dashboard(**DASH)
+        fresh = frame()
+        display.draw_card(wx, wy, ww, wh, "WIFI", "...", "connecting", display.YELLOW)
+        fb = panel.fb
+        outside = 0
+        for yy in range(wy, wy + wh):
+            for xx in (wx - 4, wx - 1, wx + ww, wx + ww + 3):
+                o = (yy * panel.width + xx) * 2
+                if fb[o:o + 2] != fresh[o:o + 2]:
+                    outside += 1
+        if outside:
+            print("FAIL overflowing card text drawn outside the card (%s): %d px" % (
+                "sprite" if composite else "direct", outside))
+            failures += 1
+        display.draw_dashboard(**DASH)
+        if frame() != fresh:
+            print("FAIL dashboard after overflowing card differs from full repaint (%s)" % (
+                "sprite" if composite else "direct"))
+            failures += 1
+    display.COMPOSITE_CARDS = saved
+
+    display.SHOW_TRENDS = True
+
+    # Sparklines get one point per reading: extra repaints between
+    # readings (page switches, overlays) add none
+    readings = [dict(DASH, co2=500 + 150 * i, hum=30.0 + 3 * i, lux=100 * i)
+                for i in range(6)]
+    frames = []
+    for extra in (False, True):
+        display.clear_trends()
+        display.invalidate()
+        display.fill_screen(display.BLACK)
+        for d in readings:
+            display.trend_sample(d["co2"], 22.0, d["hum"], d["lux"], d["pressure"])
+            display.draw_dashboard(**d)
+            if extra:
+                display.invalidate()
+                display.draw_dashboard(**d)
+                display.draw_dashboard(**d)
+        frames.append(frame())
+    if frames[0] != frames[1]:
+        print("FAIL repaints between readings changed the sparklines")
+        failures += 1
+    if display._sparks[display.layout.DASH.rect('co2')[:2]].count != len(readings):
+        print("FAIL sparkline holds more points than readings")
+        failures += 1
+    display.clear_trends()
+    display.invalidate()
+
+    # A sparkline fed sample by sample matches a full redraw of it
+    display.fill_screen(display.CARD_BG)
+    spark = display.Sparkline(100, 100, 44, 16, 400, 2000)
+    for i in range(70):
+        spark.push(400 + (i * 37) % 1700)
+    pushed = frame()
+    display.fill_screen(display.CARD_BG)
+    spark.redraw()
+    if frame() != pushed:
+        print("FAIL sparkline pushes differ from redraw")
+        failures += 1
+    # ...and so does one fed in batches (several add()s per flush())
+    display.fill_screen(display.CARD_BG)
+    spark = display.Sparkline(100, 100, 44, 16, 400, 2000)
+    for i in range(70):
+        spark.add(400 + (i * 37) % 1700)
+        if i % 3 == 2:
+            spark.flush()
+    spark.flush()
+    if frame() != pushed:
+        print("FAIL batched sparkline flushes differ from pushes")
+        failures += 1
+
+    # Fills in cached colors allocate nothing unless they need a tail view
+    display.fill_rect(0, 0, 40, 16, display.RED)
+    display.fill_rect(0, 0, 40, 16, display.GREEN)
+    display.reset_stats()
+    for _ in range(10):
+        display.fill_rect(0, 0, 40, 16, display.RED)     # 640 px, no tail
+        display.fill_rect(0, 0, 41, 16, display.GREEN)   # 656 px, one tail
+    f = display.fill_stats()
+    if f["pattern_allocs"] or f["pattern_refills"] or f["tail_views"] != 10:
+        print("FAIL cached fills allocated: %r" % f)
+        failures += 1
+
+    # blit_file: streamed and revealed blits match the source pixels;
+    # windows that would leave the panel are refused before any SPI
+    with tempfile.TemporaryDirectory() as tmp:
+        w, h = 50, 37     # 3700 bytes: a full chunk plus a short one
+        px = bytes((i * 7) & 0xFF for i in range(w * h * 2))
+        path = os.path.join(tmp, "img.bin")
+        with open(path, "wb") as f:
+            f.write(b"HDR!" + px)
+        for reveal in (False, True):
+            display.fill_screen(display.BLACK)
+            ok = display.blit_file(path, 100, 50, w, h, 4, reveal)
+            got = b"".join(bytes(panel.fb[((50 + r) * display.W + 100) * 2:
+                                          ((50 + r) * display.W + 100 + w) * 2])
+                           for r in range(h))
+            if not ok or got != px:
+                print("FAIL blit_file (reveal=%s) differs from the file" % reveal)
+                failures += 1
+        for x, y in ((-1, 0), (0, -1), (display.W - w + 1, 0), (0, display.H - h + 1)):
+            panel.reset_counters()
+            if display.blit_file(path, x, y, w, h, 4) or panel.bytes:
+                print("FAIL blit_file at %d,%d was not refused" % (x, y))
+                failures += 1
+
+    # Trimmed (painted) text matches full-cell text on a painted background
+    display.fill_screen(display.CARD_BG)
+    display.draw_text("Ag 12.5%", 20, 20, display.WHITE, display.CARD_BG, 2)
+    full = frame()
+    display.fill_screen(display.CARD_BG)
+    display.draw_text("Ag 12.5%", 20, 20, display.WHITE, display.CARD_BG, 2, True)
+    if frame() != full:
+        print("FAIL painted draw_text differs")
+        failures += 1
+
+    print("checks: %s" % ("OK" if not failures else "%d failed" % failures))
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--png", metavar="DIR", help="dump each scenario's frame as PNG")
+    ap.add_argument("--compare", metavar="DIR", help="compare frames with PNGs in DIR")
+    ap.add_argument("--check", action="store_true", help="run rendering consistency checks")
+    args = ap.parse_args()
+    display.init()
+    failures = run_bench(args.repeat, args.png, args.compare)
+    if args.check:
+        failures += run_checks()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+"""
+SCD4x mode-switch and read timing check
+=======================================
+Runs scd4x.py on the host against a simulated sensor and checks the
+measurement modes main.py's power profiles use:
+
+  - SCD41: set_mode(SINGLE_SHOT) reads the variant and takes single shots
+  - SCD40: set_mode(SINGLE_SHOT) reads the variant and measures in
+    low-power periodic mode instead
+  - SCD40 with firmware that has no get_sensor_variant: the first single
+    shot is NACKed, the driver falls back to low-power periodic mode and
+    readings continue
+
+each through read_measurement() and read_measurement_async(). It also
+checks that a corrupted reply gets the same retries on both paths, that a dead bus
+raises OSError after bounded, spaced-out attempts, and that in periodic mode a new measurement is returned within
+recheck_ms (or one call) of landing, whatever the caller's read
+interval. Time is simulated, so the 5 s and 30 s measurement intervals
+run instantly.
+
+    python utils/check_scd4x.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "hostsim"))
+sys.path.insert(1, os.path.dirname(HERE))
+
+# Simulated clock: sleeps advance it instead of waiting
+_now = [0]
+
+
+def _advance(ms):
+    _now[0] += int(ms)
+
+
+time.ticks_ms = lambda: _now[0]
+time.ticks_diff = lambda a, b: a - b
+time.ticks_add = lambda a, b: a + b
+time.sleep_ms = _advance
+time.sleep = lambda s: _advance(s * 1000)
+
+
+async def _sleep_ms(ms):
+    _advance(ms)
+    await asyncio.sleep(0)
+
+uasyncio = types.ModuleType("uasyncio")
+uasyncio.sleep_ms = _sleep_ms
+uasyncio.run = asyncio.run
+sys.modules["uasyncio"] = uasyncio
+
+# Driver settings normally in config.py (not in the repo)
+config = types.ModuleType("config")
+config.SCD4X_I2C_ADDR = 0x62
+config.SENSOR_ALTITUDE = 0
+config.SENSOR_PRESSURE = 1013
+config.TEMP_OFFSET = 0.0
+config.SENSOR_INIT_DELAY = 5
+config.SENSOR_RETRY_DELAY = 0.1
+config.MAX_CONSECUTIVE_ERRORS = 3
+config.VALID_CO2_RANGE = (400, 5000)
+config.VALID_TEMP_RANGE = (-10, 60)
+config.VALID_HUMIDITY_RANGE = (0, 100)
+config.VALID_PRESSURE_RANGE = (700, 1200)
+sys.modules.setdefault("config", config)
+
+import sensirion_crc  # noqa: E402
+import scd4x  # noqa: E402
+from scd4x import PERIODIC, LOW_POWER, SINGLE_SHOT  # noqa: E402
+
+STOP = 0x3F86
+START = 0x21B1
+START_LOW_POWER = 0x21AC
+SINGLE = 0x219D
+DATA_READY = 0xE4B8
+READ = 0xEC05
+VARIANT = 0x202F
+ENODEV = 19         # what MicroPython raises when the sensor NACKs
+
+
+def words(*values):
+    out = bytearray()
+    for v in values:
+        w = bytes(((v >> 8) & 0xFF, v & 0xFF))
+        out += w
+        out.append(sensirion_crc.crc8(w))
+    return bytes(out)
+
+
+class FakeSCD4x:
+    """I2C stand-in for one SCD4x. variant 0 is an SCD40, which NACKs
+    measure_single_shot; variant_cmd=False models firmware that NACKs
+    get_sensor_variant as well."""
+
+    def __init__(self, variant, variant_cmd=True):
+        self.variant = variant
+        self.variant_cmd = variant_cmd
+        self.period = 0         # ms between readings, 0 = idle
+        self.next_at = None     # when the next measurement lands
+        self.fresh = False      # data-ready bit
+        self.landed = None      # when the measurement in the buffer landed
+        self.reply = b""
+        self.co2 = 600
+        self.shots = 0
+        self.nacks = 0
+        self.checks = 0         # data-ready commands
+        self.corrupt = 0        # next n measurement replies get a bad CRC
+        self.dead = False       # NACK everything
+        self.writes = 0
+        self.reads = 0          # read_measurement commands
+
+    def _tick(self, now):
+        while self.next_at is not None and now >= self.next_at:
+            self.fresh = True
+            self.landed = self.next_at
+            self.co2 += 1
+            self.next_at = self.next_at + self.period if self.period else None
+
+    def writeto(self, addr, buf):
+        cmd = (buf[0] << 8) | buf[1]
+        now = time.ticks_ms()
+        self._tick(now)
+        self.reply = b""
+        self.writes += 1
+        if self.dead:
+            raise OSError(ENODEV)
+        if (cmd == SINGLE and self.variant == 0) or (cmd == VARIANT and not self.variant_cmd):
+            self.nacks += 1
+            raise OSError(ENODEV)
+        if self.period and cmd not in (STOP, DATA_READY, READ):
+            raise OSError(ENODEV)   # only these are accepted while measuring
+        if cmd == STOP:
+            self.period = 0
+            self.next_at = None
+        elif cmd in (START, START_LOW_POWER):
+            self.period = 5000 if cmd == START else 30000
+            self.next_at = now + self.period
+        elif cmd == SINGLE:
+            self.shots += 1
+            self.next_at = now + 5000
+        elif cmd == VARIANT:
+            self.reply = words(self.variant << 12)
+        elif cmd == DATA_READY:
+            self.checks += 1
+            self.reply = words(0x8006 if self.fresh else 0x8000)
+        elif cmd == READ:
+            self.reads += 1
+        if cmd == READ and self.fresh:
+            # read-out empties the buffer: a re-read is NACKed
+            self.fresh = False
+            self.reply = words(self.co2, 0x6667, 0x5EB9)
+
+    def readfrom_into(self, addr, buf):
+        if len(self.reply) < len(buf):
+            raise OSError(ENODEV)
+        buf[:] = self.reply[:len(buf)]
+        if self.corrupt and len(buf) == 9:
+            self.corrupt -= 1
+            buf[2] ^= 0xFF
+
+
+def run(name, variant, variant_cmd, use_async):
+    """Start in periodic mode, switch to single-shot as the 'low' power
+    profile does, then read every 2 minutes like main.py. Returns the
+    driver, the fake and the CO2 values read."""
+    bus = FakeSCD4x(variant, variant_cmd)
+    sensor = scd4x.SCD4X(bus, blocking=False)
+
+    def read():
+        if use_async:
+            return asyncio.run(sensor.read_measurement_async())
+        return sensor.read_measurement()
+
+    _advance(6000)
+    read()
+    sensor.set_mode(SINGLE_SHOT)
+    seen = []
+    for _ in range(6):
+        _advance(120000)
+        snap = read()
+        if snap and snap[0] not in seen:
+            seen.append(snap[0])
+    print(f"{name:34} {'async' if use_async else 'sync ':5}  "
+          f"mode {scd4x.MODE_NAMES[sensor.mode]:11} shots {bus.shots}  "
+          f"nacks {bus.nacks}  readings {len(seen)}")
+    return sensor, bus, seen
+
+
+def run_lag(use_async, step_ms):
+    """Periodic mode, read every step_ms like a busy caller. Returns the
+    worst delay from a measurement landing to read_measurement()
+    returning it, and data-ready checks per new reading."""
+    bus = FakeSCD4x(1)
+    sensor = scd4x.SCD4X(bus, blocking=False)
+    last = None
+    worst = 0
+    readings = 0
+    checks = 0
+    for _ in range(60000 // step_ms):
+        _advance(step_ms)
+        if use_async:
+            snap = asyncio.run(sensor.read_measurement_async())
+        else:
+            snap = sensor.read_measurement()
+        if snap and snap[0] != last:
+            last = snap[0]
+            readings += 1
+            worst = max(worst, time.ticks_ms() - bus.landed)
+            if readings == 2:
+                checks = bus.checks     # from here on the timing is known
+    per = (bus.checks - checks) / max(1, readings - 2)
+    print("periodic, read every %4d ms   %5s  worst lag %4d ms  checks/reading %.1f" % (
+        step_ms, "async" if use_async else "sync", worst, per))
+    return worst, per
+
+
+def read_with(sensor, use_async):
+    if use_async:
+        return asyncio.run(sensor.read_measurement_async())
+    return sensor.read_measurement()
+
+
+def run_errors(use_async):
+    """A corrupted reply is retried like any read error: the sensor has
+    already emptied its buffer, so the retries are NACKed and the read
+    raises after MAX_CONSECUTIVE_ERRORS attempts, SENSOR_RETRY_DELAY
+    apart; the next measurement reads normally. A dead bus raises
+    OSError after a bounded number of spaced-out attempts."""
+    bus = FakeSCD4x(1)
+    sensor = scd4x.SCD4X(bus, blocking=False)
+    while read_with(sensor, use_async) is None:
+        _advance(1000)
+    bus.corrupt = 1
+    _advance(5000)
+    reads = bus.reads
+    t0 = time.ticks_ms()
+    bad = None
+    try:
+        read_with(sensor, use_async)
+    except (OSError, RuntimeError) as e:
+        bad = e
+    attempts = bus.reads - reads
+    spaced = time.ticks_ms() - t0
+    _advance(5000)
+    recovered = read_with(sensor, use_async)[0] == bus.co2
+
+    dead = FakeSCD4x(1)
+    dead.dead = True
+    t0 = time.ticks_ms()
+    sensor = scd4x.SCD4X(dead, blocking=False)
+    err = None
+    try:
+        read_with(sensor, use_async)
+    except OSError as e:
+        err = e
+    spent = time.ticks_ms() - t0
+    print("bad CRC: %d attempts in %d ms, %s   dead bus: %r after %d writes, %d ms   %s" % (
+        attempts, spaced, "recovered" if recovered else "stuck", err,
+        dead.writes, spent, "async" if use_async else "sync"))
+    return bad, attempts, spaced, recovered, err, dead.writes, spent
+
+
+def main():
+    failures = []
+
+    def check(ok, what):
+        if not ok:
+            failures.append(what)
+            print("  FAIL:", what)
+
+    for use_async in (False, True):
+        s, bus, seen = run("SCD41", 1, True, use_async)
+        check(s.mode == SINGLE_SHOT and s.single_shot, "SCD41 stays in single-shot")
+        check(bus.shots >= 5 and bus.period == 0, "SCD41 takes single shots while idle")
+        check(len(seen) >= 5, "SCD41 readings continue")
+
+        s, bus, seen = run("SCD40", 0, True, use_async)
+        check(s.mode == LOW_POWER and s.single_shot is False, "SCD40 falls back to low-power")
+        check(bus.nacks == 0 and bus.period == 30000, "SCD40 never sent a single shot")
+        check(len(seen) >= 5, "SCD40 readings continue")
+
+        s, bus, seen = run("SCD40, no get_sensor_variant", 0, False, use_async)
+        check(s.mode == LOW_POWER and s.single_shot is False,
+              "failed single shot falls back to low-power")
+        check(bus.period == 30000, "sensor measuring in low-power mode")
+        check(len(seen) >= 4, "readings continue after the fallback")
+        nacks = bus.nacks
+        s.set_mode(SINGLE_SHOT)
+        check(s.mode == LOW_POWER and s._steps is None and bus.nacks == nacks,
+              "set_mode(SINGLE_SHOT) stays low-power once unsupported")
+        s.set_mode(PERIODIC)
+        check(s.mode == PERIODIC, "other modes still switch")
+
+    for use_async in (False, True):
+        bad, attempts, spaced, recovered, err, writes, spent = run_errors(use_async)
+        retries = config.MAX_CONSECUTIVE_ERRORS
+        check(bad is not None and attempts == retries,
+              "corrupted reply: %d read attempts, not %d" % (attempts, retries))
+        check(spaced >= (retries - 1) * config.SENSOR_RETRY_DELAY * 1000,
+              "corrupted reply retried without SENSOR_RETRY_DELAY")
+        check(recovered, "next measurement read after a corrupted reply")
+        check(isinstance(err, OSError), "dead sensor raises OSError")
+        check(writes <= 3 * 3, "dead sensor: %d I2C writes" % writes)
+        check(spent >= 20, "dead sensor retried without sleeping")
+
+    # New measurements are picked up within recheck_ms (or one call, if
+    # calls are further apart), while a fast caller still skips most checks
+    for use_async in (False, True):
+        for step in (100, 700, 4900):
+            worst, per = run_lag(use_async, step)
+            check(worst <= max(250, step) + 50,
+                  "measurement returned %d ms after it landed" % worst)
+            if step == 100:
+                check(per <= 4, "%.1f data-ready checks per reading" % per)
+
+    print("checks:", "FAILED" if failures else "OK")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+# 16x16 bitmap font source - each char is 16 rows of 16-bit values
+# Edit here, then run utils/gen_font16.py to regenerate the packed font16.py
+FONT16 = {
+    ' ': [0]*16,
+    '0': [
+        0x0000,0x0FF0,0x1C38,0x381C,0x300C,0x300C,0x300C,0x300C,
+        0x300C,0x300C,0x381C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,
+    ],
+    '1': [
+        0x0000,0x0300,0x0700,0x0F00,0x0300,0x0300,0x0300,0x0300,
+        0x0300,0x0300,0x0300,0x0300,0x0FF0,0x0000,0x0000,0x0000,
+    ],
+    '2': [
+        0x0000,0x0FF0,0x1C38,0x300C,0x000C,0x0018,0x0070,0x01C0,
+        0x0700,0x0C00,0x1800,0x3000,0x3FFC,0x0000,0x0000,0x0000,
+    ],
+    '3': [
+        0x0000,0x0FF0,0x1C38,0x000C,0x000C,0x0038,0x03F0,0x0038,
+        0x000C,0x000C,0x000C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,
+    ],
+    '4': [
+        0x0000,0x0070,0x00F0,0x01B0,0x0330,0x0630,0x0C30,0x1830,
+        0x3FFC,0x0030,0x0030,0x0030,0x0030,0x0000,0x0000,0x0000,
+    ],
+    '5': [
+        0x0000,0x3FFC,0x3000,0x3000,0x3000,0x3FF0,0x0038,0x000C,
+        0x000C,0x000C,0x000C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,
+    ],
+    '6': [
+        0x0000,0x03F0,0x0E00,0x1C00,0x3000,0x3FF0,0x3C38,0x300C,
+        0x300C,0x300C,0x3C38,0x1FF0,0x0FE0,0x0000,0x0000,0x0000,
+    ],
+    '7': [
+        0x0000,0x3FFC,0x000C,0x0018,0x0030,0x0060,0x00C0,0x0180,
+        0x0180,0x0300,0x0300,0x0300,0x0300,0x0000,0x0000,0x0000,
+    ],
+    '8': [
+        0x0000,0x0FF0,0x1C38,0x300C,0x300C,0x1C38,0x0FF0,0x1C38,
+        0x300C,0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,
+    ],
+    '9': [
+        0x0000,0x0FF0,0x1C38,0x300C,0x300C,0x300C,0x1C3C,0x0FFC,
+        0x0018,0x0030,0x0060,0x01C0,0x0F00,0x0000,0x0000,0x0000,
+    ],
+    '.': [
+        0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,
+        0x0000,0x0000,0x0380,0x0380,0x0380,0x0000,0x0000,0x0000,
+    ],
+    ':': [
+        0x0000,0x0000,0x0000,0x0380,0x0380,0x0380,0x0000,0x0000,
+        0x0000,0x0380,0x0380,0x0380,0x0000,0x0000,0x0000,0x0000,
+    ],
+    '%': [
+        0x0000,0x3804,0x3808,0x3810,0x0020,0x0040,0x0080,0x0100,
+        0x0200,0x0400,0x0800,0x101C,0x201C,0x0000,0x0000,0x0000,
+    ],
+    'A': [
+        0x0000,0x03C0,0x07E0,0x0E70,0x1C38,0x381C,0x300C,0x300C,
+        0x3FFC,0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,
+    ],
+    'B': [
+        0x0000,0x3FF0,0x3018,0x300C,0x300C,0x3018,0x3FF0,0x3018,
+        0x300C,0x300C,0x3018,0x3FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'C': [
+        0x0000,0x0FF0,0x1C38,0x3000,0x3000,0x3000,0x3000,0x3000,
+        0x3000,0x3000,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'D': [
+        0x0000,0x3FE0,0x3070,0x3038,0x300C,0x300C,0x300C,0x300C,
+        0x300C,0x3038,0x3070,0x3FE0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'E': [
+        0x0000,0x3FFC,0x3000,0x3000,0x3000,0x3FF0,0x3FF0,0x3000,
+        0x3000,0x3000,0x3000,0x3FFC,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'F': [
+        0x0000,0x3FFC,0x3000,0x3000,0x3000,0x3FF0,0x3FF0,0x3000,
+        0x3000,0x3000,0x3000,0x3000,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'H': [
+        0x0000,0x300C,0x300C,0x300C,0x300C,0x3FFC,0x3FFC,0x300C,
+        0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'I': [
+        0x0000,0x0FF0,0x0180,0x0180,0x0180,0x0180,0x0180,0x0180,
+        0x0180,0x0180,0x0180,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'M': [
+        0x0000,0x300C,0x381C,0x3C3C,0x3E7C,0x36DC,0x338C,0x300C,
+        0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'N': [
+        0x0000,0x300C,0x380C,0x3C0C,0x3E0C,0x370C,0x338C,0x31CC,
+        0x30EC,0x307C,0x303C,0x301C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'O': [
+        0x0000,0x0FF0,0x1C38,0x300C,0x300C,0x300C,0x300C,0x300C,
+        0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'P': [
+        0x0000,0x3FF0,0x3018,0x300C,0x300C,0x3018,0x3FF0,0x3000,
+        0x3000,0x3000,0x3000,0x3000,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'R': [
+        0x0000,0x3FF0,0x3018,0x300C,0x300C,0x3018,0x3FF0,0x3070,
+        0x3038,0x301C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'S': [
+        0x0000,0x0FF0,0x1C38,0x3000,0x3000,0x1C00,0x0FF0,0x0038,
+        0x000C,0x000C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'T': [
+        0x0000,0x3FFC,0x0180,0x0180,0x0180,0x0180,0x0180,0x0180,
+        0x0180,0x0180,0x0180,0x0180,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'V': [
+        0x0000,0x300C,0x300C,0x300C,0x1818,0x1818,0x0C30,0x0C30,
+        0x0660,0x0660,0x03C0,0x0180,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'W': [
+        0x0000,0x300C,0x300C,0x300C,0x300C,0x338C,0x36DC,0x3E7C,
+        0x3C3C,0x381C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'a': [
+        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x001C,0x000C,0x0FFC,
+        0x1C0C,0x300C,0x300C,0x1FFC,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'd': [
+        0x0000,0x000C,0x000C,0x000C,0x0FEC,0x1C3C,0x381C,0x300C,
+        0x300C,0x381C,0x1C3C,0x0FEC,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'e': [
+        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x1C38,0x300C,0x3FFC,
+        0x3000,0x3000,0x1C00,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'i': [
+        0x0000,0x0180,0x0180,0x0000,0x0780,0x0180,0x0180,0x0180,
+        0x0180,0x0180,0x0180,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'l': [
+        0x0000,0x0700,0x0300,0x0300,0x0300,0x0300,0x0300,0x0300,
+        0x0300,0x0300,0x0300,0x0FC0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'm': [
+        0x0000,0x0000,0x0000,0x0000,0x7EF8,0x3318,0x330C,0x330C,
+        0x330C,0x330C,0x330C,0x330C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'n': [
+        0x0000,0x0000,0x0000,0x0000,0x3BF0,0x3E18,0x3C0C,0x300C,
+        0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'o': [
+        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x1C38,0x300C,0x300C,
+        0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'p': [
+        0x0000,0x0000,0x0000,0x0000,0x3FF0,0x3018,0x300C,0x300C,
+        0x3018,0x3FF0,0x3000,0x3000,0x3000,0x0000,0x0000,0x0000,
+    ],
+    'q': [
+        0x0000,0x0000,0x0000,0x0000,0x0FFC,0x180C,0x300C,0x300C,
+        0x180C,0x0FFC,0x000C,0x000C,0x000C,0x0000,0x0000,0x0000,
+    ],
+    'r': [
+        0x0000,0x0000,0x0000,0x0000,0x0DF0,0x0F38,0x0E00,0x0E00,
+        0x0E00,0x0E00,0x0E00,0x0E00,0x0000,0x0000,0x0000,0x0000,
+    ],
+    't': [
+        0x0000,0x0600,0x0600,0x0600,0x1FE0,0x0600,0x0600,0x0600,
+        0x0600,0x0600,0x0700,0x03E0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'u': [
+        0x0000,0x0000,0x0000,0x0000,0x300C,0x300C,0x300C,0x300C,
+        0x300C,0x300C,0x1C3C,0x0FEC,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'y': [
+        0x0000,0x0000,0x0000,0x0000,0x300C,0x1818,0x0C30,0x0660,
+        0x03C0,0x0180,0x0300,0x0600,0x0C00,0x0000,0x0000,0x0000,
+    ],
+    '-': [
+        0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x1FF8,0x1FF8,
+        0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,
+    ],
+    '/': [
+        0x0000,0x0008,0x0010,0x0020,0x0040,0x0080,0x0100,0x0200,
+        0x0400,0x0800,0x1000,0x2000,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'c': [
+        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x1C38,0x3000,0x3000,
+        0x3000,0x3000,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'h': [
+        0x0000,0x3000,0x3000,0x3000,0x3FF0,0x3818,0x300C,0x300C,
+        0x300C,0x300C,0x300C,0x300C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'g': [
+        0x0000,0x0000,0x0000,0x0000,0x0FEC,0x1C3C,0x300C,0x300C,
+        0x1C3C,0x0FEC,0x000C,0x001C,0x0FF0,0x0000,0x0000,0x0000,
+    ],
+    'x': [
+        0x0000,0x0000,0x0000,0x0000,0x300C,0x1818,0x0C30,0x0660,
+        0x0660,0x0C30,0x1818,0x300C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'L': [
+        0x0000,0x3000,0x3000,0x3000,0x3000,0x3000,0x3000,0x3000,
+        0x3000,0x3000,0x3000,0x3FFC,0x0000,0x0000,0x0000,0x0000,
+    ],
+    's': [
+        0x0000,0x0000,0x0000,0x0000,0x0FF0,0x1C00,0x1C00,0x0FF0,
+        0x003C,0x003C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'f': [
+        0x0000,0x03E0,0x0600,0x0600,0x1FC0,0x0600,0x0600,0x0600,
+        0x0600,0x0600,0x0600,0x0600,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'G': [
+        0x0000,0x0FF0,0x1C38,0x3000,0x3000,0x3000,0x33FC,0x300C,
+        0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'U': [
+        0x0000,0x300C,0x300C,0x300C,0x300C,0x300C,0x300C,0x300C,
+        0x300C,0x300C,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'Q': [
+        0x0000,0x0FF0,0x1C38,0x300C,0x300C,0x300C,0x300C,0x300C,
+        0x336C,0x1C38,0x0FF8,0x000C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'J': [
+        0x0000,0x01FC,0x0018,0x0018,0x0018,0x0018,0x0018,0x0018,
+        0x0018,0x3018,0x1C38,0x0FF0,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'K': [
+        0x0000,0x300C,0x3018,0x3030,0x3060,0x30C0,0x3F80,0x30C0,
+        0x3060,0x3030,0x3018,0x300C,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'b': [
+        0x0000,0x3000,0x3000,0x3000,0x3FF0,0x3818,0x300C,0x300C,
+        0x300C,0x3818,0x3FF0,0x0000,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'v': [
+        0x0000,0x0000,0x0000,0x0000,0x300C,0x1818,0x1818,0x0C30,
+        0x0C30,0x0660,0x03C0,0x0180,0x0000,0x0000,0x0000,0x0000,
+    ],
+    'w': [
+        0x0000,0x0000,0x0000,0x0000,0x300C,0x300C,0x338C,0x338C,
+        0x36DC,0x3C3C,0x1818,0x1818,0x0000,0x0000,0x0000,0x0000,
+    ],
+    ',': [
+        0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,0x0000,
+        0x0000,0x0380,0x0380,0x0300,0x0600,0x0000,0x0000,0x0000,
+    ],
+}
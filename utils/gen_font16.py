@@ -0,0 +1,239 @@
+"""
+Pack the 16x16 bitmap font into font16.py (host-side, CPython)
+===============================================================
+Reads the editable FONT16 dict from utils/font16_src.py and writes
+font16.py with every glyph in one bytes blob plus a character index,
+so the font can be frozen into flash and read through a memoryview.
+
+After writing, the generated module is imported back and every glyph
+is compared bit-for-bit with the source, and its ink bounding boxes
+are checked.
+
+Usage (from the repo root):
+    python utils/gen_font16.py            # write font16.py (same as --write)
+    python utils/gen_font16.py --check    # compare with font16.py, write nothing
+"""
+
+import argparse
+import difflib
+import importlib.util
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SRC = os.path.join(HERE, "font16_src.py")
+OUT = os.path.join(ROOT, "font16.py")
+
+GLYPH_BYTES = 32
+
+HEADER = '''"""
+16x16 bitmap font, packed for flash
+Generated by utils/gen_font16.py from utils/font16_src.py - do not edit.
+
+Glyph i (the i-th character of CHARS) is DATA[32*i:32*i+32]: 16 rows of
+big-endian 16-bit values, MSB = leftmost pixel. BOXES holds each
+glyph's ink bounding box, computed at import.
+"""
+'''
+
+ACCESSORS = '''
+_DATA = memoryview(DATA)
+
+
+def glyph(ch):
+    """Return the 32-byte row data for ch as a memoryview, or None"""
+    i = CHARS.find(ch) if len(ch) == 1 else -1
+    if i < 0:
+        return None
+    return _DATA[i * 32:i * 32 + 32]
+
+
+def _ink_boxes():
+    """Per-glyph ink bounding box: top, bottom, left, right (inclusive).
+    Blank glyphs get top=16 so they can be skipped entirely."""
+    boxes = bytearray(len(CHARS) * 4)
+    for i in range(len(CHARS)):
+        top = 16; bottom = 0; left = 16; right = 0
+        for row in range(16):
+            bits = (DATA[i * 32 + row * 2] << 8) | DATA[i * 32 + row * 2 + 1]
+            if not bits:
+                continue
+            if row < top:
+                top = row
+            bottom = row
+            col = 0
+            while not bits & (0x8000 >> col):
+                col += 1
+            if col < left:
+                left = col
+            col = 15
+            while not bits & (0x8000 >> col):
+                col -= 1
+            if col > right:
+                right = col
+        boxes[i * 4:i * 4 + 4] = bytes((top, bottom, left, right))
+    return boxes
+
+
+# Computed once at import
+BOXES = _ink_boxes()
+
+
+def bbox(ch):
+    """Return (top, bottom, left, right) of ch's ink, or None if blank/unknown"""
+    i = CHARS.find(ch) if len(ch) == 1 else -1
+    if i < 0 or BOXES[i * 4] > 15:
+        return None
+    return (BOXES[i * 4], BOXES[i * 4 + 1], BOXES[i * 4 + 2], BOXES[i * 4 + 3])
+
+
+class _Glyph:
+    """Read-only 16-row view of a glyph; glyph[row] -> 16-bit int"""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __getitem__(self, row):
+        return (self._rows[row * 2] << 8) | self._rows[row * 2 + 1]
+
+    def __len__(self):
+        return 16
+
+
+class _Font16:
+    """dict-like accessor compatible with the old FONT16 dict"""
+
+    def get(self, ch, default=None):
+        rows = glyph(ch)
+        return default if rows is None else _Glyph(rows)
+
+    def __getitem__(self, ch):
+        rows = glyph(ch)
+        if rows is None:
+            raise KeyError(ch)
+        return _Glyph(rows)
+
+    def __contains__(self, ch):
+        return glyph(ch) is not None
+
+    def __len__(self):
+        return len(CHARS)
+
+    def keys(self):
+        return iter(CHARS)
+
+
+FONT16 = _Font16()
+'''
+
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def pack(font):
+    chars = "".join(font)
+    blob = bytearray()
+    for ch in chars:
+        rows = font[ch]
+        if len(rows) != 16:
+            raise ValueError("glyph %r has %d rows" % (ch, len(rows)))
+        for bits in rows:
+            blob.append((bits >> 8) & 0xFF)
+            blob.append(bits & 0xFF)
+    return chars, bytes(blob)
+
+
+def render_module(chars, blob):
+    """Source text of the generated font16.py"""
+    out = [HEADER, "\nCHARS = %r\n\n" % chars, "DATA = (\n"]
+    for i in range(0, len(blob), GLYPH_BYTES):
+        out.append("    b'%s'  # %r\n" % (
+            "".join("\\x%02x" % b for b in blob[i:i + GLYPH_BYTES]),
+            chars[i // GLYPH_BYTES]))
+    out.append(")\n")
+    out.append(ACCESSORS)
+    return "".join(out)
+
+
+def write_module(path, chars, blob):
+    with open(path, "w") as f:
+        f.write(render_module(chars, blob))
+
+
+def verify(font, path):
+    """Import the generated module and compare every glyph with the source"""
+    packed = load_module("font16_packed", path)
+    if len(packed.FONT16) != len(font):
+        raise AssertionError("glyph count %d != %d" % (len(packed.FONT16), len(font)))
+    for ch, rows in font.items():
+        g = packed.FONT16.get(ch)
+        if g is None:
+            raise AssertionError("missing glyph %r" % ch)
+        got = [g[r] for r in range(16)]
+        if got != list(rows):
+            raise AssertionError("glyph %r differs: %r != %r" % (ch, got, rows))
+    for ch, rows in font.items():
+        inked = [r for r in range(16) if rows[r]]
+        box = packed.bbox(ch)
+        if not inked:
+            if box is not None:
+                raise AssertionError("blank glyph %r has a bbox" % ch)
+            continue
+        cols = [c for c in range(16) if any(rows[r] & (0x8000 >> c) for r in inked)]
+        if box != (inked[0], inked[-1], cols[0], cols[-1]):
+            raise AssertionError("glyph %r bbox %r is wrong" % (ch, box))
+    if packed.FONT16.get("\x01") is not None or packed.FONT16.get("ab") is not None:
+        raise AssertionError("lookup of unknown characters must miss")
+
+
+def check(font, chars, blob):
+    """Compare the checked-in font16.py with what would be generated"""
+    want = render_module(chars, blob)
+    try:
+        with open(OUT) as f:
+            have = f.read()
+    except OSError as e:
+        print("%s: %s" % (OUT, e))
+        return 1
+    if have != want:
+        diff = difflib.unified_diff(have.splitlines(), want.splitlines(),
+                                    "font16.py", "generated", lineterm="", n=0)
+        for i, line in enumerate(diff):
+            if i == 12:
+                print("...")
+                break
+            print(line)
+        print("%s is out of date; run python utils/gen_font16.py" % OUT)
+        return 1
+    verify(font, OUT)
+    print("%s: %d glyphs, %d bytes; matches %s, round-trip OK" % (
+        OUT, len(chars), len(blob), SRC))
+    return 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true",
+                      help="compare font16.py with the generated module, write nothing")
+    mode.add_argument("--write", action="store_true",
+                      help="write font16.py (the default)")
+    args = ap.parse_args()
+
+    font = load_module("font16_src", SRC).FONT16
+    chars, blob = pack(font)
+    if args.check:
+        return check(font, chars, blob)
+    write_module(OUT, chars, blob)
+    verify(font, OUT)
+    print("Wrote %s: %d glyphs, %d bytes; round-trip OK" % (OUT, len(chars), len(blob)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+CPython stand-in for the parts of MicroPython's machine module used by
+display.py and touch.py. Pin changes and SPI traffic are forwarded to
+whatever listeners are registered (see st7796.Panel), so drawing code
+runs unmodified on the host.
+"""
+
+_pins = {}
+# Called as listener(pin, value) on every Pin level change
+pin_listeners = []
+# Called as listener(spi, data) on every SPI write
+spi_listeners = []
+
+
+def pin(pin_id):
+    """Return the Pin created for pin_id, or None"""
+    return _pins.get(pin_id)
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 2
+    PULL_DOWN = 3
+    IRQ_FALLING = 2
+    IRQ_RISING = 1
+
+    def __init__(self, pin_id, mode=None, pull=None, value=None):
+        self.id = pin_id
+        self.mode = mode
+        self._value = 1 if value is None else value
+        self.handler = None
+        self.trigger = 0
+        _pins[pin_id] = self
+
+    def init(self, mode=None, pull=None, value=None):
+        if value is not None:
+            self.value(value)
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        v = 1 if v else 0
+        if v != self._value:
+            self._value = v
+            for listener in pin_listeners:
+                listener(self, v)
+
+    __call__ = value
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger=0, **kw):
+        self.handler = handler
+        self.trigger = trigger
+
+    def fire(self):
+        """Host helper: invoke the IRQ handler as the hardware would"""
+        if self.handler:
+            self.handler(self)
+
+
+class SPI:
+    def __init__(self, bus_id, baudrate=1000000, **kw):
+        self.id = bus_id
+        self.baudrate = baudrate
+        self.inits = 0
+        # Bytes returned by read()/readinto(), consumed in order
+        self.rx = bytearray()
+
+    def init(self, baudrate=None, **kw):
+        self.inits += 1
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, data):
+        for listener in spi_listeners:
+            listener(self, data)
+
+    def read(self, n, write=0):
+        out = bytes(self.rx[:n]).ljust(n, b"\x00")
+        del self.rx[:n]
+        return out
+
+    def readinto(self, buf, write=0):
+        buf[:] = self.read(len(buf))
+
+    def write_readinto(self, wbuf, rbuf):
+        self.write(wbuf)
+        self.readinto(rbuf)
+
+
+class I2C:
+    def __init__(self, *a, **kw):
+        pass
+
+    def scan(self):
+        return []
+
+
+class ADC:
+    ATTN_11DB = 3
+
+    def __init__(self, pin):
+        self.raw = 0
+
+    def atten(self, a):
+        pass
+
+    def read(self):
+        return self.raw
+
+
+class PWM:
+    def __init__(self, pin, freq=0, duty=0):
+        pass
+
+    def deinit(self):
+        pass
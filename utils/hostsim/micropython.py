@@ -0,0 +1,13 @@
+"""CPython stand-in for MicroPython's micropython module"""
+
+
+def const(x):
+    return x
+
+
+def schedule(func, arg):
+    func(arg)
+
+
+def alloc_emergency_exception_buf(size):
+    pass
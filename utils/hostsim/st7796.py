@@ -0,0 +1,223 @@
+"""
+ST7796S command-stream recorder for host-side display tests
+=============================================================
+Watches the display's CS/DC pins and SPI writes (via the machine
+stand-in), decodes CASET/RASET/RAMWR into a 480x320 RGB565 framebuffer
+and counts what each drawing call costs on the wire.
+"""
+
+import struct
+import time
+import zlib
+
+import machine
+
+RAMWR = 0x2C
+CASET = 0x2A
+RASET = 0x2B
+NORON = 0x13
+VSCRDEF = 0x33
+VSCRSADD = 0x37
+
+
+def install_time():
+    """Give CPython's time module the MicroPython extras display.py uses.
+    Sleeps become no-ops so benchmarks measure drawing, not delays."""
+    if not hasattr(time, "ticks_us"):
+        time.sleep_ms = lambda ms: None
+        time.sleep_us = lambda us: None
+        time.ticks_ms = lambda: time.perf_counter_ns() // 1000000
+        time.ticks_us = lambda: time.perf_counter_ns() // 1000
+        time.ticks_diff = lambda a, b: a - b
+        time.ticks_add = lambda a, b: a + b
+
+
+class Panel:
+    """Decoded ST7796S state plus traffic counters"""
+
+    def __init__(self, cs_pin=15, dc_pin=2, width=480, height=320):
+        self.cs_pin = cs_pin
+        self.dc_pin = dc_pin
+        self.width = width
+        self.height = height
+        self.fb = bytearray(width * height * 2)
+        self.win = [0, 0, width - 1, height - 1]
+        self.regs = {}
+        self._cmd = None
+        self._params = bytearray()
+        self._ptr = 0
+        self.reset_counters()
+        machine.pin_listeners.append(self._on_pin)
+        machine.spi_listeners.append(self._on_spi)
+
+    def reset_counters(self):
+        self.bytes = 0          # everything clocked out with CS low
+        self.pixel_bytes = 0    # RAMWR payload
+        self.windows = 0        # RAMWR commands
+        self.casets = 0
+        self.rasets = 0
+        self.commands = 0
+        self.cs_toggles = 0     # CS assertions
+
+    def counters(self):
+        return {"bytes": self.bytes, "pixel_bytes": self.pixel_bytes,
+                "windows": self.windows, "caset": self.casets,
+                "raset": self.rasets, "commands": self.commands,
+                "cs_toggles": self.cs_toggles}
+
+    def _pin_value(self, pin_id):
+        p = machine.pin(pin_id)
+        return 1 if p is None else p.value()
+
+    def _on_pin(self, pin, value):
+        if pin.id == self.cs_pin and value == 0:
+            self.cs_toggles += 1
+
+    def _on_spi(self, spi, data):
+        if self._pin_value(self.cs_pin):
+            return
+        data = bytes(data)
+        self.bytes += len(data)
+        if self._pin_value(self.dc_pin) == 0:
+            for c in data:
+                self._command(c)
+        else:
+            self._data(data)
+
+    def _command(self, c):
+        self._finish_params()
+        self.commands += 1
+        self._cmd = c
+        self._params = bytearray()
+        if c == RAMWR:
+            self.windows += 1
+            self._ptr = 0
+        elif c == NORON:
+            # Normal display mode ends vertical scrolling
+            self.regs.pop(VSCRDEF, None)
+            self.regs.pop(VSCRSADD, None)
+
+    def _finish_params(self):
+        c, p = self._cmd, self._params
+        if c is None or c == RAMWR:
+            return
+        if c == CASET and len(p) >= 4:
+            self.win[0], self.win[2] = struct.unpack(">HH", p[:4])
+            self.casets += 1
+        elif c == RASET and len(p) >= 4:
+            self.win[1], self.win[3] = struct.unpack(">HH", p[:4])
+            self.rasets += 1
+        else:
+            self.regs[c] = bytes(p)
+        self._params = bytearray()
+
+    def _data(self, data):
+        if self._cmd != RAMWR:
+            self._params += data
+            if self._cmd in (CASET, RASET) and len(self._params) >= 4:
+                self._finish_params()
+            return
+        self.pixel_bytes += len(data)
+        x0, y0, x1, y1 = self.win
+        ww = x1 - x0 + 1
+        npx = ww * (y1 - y0 + 1)
+        i = 0
+        n = len(data) // 2
+        while i < n and self._ptr < npx:
+            row, col = divmod(self._ptr, ww)
+            run = min(ww - col, n - i, npx - self._ptr)
+            x = x0 + col
+            y = y0 + row
+            if 0 <= y < self.height:
+                lo = max(x, 0)
+                hi = min(x + run, self.width)
+                if hi > lo:
+                    o = (y * self.width + lo) * 2
+                    s = (i + lo - x) * 2
+                    self.fb[o:o + (hi - lo) * 2] = data[s:s + (hi - lo) * 2]
+            i += run
+            self._ptr += run
+
+    def pixel(self, x, y):
+        o = (y * self.width + x) * 2
+        return (self.fb[o] << 8) | self.fb[o + 1]
+
+    def visible(self):
+        """Frame memory as shown on the glass. With MADCTL 0x28 the
+        controller's vertical scroll moves screen columns, so columns in
+        the scroll area are remapped by VSCRDEF/VSCRSADD."""
+        area = self.regs.get(VSCRDEF)
+        start = self.regs.get(VSCRSADD)
+        if not area or len(area) < 6 or not start:
+            return self.fb
+        tfa, vsa, _ = struct.unpack(">HHH", area[:6])
+        ssa = struct.unpack(">H", start[:2])[0]
+        if vsa == 0 or ssa < tfa or ssa >= tfa + vsa:
+            return self.fb
+        out = bytearray(self.fb)
+        for p in range(tfa, tfa + vsa):
+            line = tfa + (p - tfa + ssa - tfa) % vsa
+            for y in range(self.height):
+                o = (y * self.width + p) * 2
+                i = (y * self.width + line) * 2
+                out[o:o + 2] = self.fb[i:i + 2]
+        return out
+
+    def to_rgb(self):
+        out = bytearray(self.width * self.height * 3)
+        fb = self.visible()
+        for i in range(self.width * self.height):
+            c = (fb[i * 2] << 8) | fb[i * 2 + 1]
+            r = (c >> 11) & 0x1F
+            g = (c >> 5) & 0x3F
+            b = c & 0x1F
+            out[i * 3] = (r << 3) | (r >> 2)
+            out[i * 3 + 1] = (g << 2) | (g >> 4)
+            out[i * 3 + 2] = (b << 3) | (b >> 2)
+        return out
+
+    def save_png(self, path):
+        write_png(path, self.width, self.height, self.to_rgb())
+
+
+def _chunk(tag, data):
+    c = struct.pack(">I", len(data)) + tag + data
+    return c + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+
+def write_png(path, w, h, rgb):
+    """Write 8-bit RGB pixels as a PNG (filter 0 on every row)"""
+    raw = bytearray()
+    for y in range(h):
+        raw.append(0)
+        raw += rgb[y * w * 3:(y + 1) * w * 3]
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)))
+        f.write(_chunk(b"IDAT", zlib.compress(bytes(raw), 6)))
+        f.write(_chunk(b"IEND", b""))
+
+
+def read_png(path):
+    """Read a PNG written by write_png. Returns (w, h, rgb bytes)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 8
+    idat = b""
+    w = h = 0
+    while pos < len(data):
+        n, tag = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + n]
+        if tag == b"IHDR":
+            w, h = struct.unpack(">II", body[:8])
+        elif tag == b"IDAT":
+            idat += body
+        pos += 12 + n
+    raw = zlib.decompress(idat)
+    rgb = bytearray()
+    for y in range(h):
+        row = raw[y * (w * 3 + 1):(y + 1) * (w * 3 + 1)]
+        if row[0] != 0:
+            raise ValueError("%s: unsupported PNG filter %d" % (path, row[0]))
+        rgb += row[1:]
+    return w, h, bytes(rgb)
@@ -0,0 +1,122 @@
+"""
+Convert a boot logo to RLE565 (host-side, CPython)
+===================================================
+Input is either the raw logo format used by logo.bin (4-byte big-endian
+width/height header followed by RGB565 big-endian pixels) or any image
+Pillow can open (PNG, JPG, ...). Output is an RLE565 file for
+display.show_logo(); see rle565.py for the format.
+
+The output is decoded again with the same streaming decoder the board
+uses and compared byte-for-byte with the source pixels.
+
+Usage (from the repo root):
+    python utils/logo_convert.py logo.bin logo.rle
+    python utils/logo_convert.py logo.png logo.rle --size 320x320
+    python utils/logo_convert.py --check logo.bin logo.rle
+
+--check writes nothing: it decodes an existing logo.rle and compares it
+byte-for-byte with the raw logo it was made from.
+"""
+
+import argparse
+import io
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rle565  # noqa: E402
+
+
+def load_raw(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < 4:
+        raise ValueError("%s is too short for a raw logo (%d bytes)" % (path, len(data)))
+    w, h = struct.unpack(">HH", data[:4])
+    pixels = data[4:]
+    if len(pixels) != w * h * 2:
+        raise ValueError("%s: header says %dx%d but has %d pixel bytes" % (
+            path, w, h, len(pixels)))
+    return w, h, pixels
+
+
+def load_image(path, size=None):
+    try:
+        from PIL import Image
+    except ImportError:
+        raise SystemExit("Pillow is needed to read %s (pip install pillow)" % path)
+    img = Image.open(path).convert("RGB")
+    if size:
+        img = img.resize(size)
+    w, h = img.size
+    out = bytearray()
+    for r, g, b in img.getdata():
+        c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        out.append(c >> 8)
+        out.append(c & 0xFF)
+    return w, h, bytes(out)
+
+
+def decode(data):
+    """Decode an RLE565 image with the board's streaming decoder"""
+    w, h, dec = rle565.open_image(io.BytesIO(data))
+    out = bytearray()
+    buf = bytearray(2560)
+    while True:
+        n = dec.readinto(buf)
+        if not n:
+            break
+        out += buf[:n]
+    return w, h, bytes(out)
+
+
+def check(raw_path, rle_path):
+    """Round-trip an existing RLE565 file against its raw source"""
+    w, h, pixels = load_raw(raw_path)
+    with open(rle_path, "rb") as f:
+        data = f.read()
+    dw, dh, dpix = decode(data)
+    if (dw, dh) != (w, h):
+        print("%s: %dx%d, %s is %dx%d" % (rle_path, dw, dh, raw_path, w, h))
+        return 1
+    if dpix != pixels:
+        bad = next(i for i in range(len(pixels)) if dpix[i:i + 1] != pixels[i:i + 1])
+        print("%s: pixel bytes differ from %s at offset %d" % (rle_path, raw_path, bad))
+        return 1
+    print("%s: %dx%d, %d bytes, matches %s byte-for-byte" % (
+        rle_path, w, h, len(data), raw_path))
+    return 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("src", help="raw logo (.bin) or image file")
+    ap.add_argument("dst", help="output RLE565 file")
+    ap.add_argument("--size", help="resize image input, e.g. 320x320")
+    ap.add_argument("--check", action="store_true",
+                    help="verify dst against raw src instead of writing it")
+    args = ap.parse_args()
+
+    if args.check:
+        return check(args.src, args.dst)
+
+    if args.src.lower().endswith(".bin"):
+        w, h, pixels = load_raw(args.src)
+    else:
+        size = tuple(int(v) for v in args.size.split("x")) if args.size else None
+        w, h, pixels = load_image(args.src, size)
+
+    data = rle565.encode(pixels, w, h)
+    if decode(data) != (w, h, pixels):
+        raise SystemExit("round-trip mismatch, not writing %s" % args.dst)
+    with open(args.dst, "wb") as f:
+        f.write(data)
+    print("%s: %dx%d, %d -> %d bytes (%.1f%%), round-trip OK" % (
+        args.dst, w, h, len(pixels) + 4, len(data), 100.0 * len(data) / (len(pixels) + 4)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Touch gesture replay (CPython, no board needed)
+================================================
+Feeds raw XPT2046 traces from utils/touch_traces.txt through the real
+touch.py sampling path (median, calibration, debounce) and gesture.py,
+using the machine stand-in in utils/hostsim. Each poll advances a fake
+clock by touch.POLL_MS, so timing thresholds behave as on the board.
+
+Usage (from the repo root):
+    python utils/replay_gestures.py            # replay all, check expected gestures
+    python utils/replay_gestures.py -v         # also print every event
+
+To capture a trace on the board, copy this file over and run:
+    from utils.replay_gestures import record
+    record("my_swipe")
+then paste the printed lines into touch_traces.txt.
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TRACES = os.path.join(HERE, "touch_traces.txt")
+
+
+def load(path=TRACES):
+    """[(name, expected_names, polls)]; a poll is a list of raw values or None"""
+    traces = []
+    cur = None
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("trace "):
+                parts = line.split()
+                cur = (parts[1], parts[2:], [])
+            elif line == "end":
+                traces.append(cur)
+                cur = None
+            elif line == "-":
+                cur[2].append(None)
+            else:
+                cur[2].append([int(v) for v in line.split()])
+    return traces
+
+
+def replay(traces, verbose=False):
+    sys.path.insert(0, os.path.join(HERE, "hostsim"))
+    sys.path.insert(1, os.path.dirname(HERE))
+    import st7796
+    st7796.install_time()
+    import display
+    import gesture
+    import touch
+
+    clock = [0]
+    time.ticks_ms = lambda: clock[0]
+    spi = display.spi
+    # Count samples scheduled from PENIRQ: at most one per pen-down edge
+    scheduled = [0]
+    schedule = touch.micropython.schedule
+
+    def counted(func, arg):
+        scheduled[0] += 1
+        schedule(func, arg)
+    touch.micropython.schedule = counted
+    touch.start()
+    # A tap must be reported by the first poll at or after TAP_MS, or
+    # at release if the pen lifts sooner
+    tap_polls = -(-gesture.Recognizer.TAP_MS // touch.POLL_MS)
+
+    def tap_deadline(polls, pressed):
+        up = pressed + 1
+        while up < len(polls) and polls[up] is not None:
+            up += 1
+        if up <= pressed + tap_polls:
+            return up + touch.RELEASE_POLLS - 1
+        return pressed + tap_polls
+    failures = 0
+    for name, expected, polls in traces:
+        got = []
+        late = []
+        pressed = None
+        scheduled[0] = 0
+        edges = 0
+        for i, values in enumerate(polls):
+            if values is not None and (i == 0 or polls[i - 1] is None):
+                edges += 1
+            clock[0] += touch.POLL_MS
+            if values is None:
+                touch.T_IRQ._value = 1
+            else:
+                touch.T_IRQ._value = 0
+                for v in values:
+                    spi.rx += bytes(((v << 3) >> 8, (v << 3) & 0xFF))
+            # PENIRQ only falls with the pen down; touch.py must ignore
+            # the edges it sees while it still considers the pen down
+            if values is not None and not touch.active():
+                touch.T_IRQ.fire()
+            else:
+                touch.poll()
+            ev = touch.get()
+            while ev:
+                if ev[0] == touch.PRESS:
+                    pressed = i
+                elif ev[0] == gesture.TAP and i > tap_deadline(polls, pressed):
+                    late.append((i - pressed) * touch.POLL_MS)
+                if ev[0] in gesture.NAMES:
+                    got.append(gesture.NAMES[ev[0]])
+                    if verbose:
+                        print("  %-12s at poll %2d  (%d,%d)" % (
+                            gesture.NAMES[ev[0]], i + 1, ev[1], ev[2]))
+                elif verbose:
+                    print("  %-12s at poll %2d  (%d,%d)" % (
+                        "press" if ev[0] == touch.PRESS else "release",
+                        i + 1, ev[1], ev[2]))
+                ev = touch.get()
+        del spi.rx[:]
+        ok = got == expected and scheduled[0] <= edges and not late
+        failures += not ok
+        note = ""
+        if scheduled[0] > edges:
+            note += "  (%d IRQ samples for %d pen-downs)" % (scheduled[0], edges)
+        if late:
+            note += "  (tap %d ms after press)" % late[0]
+        print("%-18s %-4s %s%s" % (name, "ok" if ok else "FAIL",
+                                   " ".join(got) or "-", note))
+    print("%d/%d traces ok" % (len(traces) - failures, len(traces)))
+    return failures
+
+
+def record(name, polls=60):
+    """On the board: print one trace of raw XPT2046 polls for touch_traces.txt"""
+    import touch
+    spi = touch.display.spi
+    print("trace", name)
+    for _ in range(polls):
+        if touch.T_IRQ.value() != 0:
+            print("-")
+        else:
+            vals = []
+            with touch._dev:
+                for _ in range(touch._N):
+                    for c in (touch._CMD_X, touch._CMD_Y):
+                        spi.write(c)
+                        spi.readinto(touch._raw)
+                        vals.append(((touch._raw[0] << 8) | touch._raw[1]) >> 3)
+            print(" ".join(str(v) for v in vals))
+        time.sleep_ms(touch.POLL_MS)
+    print("end")
+
+
+if __name__ == "__main__":
+    sys.exit(1 if replay(load(), "-v" in sys.argv) else 0)
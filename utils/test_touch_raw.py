@@ -9,6 +9,7 @@ import display
 
 T_CS  = Pin(33, Pin.OUT, value=1)
 T_IRQ = Pin(36, Pin.IN)
+_dev = display.bus.device(T_CS, 2000000)
 
 
 def raw_read():
@@ -16,19 +17,13 @@ def raw_read():
     if T_IRQ.value() != 0:
         return None
 
-    display.spi.init(baudrate=2000000)
-    display.cs.value(1)
-
     vals = []
-    for cmd in [0x90, 0xD0]:
-        T_CS.value(0)
-        display.spi.write(bytes([cmd]))
-        raw = display.spi.read(2)
-        v = ((raw[0] << 8) | raw[1]) >> 3
-        T_CS.value(1)
-        vals.append(v)
-
-    display.spi.init(baudrate=20000000)
+    with _dev:
+        for cmd in [0x90, 0xD0]:
+            display.spi.write(bytes([cmd]))
+            raw = display.spi.read(2)
+            v = ((raw[0] << 8) | raw[1]) >> 3
+            vals.append(v)
 
     if vals[0] < 100 or vals[1] < 100:
         return None
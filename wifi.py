@@ -1,6 +1,7 @@
 """WiFi connection manager for ESP32"""
 import network
 import time
+import uasyncio as asyncio
 
 wlan = network.WLAN(network.STA_IF)
 
@@ -41,6 +42,73 @@ def connect_multi(networks, timeout=15):
     return "No network", False
 
 
+# Background connect state for begin()/poll()
+_queue = []
+_pending = False
+_deadline = 0
+_timeout = 15
+
+
+def _try_next():
+    global _deadline
+    ssid, pw = _queue.pop(0)
+    print("Trying WiFi:", ssid)
+    wlan.connect(ssid, pw)
+    _deadline = time.ticks_add(time.ticks_ms(), _timeout * 1000)
+
+
+def begin(networks, timeout=15):
+    """Start connect_multi() without blocking. The radio associates in
+    the background; call poll() now and then until it returns a result."""
+    global _queue, _pending, _deadline, _timeout
+    wlan.active(True)
+    _queue = list(networks)
+    _timeout = timeout
+    _pending = True
+    _deadline = 0
+    if not wlan.isconnected() and _queue:
+        _try_next()
+
+
+def poll():
+    """Advance a begin() connect. Returns None while still trying, then
+    (ip_address, True) or (error_msg, False) like connect_multi()."""
+    global _pending
+    if wlan.isconnected():
+        ip = wlan.ifconfig()[0]
+        if _pending:
+            _pending = False
+            print("Connected:", ip)
+        return ip, True
+    if not _pending:
+        return "No network", False
+    if _deadline and time.ticks_diff(_deadline, time.ticks_ms()) > 0:
+        return None
+    if _deadline:
+        print("WiFi timeout, status:", wlan.status())
+        wlan.disconnect()
+    if _queue:
+        _try_next()
+        return None
+    _pending = False
+    return "No network", False
+
+
+async def connect_multi_async(networks, timeout=15):
+    """connect_multi() for uasyncio: same result, yields while associating"""
+    begin(networks, timeout)
+    while True:
+        result = poll()
+        if result is not None:
+            return result
+        await asyncio.sleep_ms(250)
+
+
+def pending():
+    """True while a begin() connect is still in progress"""
+    return _pending
+
+
 def is_connected():
     return wlan.active() and wlan.isconnected()
 